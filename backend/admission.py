@@ -0,0 +1,134 @@
+"""
+Admission control for expensive endpoints: per-client token buckets plus a
+global cap on concurrent calls.
+
+Each client key (a user or an IP address) has a bucket of `burst` tokens that
+refills at `per_minute`; a call takes one token. A call is refused straight
+away, before any work is done, when its client's bucket is empty or when
+`max_concurrent` calls are already running, and the caller answers 429 with
+the returned Retry-After.
+
+Optional work attached to an admitted call (speech synthesis for AI answers)
+has its own smaller budget and is shed first: once more than `shed_optional_at`
+calls are running, or every optional slot is taken, callers skip it and answer
+without it rather than refusing the whole call.
+
+Buckets live in a BucketStore. MemoryBucketStore keeps them in this process, so
+with several workers each enforces its own share; a Redis store (one Lua script
+doing the refill-and-take atomically) implements the same method to share
+buckets between workers and hosts. The concurrency budget is always per process.
+"""
+import abc
+import math
+import os
+import threading
+import time
+from typing import NamedTuple
+
+BUSY_RETRY_AFTER_S = 1.0
+MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "50000"))
+
+
+class Limit(NamedTuple):
+    per_minute: float
+    burst: int
+
+
+class Rejected(Exception):
+    """The call was not admitted; retry_after is in whole seconds, for the Retry-After header."""
+
+    def __init__(self, retry_after: float, reason: str):
+        super().__init__(reason)
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.reason = reason
+
+
+class BucketStore(abc.ABC):
+    """Token buckets keyed by client."""
+
+    @abc.abstractmethod
+    async def take(self, key: str, limit: Limit, cost: float = 1.0) -> float:
+        """
+        Take `cost` tokens from `key`'s bucket. Returns 0 if they were taken, otherwise
+        the seconds until they will be available (and takes nothing).
+        """
+
+
+class MemoryBucketStore(BucketStore):
+    """Buckets in a dict, pruned of full (idle) buckets once it holds `max_keys`."""
+
+    def __init__(self, max_keys: int = MAX_KEYS, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets = {}  # key -> [tokens, updated_at, limit]
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, limit: Limit, cost: float = 1.0) -> float:
+        rate = limit.per_minute / 60
+        with self._lock:
+            now = self.clock()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._prune(now)
+                bucket = self._buckets[key] = [float(limit.burst), now, limit]
+            else:
+                bucket[0] = min(limit.burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+                bucket[2] = limit
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return 0.0
+            return (cost - bucket[0]) / rate if rate > 0 else math.inf
+
+    def _prune(self, now: float):
+        # A bucket that has refilled completely is the same as no bucket
+        for key, (tokens, updated_at, limit) in list(self._buckets.items()):
+            if tokens + (now - updated_at) * limit.per_minute / 60 >= limit.burst:
+                del self._buckets[key]
+
+
+class Admission:
+    """Admits or refuses calls; acquire/release and the optional-work methods run on the event loop."""
+
+    def __init__(self, store: BucketStore = None, max_concurrent: int = 8,
+                 max_optional: int = 1, shed_optional_at: int = None):
+        self.store = store or MemoryBucketStore()
+        self.max_concurrent = max_concurrent
+        self.max_optional = max_optional
+        self.shed_optional_at = max_concurrent // 2 if shed_optional_at is None else shed_optional_at
+        self.in_flight = 0
+        self.optional_in_flight = 0
+        self.rejected = {"busy": 0, "rate": 0}
+        self.shed = 0
+
+    async def acquire(self, key: str, limit: Limit):
+        """Admit one call for `key` or raise Rejected; an admitted call must be release()d."""
+        if self.in_flight >= self.max_concurrent:
+            self.rejected["busy"] += 1
+            raise Rejected(BUSY_RETRY_AFTER_S, "busy")
+        # Counted before the (possibly remote) bucket check so concurrent arrivals cannot overshoot
+        self.in_flight += 1
+        try:
+            wait = await self.store.take(key, limit)
+        except BaseException:
+            self.in_flight -= 1
+            raise
+        if wait:
+            self.in_flight -= 1
+            self.rejected["rate"] += 1
+            raise Rejected(wait, "rate")
+
+    def release(self):
+        self.in_flight -= 1
+
+    def try_optional(self) -> bool:
+        """Claim a slot for optional work unless load is high; pair with end_optional()."""
+        if self.in_flight > self.shed_optional_at or self.optional_in_flight >= self.max_optional:
+            self.shed += 1
+            return False
+        self.optional_in_flight += 1
+        return True
+
+    def end_optional(self):
+        self.optional_in_flight -= 1
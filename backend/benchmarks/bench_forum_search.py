@@ -0,0 +1,146 @@
+"""
+Forum search over a synthetic corpus (default 1,000,000 posts plus comments).
+
+Posts are generated from a Zipf-distributed vocabulary mixed with pet-care words,
+inserted without the index, then indexed in one rebuild (what ensure_index does
+on first start). Reports build time, the per-row cost of the insert triggers,
+query latency for rare/common/multi-term queries on the first page and ten
+pages deep via the cursor, and a LIKE scan for comparison.
+
+    python benchmarks/bench_forum_search.py [--posts 1000000] [--repeat 20]
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+
+import main  # noqa: E402
+import forum_search  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+TOPIC_WORDS = (
+    "dog cat puppy kitten walk walking vet vaccine rabies food diet allergy itch limp "
+    "surgery crutch harness leash training bark litter groom flea tick worm shelter adopt"
+).split()
+QUERIES = {
+    "rare term": "xeriqu",
+    "common term": "dog",
+    "two terms": "puppy vaccine",
+    "three terms": "cat allergy diet",
+}
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def _vocabulary(rng, size=20000):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = {"".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(size)}
+    words = sorted(words) + TOPIC_WORDS * 40
+    rng.shuffle(words)
+    weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+    return words, weights
+
+
+def seed(posts: int, chunk: int = 50000):
+    rng = random.Random(3)
+    words, weights = _vocabulary(rng)
+    now = datetime.utcnow()
+    main.Base.metadata.create_all(bind=main.engine)
+    with main.engine.begin() as conn:
+        for name in ("post_ai", "post_ad", "post_au", "comment_ai", "comment_ad", "comment_au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {forum_search.TABLE}_{name}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {forum_search.TABLE}"))
+        user_id = conn.execute(main.insert(main.User).values(
+            email="forum@example.com", name="Forum", hashed_password="x",
+        )).inserted_primary_key[0]
+        # A handful of posts carry a term no other document has
+        rare = set(rng.sample(range(posts), 5))
+        for start in range(0, posts, chunk):
+            rows = []
+            for i in range(start, min(posts, start + chunk)):
+                body = rng.choices(words, cum_weights=weights, k=rng.randint(20, 60))
+                if i in rare:
+                    body.append("xeriqu")
+                rows.append({
+                    "user_id": user_id, "title": " ".join(rng.choices(words, cum_weights=weights, k=6)),
+                    "content": " ".join(body), "created_at": now,
+                })
+            conn.execute(main.insert(main.CommunityPost), rows)
+        conn.execute(main.insert(main.Comment), [{
+            "post_id": rng.randint(1, posts), "user_id": user_id, "created_at": now,
+            "content": " ".join(rng.choices(words, cum_weights=weights, k=rng.randint(5, 25))),
+        } for _ in range(posts // 5)])
+
+
+def time_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def deep_page(conn, q, pages):
+    cursor = None
+    for _ in range(pages):
+        _, cursor = forum_search.search(conn, q, 20, cursor)
+        if cursor is None:
+            break
+    return cursor
+
+
+def run(posts: int, repeat: int):
+    start = time.perf_counter()
+    seed(posts)
+    print(f"seeded {posts} posts and {posts // 5} comments in {time.perf_counter() - start:.1f} s")
+
+    start = time.perf_counter()
+    forum_search.ensure_index(main.engine)
+    print(f"index build     {time.perf_counter() - start:8.1f} s")
+
+    with main.engine.begin() as conn:
+        plain = [{"user_id": 1, "title": "Limping after a walk", "content": "My dog started limping today"}] * 2000
+        start = time.perf_counter()
+        conn.execute(main.insert(main.CommunityPost), plain)
+        per_row = (time.perf_counter() - start) * 1000 / len(plain)
+        print(f"insert + trigger {per_row * 1000:7.1f} us/post")
+
+    with main.engine.connect() as conn:
+        for label, q in QUERIES.items():
+            matches = conn.execute(
+                text(f"SELECT count(*) FROM {forum_search.TABLE} WHERE {forum_search.TABLE} MATCH :m"),
+                {"m": " ".join(f'"{t}"' for t in forum_search.query_terms(q))},
+            ).scalar()
+            first = _percentiles(time_ms(lambda: forum_search.search(conn, q, 20), repeat))
+            deep = _percentiles(time_ms(lambda: deep_page(conn, q, 10), max(1, repeat // 5)))
+            print(f"{label:<12} {matches:>8} hits   page 1 p50 {first[50]:8.2f} ms  p95 {first[95]:8.2f} ms   "
+                  f"10 pages p50 {deep[50]:8.2f} ms")
+
+        like = time_ms(lambda: conn.execute(text(
+            "SELECT id FROM community_posts WHERE content LIKE '%xeriqu%' OR title LIKE '%xeriqu%' LIMIT 20"
+        )).all(), 3)
+        print(f"LIKE scan (rare term, for comparison) p50 {_percentiles(like)[50]:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.posts, args.repeat)
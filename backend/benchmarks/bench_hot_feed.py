@@ -0,0 +1,114 @@
+"""
+Hot feed top-N: indexed score versus scoring every post per request.
+
+Seeds a synthetic feed (default 200,000 posts spread over a year with skewed
+like/comment counts), then compares
+
+  indexed    GET /api/community/posts?sort=hot&limit=N query, an index range scan
+  naive      load every post's counters, score them in Python and sort
+
+and the cost of one like, which now also rewrites the post's score.
+
+    python benchmarks/bench_hot_feed.py [--posts 200000] [--limit 50] [--repeat 50]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+
+import main  # noqa: E402
+import feed_ranking  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def seed(posts: int, chunk: int = 20000):
+    rng = random.Random(5)
+    now = datetime.utcnow()
+    main.Base.metadata.create_all(bind=main.engine)
+    with main.engine.begin() as conn:
+        user_id = conn.execute(main.insert(main.User).values(
+            email="hot@example.com", name="Hot", hashed_password="x",
+        )).inserted_primary_key[0]
+        for start in range(0, posts, chunk):
+            rows = []
+            for _ in range(min(chunk, posts - start)):
+                created_at = now - timedelta(seconds=rng.randint(0, 365 * 86400))
+                likes, comments = int(rng.paretovariate(1.2)) - 1, int(rng.paretovariate(1.5)) - 1
+                rows.append({
+                    "user_id": user_id, "title": "Post", "content": "Body", "created_at": created_at,
+                    "like_count": likes, "comment_count": comments,
+                    "hot_score": feed_ranking.hot_score(likes, comments, created_at),
+                })
+            conn.execute(main.insert(main.CommunityPost), rows)
+    return user_id
+
+
+def time_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run(posts: int, limit: int, repeat: int):
+    user_id = seed(posts)
+    posts_table = main.CommunityPost.__table__
+    print(f"{posts} posts, top {limit}")
+
+    def indexed(conn):
+        return conn.execute(
+            select(posts_table.c.id).order_by(posts_table.c.hot_score.desc(), posts_table.c.id.desc()).limit(limit)
+        ).scalars().all()
+
+    def naive(conn):
+        rows = conn.execute(select(
+            posts_table.c.id, posts_table.c.like_count, posts_table.c.comment_count, posts_table.c.created_at,
+        )).all()
+        rows.sort(key=lambda row: (feed_ranking.hot_score(row[1], row[2], row[3]), row[0]), reverse=True)
+        return [row[0] for row in rows[:limit]]
+
+    with main.engine.connect() as conn:
+        assert indexed(conn) == naive(conn), "index order differs from scoring every post"
+        for label, fn, count in (("indexed", indexed, repeat), ("naive", naive, max(1, repeat // 10))):
+            p = _percentiles(time_ms(lambda: fn(conn), count))
+            print(f"{label:<8} p50 {p[50]:9.2f} ms   p95 {p[95]:9.2f} ms   p99 {p[99]:9.2f} ms")
+
+    db = main.SessionLocal()
+    try:
+        post_ids = random.Random(6).sample(range(1, posts + 1), repeat)
+        samples = []
+        for post_id in post_ids:
+            start = time.perf_counter()
+            main._set_like(db, post_id, user_id, True)
+            samples.append((time.perf_counter() - start) * 1000)
+        p = _percentiles(samples)
+        print(f"like + rescore p50 {p[50]:7.2f} ms   p95 {p[95]:7.2f} ms")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run(args.posts, args.limit, args.repeat)
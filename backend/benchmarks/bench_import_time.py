@@ -0,0 +1,77 @@
+"""
+Cold import time of the API module, from `python -X importtime`.
+
+Imports main in a fresh interpreter --runs times and reports the median total
+and the slowest modules it pulled in. Doubles as a regression check: exits 1
+if any module in LAZY is loaded at import time (those belong behind first use:
+gemini, speech, google_identity, VetDiscovery.client, image thumbnails) or if
+the median exceeds --budget-ms.
+
+    python benchmarks/bench_import_time.py [--runs 5] [--top 15] [--budget-ms 0]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY = ("google.generativeai", "pyttsx3", "google.oauth2", "google.auth.transport.requests", "requests", "httpx", "PIL")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_once(module: str = "main"):
+    """{name: (cumulative_us, depth)} for everything `import module` loaded, and its total in microseconds."""
+    tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}", VET_DISCOVERY_PROVIDERS="")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            entries.append((match.group(4), int(match.group(2)), (len(match.group(3)) - 1) // 2))
+    # The interpreter's own startup imports come first at depth 0; keep what `module` pulled in
+    end = max(i for i, (name, _, depth) in enumerate(entries) if name == module and depth == 0)
+    start = end
+    while start > 0 and entries[start - 1][2] > 0:
+        start -= 1
+    loaded = {name: (cumulative, depth) for name, cumulative, depth in entries[start:end]}
+    return loaded, entries[end][1]
+
+
+def run(runs: int, top: int, budget_ms: float) -> int:
+    totals, loaded = [], {}
+    for _ in range(runs):
+        loaded, total = import_once()
+        totals.append(total / 1000)
+    median = statistics.median(totals)
+    print(f"import main: median {median:8.1f} ms   min {min(totals):8.1f} ms   max {max(totals):8.1f} ms   ({runs} runs)")
+
+    print("\nslowest direct imports (last run)")
+    direct = sorted(((us, name) for name, (us, depth) in loaded.items() if depth == 1), reverse=True)
+    for us, name in direct[:top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failures = [name for name in LAZY if name in loaded]
+    for name in failures:
+        print(f"FAIL  {name} is imported at startup ({loaded[name][0] / 1000:.1f} ms); load it on first use")
+    if budget_ms and median > budget_ms:
+        print(f"FAIL  median {median:.1f} ms is over the {budget_ms:.0f} ms budget")
+        failures.append("budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=0, help="fail if the median import exceeds this")
+    args = parser.parse_args()
+    sys.exit(run(args.runs, args.top, args.budget_ms))
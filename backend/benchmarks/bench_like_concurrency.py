@@ -0,0 +1,142 @@
+"""
+Concurrent like set/unset/toggle against a live server.
+
+Starts the app under uvicorn (in a separate process, so the client does not
+share its GIL) on a free local port, creates one post and a set
+of users, then fires batches of parallel requests (1,000 by default):
+
+  double-tap   every user sends PUT /like several times at once -> one like each
+  unlike       the same with DELETE /like                       -> no likes
+  toggle       random POST (toggle), PUT and DELETE calls       -> any end state
+
+After each batch it checks that no (post_id, user_id) pair is stored twice and
+that community_posts.like_count equals COUNT(*) over likes, and reports request
+latency percentiles and throughput.
+
+    python benchmarks/bench_like_concurrency.py [--requests 1000] [--users 100]
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+
+import httpx  # noqa: E402
+import main  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    # Queued requests can leave a client connection idle longer than the default 5 s keep-alive
+    server = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+        "--log-level", "warning", "--timeout-keep-alive", "120",
+    ], env=os.environ.copy())
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/stats/user-count").status_code == 200:
+                return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("server did not start")
+
+
+def seed(users: int):
+    with main.engine.begin() as conn:
+        emails = [f"liker{i}@example.com" for i in range(users)]
+        conn.execute(main.insert(main.User), [{"email": email, "name": email, "hashed_password": "x"} for email in emails])
+        author = conn.execute(select(main.User.id).where(main.User.email == emails[0])).scalar()
+        post_id = conn.execute(main.insert(main.CommunityPost).values(
+            user_id=author, title="Concurrency", content="Tap the heart",
+        )).inserted_primary_key[0]
+    return post_id, [{"Authorization": f"Bearer {main.create_access_token({'sub': email})}"} for email in emails]
+
+
+def check(post_id: int):
+    with main.engine.connect() as conn:
+        stored = conn.execute(select(func.count()).select_from(main.Like).where(main.Like.post_id == post_id)).scalar()
+        distinct = conn.execute(
+            select(func.count(func.distinct(main.Like.user_id))).where(main.Like.post_id == post_id)
+        ).scalar()
+        counter = conn.execute(select(main.CommunityPost.like_count).where(main.CommunityPost.id == post_id)).scalar()
+    assert stored == distinct, f"duplicate likes: {stored} rows for {distinct} users"
+    assert counter == stored, f"like_count {counter} != {stored} likes"
+    return stored
+
+
+async def fire(base_url, calls):
+    latencies, failures = [], 0
+    limits = httpx.Limits(max_connections=200, max_keepalive_connections=200)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def one(method, path, headers):
+            nonlocal failures
+            start = time.perf_counter()
+            response = await client.request(method, path, headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                failures += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(*call) for call in calls))
+        elapsed = time.perf_counter() - start
+    return latencies, failures, elapsed
+
+
+def run(requests: int, users: int):
+    rng = random.Random(9)
+    port = _free_port()
+    server = start_server(port)  # also creates the schema in the temporary database
+    post_id, headers = seed(users)
+    path = f"/api/community/posts/{post_id}/like"
+    scenarios = (
+        ("double-tap", [("PUT", path, headers[i % users]) for i in range(requests)], users),
+        ("unlike", [("DELETE", path, headers[i % users]) for i in range(requests)], 0),
+        ("toggle", [(rng.choice(("POST", "PUT", "DELETE")), path, rng.choice(headers)) for _ in range(requests)], None),
+    )
+    print(f"{requests} parallel requests per batch, {users} users, one post")
+    try:
+        for label, calls, expected in scenarios:
+            rng.shuffle(calls)
+            latencies, failures, elapsed = asyncio.run(fire(f"http://127.0.0.1:{port}", calls))
+            likes = check(post_id)
+            if expected is not None:
+                assert likes == expected, f"{label}: {likes} likes, expected {expected}"
+            p = _percentiles(latencies)
+            print(f"{label:<11} {likes:4d} likes   {failures} failed   {len(calls) / elapsed:7.0f} req/s   "
+                  f"p50 {p[50]:7.1f} ms   p95 {p[95]:7.1f} ms   p99 {p[99]:7.1f} ms   consistent")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=100)
+    args = parser.parse_args()
+    run(args.requests, args.users)
@@ -0,0 +1,81 @@
+"""
+Walker / crutch volunteer search over a large synthetic provider table.
+
+    python benchmarks/bench_provider_search.py [--providers 50000] [--requests 200]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+import main  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+CATEGORIES = ["Dogs", "Cats", "Birds", "Rabbits", "Fish"]
+
+QUERIES = {
+    "species=Dogs": "species=Dogs",
+    "species=Cats&rating>=4.5": "species=Cats&min_rating=4.5",
+    "price 200-400, by price": "min_rate=200&max_rate=400&sort=price",
+    "Dogs+Birds, page 5": "species=Dogs&species=Birds&offset=80",
+    "Dogs, free at time": "species=Dogs&available_at=2030-01-01T10:00:00",
+}
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def seed(providers: int):
+    rng = random.Random(42)
+    rows = []
+    for i in range(providers):
+        cats = ",".join(rng.sample(CATEGORIES, rng.randint(1, 3)))
+        rows.append({
+            "name": f"Walker {i}", "bio": None, "rate_per_hour": float(rng.randrange(150, 800, 10)),
+            "rating": round(rng.uniform(3.0, 5.0), 1), "categories": cats, "is_active": rng.random() > 0.05,
+        })
+    with main.engine.begin() as conn:
+        conn.execute(main.insert(main.Walker), rows)
+        conn.exec_driver_sql("ANALYZE")
+
+
+def run(providers: int, requests: int):
+    with TestClient(main.app) as client:
+        seed(providers)
+        print(f"{providers} walkers, {requests} requests per query")
+        for label, params in QUERIES.items():
+            samples = []
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = client.get(f"/api/walkers/search?{params}")
+                samples.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+            p = _percentiles(samples)
+            print(f"{label:<28} mean {statistics.mean(samples):7.2f} ms   p50 {p[50]:7.2f}   p95 {p[95]:7.2f}   p99 {p[99]:7.2f}")
+
+        samples = []
+        for _ in range(max(1, requests // 10)):
+            start = time.perf_counter()
+            client.get("/api/walkers")
+            samples.append((time.perf_counter() - start) * 1000)
+        print(f"{'GET /api/walkers (all)':<28} mean {statistics.mean(samples):7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--providers", type=int, default=50000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    run(args.providers, args.requests)
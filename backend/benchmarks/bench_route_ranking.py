@@ -0,0 +1,139 @@
+"""
+Route-aware vet ranking on a synthetic road graph.
+
+Writes an OSM XML grid city split by a river with two bridges, checks the ALT
+bidirectional A* distances against plain Dijkstra, times cold and LRU-warm
+queries, then searches through the API with vets placed across the river so
+straight-line and road ordering disagree.
+
+    python benchmarks/bench_route_ranking.py [--size 120] [--queries 200]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+ORIGIN = (28.55, 77.15)
+STEP_DEG = 0.001  # ~110 m blocks
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def _report(label, samples):
+    p = _percentiles(samples)
+    print(f"{label:<24} mean {statistics.mean(samples):7.2f} ms   p50 {p[50]:7.2f}   p95 {p[95]:7.2f}   p99 {p[99]:7.2f}")
+
+
+def write_grid_osm(path: str, size: int):
+    """size x size grid; the river runs between columns size/2-1 and size/2, bridged at two rows."""
+    river = size // 2
+    bridges = {size // 8, size - size // 8}
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<osm version="0.6">\n')
+        for r in range(size):
+            for c in range(size):
+                f.write(f'<node id="{r * size + c + 1}" lat="{ORIGIN[0] + r * STEP_DEG:.6f}" '
+                        f'lon="{ORIGIN[1] + c * STEP_DEG:.6f}"/>\n')
+        way_id = 1
+
+        def way(refs, highway="residential"):
+            nonlocal way_id
+            nds = "".join(f'<nd ref="{ref}"/>' for ref in refs)
+            f.write(f'<way id="{way_id}">{nds}<tag k="highway" v="{highway}"/></way>\n')
+            way_id += 1
+
+        for r in range(size):
+            west = [r * size + c + 1 for c in range(river)]
+            east = [r * size + c + 1 for c in range(river, size)]
+            way(west)
+            way(east)
+            if r in bridges:
+                way([r * size + river, r * size + river + 1], "primary")
+        for c in range(size):
+            way([r * size + c + 1 for r in range(size)])
+        f.write("</osm>\n")
+    return river, sorted(bridges)
+
+
+def run(size: int, queries: int):
+    _tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+    osm_path = os.path.join(_tmp, "city.osm")
+    river, bridges = write_grid_osm(osm_path, size)
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+    os.environ["ROAD_GRAPH_PATH"] = osm_path
+    os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+
+    import road_graph  # noqa: E402
+
+    start = time.perf_counter()
+    graph = road_graph.RoadGraph.load(osm_path)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    road_graph.RoadGraph.load(osm_path)
+    reload_s = time.perf_counter() - start
+    print(f"graph: {graph.node_count} nodes, {len(graph.landmark_from)} landmarks")
+    print(f"parse + landmarks {build_s:6.2f} s   reload from pickle {reload_s:6.2f} s")
+
+    rng = random.Random(3)
+    pairs = [(rng.randrange(graph.node_count), rng.randrange(graph.node_count)) for _ in range(queries)]
+    alt, dijkstra, mismatches = [], [], 0
+    for s, t in pairs:
+        begin = time.perf_counter()
+        d = graph.shortest_distance(s, t)
+        alt.append((time.perf_counter() - begin) * 1000)
+        begin = time.perf_counter()
+        reference = graph._dijkstra_all(s, graph.forward)[t]
+        dijkstra.append((time.perf_counter() - begin) * 1000)
+        if abs(d - reference) > 1e-6:
+            mismatches += 1
+    _report("full Dijkstra", dijkstra)
+    _report("ALT bidirectional A*", alt)
+    print(f"distance mismatches vs Dijkstra: {mismatches}")
+
+    import main  # noqa: E402
+    from fastapi.testclient import TestClient
+
+    # User on the west bank mid-way between bridges; vets just across the river
+    # (close by air, far by road) and further away on the user's own bank
+    user_row = size // 2
+    user = (ORIGIN[0] + user_row * STEP_DEG, ORIGIN[1] + (river - 3) * STEP_DEG)
+    db = main.SessionLocal()
+    for i, (row, col) in enumerate([(user_row, river + 2), (user_row + 3, river + 4),
+                                    (user_row + 12, river - 10), (user_row - 15, river - 6)]):
+        db.add(main.Vet(name=f"Route Bench Clinic {i}", address=f"{i} Grid Road",
+                        latitude=ORIGIN[0] + row * STEP_DEG, longitude=ORIGIN[1] + col * STEP_DEG,
+                        is_emergency=True, hours="Open 24 hours"))
+    db.commit()
+    db.close()
+
+    url = f"/api/vets/search?latitude={user[0]}&longitude={user[1]}&radius_km=5&limit=4&discover=false"
+    with TestClient(main.app) as client:
+        while road_graph.default_graph() is None:
+            time.sleep(0.05)
+        straight = client.get(url + "&by_road=false").json()
+        samples = []
+        for _ in range(50):
+            begin = time.perf_counter()
+            routed = client.get(url).json()
+            samples.append((time.perf_counter() - begin) * 1000)
+    print("straight-line order:", [(v["name"][-8:], v["distance"]) for v in straight])
+    print("road order:         ", [(v["name"][-8:], v["roadDistance"]) for v in routed])
+    _report("search, road re-rank", samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=120)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    run(args.size, args.queries)
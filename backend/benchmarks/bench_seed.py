@@ -0,0 +1,50 @@
+"""
+Cold-start benchmark for the default data seed.
+
+Measures init_default_data() against a fresh SQLite database (first boot, every
+row written) and against an already seeded one (every later boot/worker, digest
+unchanged). Run from anywhere:
+
+    python benchmarks/bench_seed.py [--runs 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+import main  # noqa: E402
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(runs: int):
+    cold, warm = [], []
+    for _ in range(runs):
+        main.Base.metadata.drop_all(bind=main.engine)
+        main.seed.seed_state.drop(bind=main.engine, checkfirst=True)
+        main.Base.metadata.create_all(bind=main.engine)
+        cold.append(_timed(main.init_default_data))
+        warm.append(_timed(main.init_default_data))
+
+    for label, samples in (("cold (empty db)", cold), ("warm (digest unchanged)", warm)):
+        print(f"{label:<26} median {statistics.median(samples):8.2f} ms   "
+              f"min {min(samples):8.2f} ms   max {max(samples):8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    run(parser.parse_args().runs)
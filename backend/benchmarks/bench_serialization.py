@@ -0,0 +1,118 @@
+"""
+List-endpoint serialization cost per 1,000 rows, before and after the fast path.
+
+"validated" is what a response_model route did for every row: Pydantic
+validation from attributes, JSON-mode dump and stdlib json rendering. "trusted"
+is serialization.trusted_rows with orjson. Both outputs are checked to decode to
+the same JSON. Also reports wire size with and without gzip through the API.
+
+    python benchmarks/bench_serialization.py [--rows 1000] [--repeat 50]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+
+import main  # noqa: E402
+import serialization  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def seed(rows: int):
+    rng = random.Random(11)
+    now = datetime.utcnow()
+    with main.engine.begin() as conn:
+        user_id = conn.execute(main.insert(main.User).values(
+            email="bench@example.com", name="Bench", hashed_password="x",
+        )).inserted_primary_key[0]
+        pet_id = conn.execute(main.insert(main.Pet).values(
+            name="Bruno", species="Dog", breed="Labrador", age_years=4, weight_kg=28.5,
+            gender="male", user_id=user_id,
+        )).inserted_primary_key[0]
+        conn.execute(main.insert(main.WeightLog), [{
+            "pet_id": pet_id, "weight_kg": round(rng.uniform(20, 35), 2), "date": now - timedelta(days=i),
+            "notes": "Weekly weigh-in after the evening walk", "body_condition_score": rng.randint(3, 7),
+            "activity_level": "moderate", "feeding_amount": "2 cups", "created_at": now, "updated_at": now,
+        } for i in range(rows)])
+        conn.execute(main.insert(main.Vaccination), [{
+            "pet_id": pet_id, "vaccine_name": f"Booster {i}", "vaccine_type": "DHPP", "veterinarian": "Dr. Rao",
+            "batch_number": f"B-{i:05d}", "notes": None, "date_administered": now - timedelta(days=30 * i),
+            "next_due_date": now + timedelta(days=365), "is_scheduled": False, "reminder_enabled": True,
+            "reminder_hours": 24, "created_at": now, "updated_at": now,
+        } for i in range(rows)])
+    return pet_id
+
+
+def validated(schema, rows) -> bytes:
+    adapter = TypeAdapter(List[schema])
+    content = adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+    return JSONResponse(content).body
+
+
+def trusted(schema, rows) -> bytes:
+    return serialization.trusted_rows(schema, rows).body
+
+
+def time_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run(rows: int, repeat: int):
+    with TestClient(main.app) as client:
+        pet_id = seed(rows)
+        db = main.SessionLocal()
+        cases = {
+            "weight logs": (main.WeightLogResponse, db.query(main.WeightLog).all()),
+            "vaccinations": (main.VaccinationResponse, db.query(main.Vaccination).all()),
+        }
+        print(f"{rows} rows per list, {repeat} repetitions")
+        for label, (schema, loaded) in cases.items():
+            assert json.loads(validated(schema, loaded)) == json.loads(trusted(schema, loaded)), label
+            for mode, fn in (("validated", validated), ("trusted", trusted)):
+                samples = time_ms(lambda: fn(schema, loaded), repeat)
+                p = _percentiles(samples)
+                per_1k = statistics.mean(samples) * 1000 / rows
+                print(f"{label:<13} {mode:<10} {per_1k:7.2f} ms/1k rows   p50 {p[50]:7.2f}   p95 {p[95]:7.2f}")
+        db.close()
+
+        for path in (f"/api/weight-logs?pet_id={pet_id}", f"/api/vaccinations?pet_id={pet_id}"):
+            plain = client.get(path, headers={"Accept-Encoding": "identity"})
+            packed = client.get(path, headers={"Accept-Encoding": "gzip"})
+            wire = packed.headers.get("content-length")
+            samples = time_ms(lambda: client.get(path, headers={"Accept-Encoding": "gzip"}), max(1, repeat // 5))
+            print(f"GET {path.split('?')[0]:<20} identity {len(plain.content):8d} B   gzip {wire:>8} B   "
+                  f"end-to-end mean {statistics.mean(samples):7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
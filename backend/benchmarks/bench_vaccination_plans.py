@@ -0,0 +1,118 @@
+"""
+Vaccination schedule generation for a shelter intake.
+
+Seeds one user with a batch of pets of mixed species and ages (some with earlier
+vaccination records), then times POST /api/vaccinations/generate for the whole
+batch and reports milliseconds per pet, plus the planner alone with a cold and a
+warm (species, age bucket) cache.
+
+    python benchmarks/bench_vaccination_plans.py [--pets 200] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+
+import main  # noqa: E402
+import vaccination_protocols  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def seed(pets: int):
+    rng = random.Random(5)
+    now = datetime.utcnow()
+    with main.engine.begin() as conn:
+        user_id = conn.execute(main.insert(main.User).values(
+            email="shelter@example.com", name="Shelter", hashed_password="x",
+        )).inserted_primary_key[0]
+        rows = [{
+            "name": f"Intake {i}", "species": rng.choice(("Dog", "Dog", "Cat", "Cat", "Rabbit")), "breed": "Mixed",
+            "age_years": rng.choice((0, 0, 1, 3, 8)), "age_months": rng.randint(0, 11), "weight_kg": 5.0,
+            "gender": rng.choice(("male", "female")), "user_id": user_id, "is_active": True, "created_at": now,
+        } for i in range(pets)]
+        pet_ids = conn.execute(main.insert(main.Pet).returning(main.Pet.id), rows).scalars().all()
+        conn.execute(main.insert(main.Vaccination), [{
+            "pet_id": pet_id, "vaccine_name": "Anti Rabies", "vaccine_type": "rabies", "is_scheduled": False,
+            "date_administered": now - timedelta(days=rng.randint(30, 700)), "created_at": now, "updated_at": now,
+        } for pet_id in pet_ids if rng.random() < 0.4])
+    return "shelter@example.com", sorted(pet_ids)
+
+
+def plan_all(pets, histories, now):
+    for pet in pets:
+        weeks = vaccination_protocols.pet_age_weeks(pet.age_years, pet.age_months, pet.created_at, now)
+        vaccination_protocols.plan_for_pet(pet.species, weeks, histories.get(pet.id, ()), now)
+
+
+def run(pets: int, repeat: int):
+    with TestClient(main.app) as client:
+        email, pet_ids = seed(pets)
+        headers = {"Authorization": f"Bearer {main.create_access_token({'sub': email})}"}
+        db = main.SessionLocal()
+        loaded = db.query(main.Pet).filter(main.Pet.id.in_(pet_ids)).all()
+        histories = {}
+        for pet_id, vaccine_type, name, when in db.query(
+            main.Vaccination.pet_id, main.Vaccination.vaccine_type,
+            main.Vaccination.vaccine_name, main.Vaccination.date_administered,
+        ):
+            histories.setdefault(pet_id, []).append((vaccine_type, name, when))
+        db.close()
+
+        now = datetime.utcnow()
+        print(f"{pets} pets, {repeat} repetitions")
+        vaccination_protocols.base_plan.cache_clear()
+        start = time.perf_counter()
+        plan_all(loaded, histories, now)
+        cold = (time.perf_counter() - start) * 1000
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            plan_all(loaded, histories, now)
+            samples.append((time.perf_counter() - start) * 1000)
+        info = vaccination_protocols.base_plan.cache_info()
+        print(f"planner cold  {cold / pets * 1000:8.1f} us/pet")
+        print(f"planner warm  {statistics.mean(samples) / pets * 1000:8.1f} us/pet   "
+              f"({info.currsize} cached (species, age bucket) plans)")
+
+        samples = []
+        for _ in range(repeat):
+            body = {"pet_ids": pet_ids, "dry_run": True}
+            start = time.perf_counter()
+            response = client.post("/api/vaccinations/generate", json=body, headers=headers)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+        p = _percentiles(samples)
+        print(f"dry run       {statistics.mean(samples) / pets:8.3f} ms/pet   p50 {p[50]:7.2f} ms   p95 {p[95]:7.2f} ms")
+
+        start = time.perf_counter()
+        response = client.post("/api/vaccinations/generate", json={"pet_ids": pet_ids}, headers=headers)
+        elapsed = (time.perf_counter() - start) * 1000
+        created = response.json()["created"]
+        print(f"generate      {elapsed / pets:8.3f} ms/pet   {created} doses inserted in {elapsed:.1f} ms")
+        again = client.post("/api/vaccinations/generate", json={"pet_ids": pet_ids}, headers=headers).json()["created"]
+        print(f"regenerate    {again} new doses (expected 0)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pets", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(min(args.pets, main.MAX_BULK_ITEMS), args.repeat)
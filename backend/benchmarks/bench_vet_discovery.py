@@ -0,0 +1,127 @@
+"""
+Vet discovery against local stub Google Places / Overpass servers.
+
+Starts two in-process HTTP stubs (with artificial latency), points the discovery
+service at them and compares the first search in a tile (provider fan-out) with
+repeated searches from the same neighbourhood (local index hit). Also checks that
+clinics listed by both providers are stored once.
+
+    python benchmarks/bench_vet_discovery.py [--latency-ms 200] [--requests 100]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+CENTER = (28.6139, 77.2090)
+CALLS = {"google": 0, "overpass": 0}
+LATENCY_S = 0.2
+
+
+def _clinics(count=15):
+    rng = random.Random(7)
+    return [
+        {"id": 1000 + i, "name": f"Paws Clinic {i}",
+         "lat": CENTER[0] + rng.uniform(-0.03, 0.03), "lon": CENTER[1] + rng.uniform(-0.03, 0.03)}
+        for i in range(count)
+    ]
+
+
+CLINICS = _clinics()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload):
+        time.sleep(LATENCY_S)
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # Google Places nearbysearch
+        CALLS["google"] += 1
+        self._reply({"status": "OK", "results": [
+            {"place_id": f"gp-{c['id']}", "name": c["name"], "vicinity": f"Block {c['id']}, New Delhi",
+             "geometry": {"location": {"lat": c["lat"], "lng": c["lon"]}}, "rating": 4.1,
+             "user_ratings_total": 40, "opening_hours": {"open_now": True}}
+            for c in CLINICS[:10]
+        ]})
+
+    def do_POST(self):  # Overpass interpreter; overlaps Google on clinics 5-9
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        CALLS["overpass"] += 1
+        self._reply({"elements": [
+            {"type": "node", "id": c["id"], "lat": c["lat"] + 0.0002, "lon": c["lon"],
+             "tags": {"amenity": "veterinary", "name": c["name"], "phone": "+91-11-5555-0000"}}
+            for c in CLINICS[5:]
+        ]})
+
+
+def _start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(requests: int):
+    server = _start_stub()
+    base = f"http://127.0.0.1:{server.server_port}"
+    _tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+    os.environ["GOOGLE_PLACES_URL"] = f"{base}/maps/api/place/nearbysearch/json"
+    os.environ["OVERPASS_URL"] = f"{base}/api/interpreter"
+    os.environ["GOOGLE_PLACES_API_KEY"] = "stub"
+
+    import main
+    from fastapi.testclient import TestClient
+
+    url = f"/api/vets/search?latitude={CENTER[0]}&longitude={CENTER[1]}&radius_km=10&limit=10"
+    with TestClient(main.app) as client:
+        start = time.perf_counter()
+        first = client.get(url)
+        cold_ms = (time.perf_counter() - start) * 1000
+        assert first.status_code == 200, first.text
+
+        warm = []
+        for _ in range(requests):
+            # Jitter inside the same ~5 km tile
+            lat = CENTER[0] + random.uniform(-0.002, 0.002)
+            lon = CENTER[1] + random.uniform(-0.002, 0.002)
+            start = time.perf_counter()
+            client.get(f"/api/vets/search?latitude={lat}&longitude={lon}&radius_km=10&limit=10")
+            warm.append((time.perf_counter() - start) * 1000)
+
+        db = main.SessionLocal()
+        discovered = db.query(main.Vet).filter(main.Vet.source != None).count()
+        db.close()
+
+    server.shutdown()
+    print(f"stub latency {LATENCY_S * 1000:.0f} ms per provider call")
+    print(f"first search (fan-out)      {cold_ms:8.2f} ms")
+    print(f"repeat searches (cache hit) mean {statistics.mean(warm):6.2f} ms   max {max(warm):6.2f} ms")
+    print(f"provider calls: {CALLS}  (expected one each)")
+    print(f"discovered vets stored: {discovered}  (expected {len(CLINICS)} unique clinics)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+    LATENCY_S = args.latency_ms / 1000
+    run(args.requests)
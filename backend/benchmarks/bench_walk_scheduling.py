@@ -0,0 +1,81 @@
+"""
+Walk booking overlap checks and availability with thousands of bookings per walker.
+
+    python benchmarks/bench_walk_scheduling.py [--bookings 5000] [--requests 200]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+
+import main  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def run(bookings: int, requests: int):
+    with TestClient(main.app) as client:
+        db = main.SessionLocal()
+        user = main.User(name="bench", email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        pet = main.Pet(name="Bench", species="Dog", breed="Beagle", age_years=2, weight_kg=10, gender="Male", user_id=user.id)
+        db.add(pet)
+        db.flush()
+
+        # One 60 minute walk per hour slot from 06:00, spread over consecutive days
+        day0 = datetime(2030, 1, 1)
+        rows = []
+        for i in range(bookings):
+            start = day0 + timedelta(days=i // 15, hours=6 + i % 15)
+            rows.append({
+                "pet_id": pet.id, "walker_id": 1, "scheduled_date": start.replace(hour=0),
+                "scheduled_time": start.strftime("%H:%M"), "duration_minutes": 45,
+                "total_cost": 225.0, "start_at": start, "end_at": start + timedelta(minutes=45),
+            })
+        db.execute(main.insert(main.WalkBooking), rows)
+        db.commit()
+        pet_id = pet.id
+        db.close()
+        days = bookings // 15
+
+        create, availability = [], []
+        for _ in range(requests):
+            day = day0 + timedelta(days=random.randrange(days))
+            payload = {"pet_id": pet_id, "walker_id": 1, "scheduled_date": day.isoformat(),
+                       "scheduled_time": f"{random.randrange(6, 21):02d}:50", "duration_minutes": 10}
+            start = time.perf_counter()
+            client.post("/api/walk-bookings", json=payload)
+            create.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            client.get(f"/api/walkers/1/availability?start_date={day.date()}&end_date={(day + timedelta(days=6)).date()}")
+            availability.append((time.perf_counter() - start) * 1000)
+
+    print(f"{bookings} existing bookings for one walker, {requests} requests each")
+    for label, samples in (("create booking", create), ("7-day availability", availability)):
+        p = _percentiles(samples)
+        print(f"{label:<20} mean {statistics.mean(samples):7.2f} ms   p50 {p[50]:7.2f}   p95 {p[95]:7.2f}   p99 {p[99]:7.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    run(args.bookings, args.requests)
@@ -0,0 +1,417 @@
+"""
+Load test across the API surface, with machine-readable results.
+
+Seeds a synthetic dataset into a temporary SQLite database, then drives a
+weighted mix of requests (feed, comments, likes, search, pets, logs,
+vaccinations, dashboard, vets, walkers, volunteers, auth, AI) from concurrent
+clients for a fixed time, either
+
+  inprocess  through httpx's ASGI transport, no sockets: application cost only
+  http       against the app under uvicorn in a separate process
+
+Gemini, text-to-speech and Google sign-in are replaced by local fakes in the
+process that serves the app, so runs are offline and repeatable
+(--fake-llm-ms adds a simulated model latency).
+
+Per endpoint it reports requests, errors, throughput and p50/p95/p99/max
+latency. The JSON goes to --output (stdout by default) for tracking
+regressions between runs; a table goes to stderr.
+
+    python benchmarks/loadtest.py [--mode both] [--scale 1] [--concurrency 32]
+                                  [--duration 10] [--output results.json]
+
+--scale 1 is 200 users with 2 pets each, 2,000 posts and 500 vets; everything
+else scales in proportion.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+if "--serve" not in sys.argv:
+    _tmp = tempfile.mkdtemp(prefix="furrstaid-load-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'load.db')}"
+    os.environ["IMAGE_STORE_DIR"] = os.path.join(_tmp, "uploads")
+os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+os.environ["GOOGLE_CLIENT_ID"] = "loadtest"
+
+import httpx  # noqa: E402
+import main  # noqa: E402
+import feed_ranking  # noqa: E402
+import gemini  # noqa: E402
+import google_identity  # noqa: E402
+
+CENTER = (28.61, 77.21)
+PASSWORD = "load-test-password"
+WORDS = "dog cat puppy kitten walk vet vaccine food diet allergy limp harness leash training groom flea".split()
+SPECIES = (("Dog", "Labrador"), ("Cat", "Persian"), ("Rabbit", "Lop"))
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] for p in (50, 95, 99)}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# ---- fakes for the external services -------------------------------------------------------
+
+def install_fakes(llm_latency_s: float = 0.0):
+    """Swap Gemini, pyttsx3 and Google token verification for local stand-ins."""
+
+    class GenerativeModel:
+        def __init__(self, name):
+            self.name = name
+
+        def generate_content(self, prompt):
+            if llm_latency_s:
+                time.sleep(llm_latency_s)
+            return SimpleNamespace(text=f"Keep an eye on it and see a vet if it persists. ({prompt[:40]})")
+
+    class Speech:
+        def __init__(self):
+            self.path = None
+
+        def getProperty(self, name):
+            return 200
+
+        def setProperty(self, name, value):
+            pass
+
+        def save_to_file(self, text, path):
+            self.path = path
+
+        def runAndWait(self):
+            with open(self.path, "wb") as f:
+                f.write(b"RIFF" + (36).to_bytes(4, "little") + b"WAVEfmt " + bytes(24) + b"data" + bytes(4))
+
+    def verify(token, client_id):
+        return {"email": token, "name": token.split("@")[0]}
+
+    # The app loads these SDKs on first use, so the stand-ins go where those loads look
+    gemini._model = GenerativeModel(gemini.MODEL_NAME)
+    sys.modules["pyttsx3"] = SimpleNamespace(init=Speech)
+    google_identity.verify = verify
+
+
+# ---- dataset -------------------------------------------------------------------------------
+
+def seed(scale: float, seed_value: int = 11):
+    """Insert the synthetic dataset; returns what the scenarios need to address it."""
+    rng = random.Random(seed_value)
+    now = datetime.utcnow()
+    users, posts_n, vets_n = max(2, int(200 * scale)), max(10, int(2000 * scale)), max(10, int(500 * scale))
+    walkers_n, volunteers_n = max(5, int(100 * scale)), max(5, int(50 * scale))
+    counts = {}
+
+    def insert(model, rows):
+        if rows:
+            conn.execute(main.insert(model), rows)
+        counts[model.__tablename__] = counts.get(model.__tablename__, 0) + len(rows)
+
+    main.prepare_database()
+    with main.engine.begin() as conn:
+        real_hash = main.get_password_hash(PASSWORD)
+        emails = [f"owner{i}@furrstaid-load.com" for i in range(users)]
+        insert(main.User, [
+            {"email": email, "name": f"Owner {i}", "hashed_password": real_hash if i == 0 else "x"}
+            for i, email in enumerate(emails)
+        ])
+        user_ids = dict(conn.execute(main.select(main.User.email, main.User.id).where(main.User.email.in_(emails))).all())
+
+        insert(main.Pet, [{
+            "user_id": user_ids[email], "name": f"Pet {i}-{n}", "species": SPECIES[(i + n) % 3][0],
+            "breed": SPECIES[(i + n) % 3][1], "age_years": rng.randint(0, 12), "age_months": rng.randint(0, 11),
+            "weight_kg": round(rng.uniform(2, 40), 1), "gender": rng.choice(("male", "female")),
+            "vet_name": f"Clinic {rng.randint(0, 20)}", "created_at": now, "updated_at": now,
+        } for i, email in enumerate(emails) for n in range(2)])
+        pets = {}
+        for pet_id, user_id in conn.execute(main.select(main.Pet.id, main.Pet.user_id)).all():
+            pets.setdefault(user_id, []).append(pet_id)
+        pet_ids = [pet for owned in pets.values() for pet in owned]
+
+        insert(main.WeightLog, [{
+            "pet_id": pet, "weight_kg": round(rng.uniform(2, 40), 1), "date": now - timedelta(days=7 * week),
+            "created_at": now, "updated_at": now,
+        } for pet in pet_ids for week in range(20)])
+        insert(main.Vaccination, [{
+            "pet_id": pet, "vaccine_name": name, "vaccine_type": name.lower(), "is_scheduled": scheduled,
+            "date_administered": None if scheduled else now - timedelta(days=rng.randint(30, 400)),
+            "scheduled_date": now + timedelta(days=rng.randint(-20, 60)) if scheduled else None,
+            "next_due_date": now + timedelta(days=rng.randint(-30, 300)), "created_at": now, "updated_at": now,
+        } for pet in pet_ids for name, scheduled in (("Rabies", False), ("DHPP", False), ("Rabies", True), ("Lepto", True))])
+        insert(main.CheckupReminder, [{
+            "pet_id": pet, "title": "Checkup", "checkup_type": "general", "due_time": "10:00",
+            "due_date": now + timedelta(days=rng.randint(-5, 30)), "priority": "medium",
+            "created_at": now, "updated_at": now,
+        } for pet in pet_ids for _ in range(3)])
+
+        authors = list(user_ids.values())
+        post_rows = []
+        for i in range(posts_n):
+            created_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 60))
+            post_rows.append({
+                "user_id": rng.choice(authors), "title": " ".join(rng.choices(WORDS, k=5)),
+                "content": " ".join(rng.choices(WORDS, k=40)), "created_at": created_at,
+            })
+        insert(main.CommunityPost, post_rows)
+        post_ids = conn.execute(main.select(main.CommunityPost.id)).scalars().all()
+        comments, likes = {}, {}
+        comment_rows, like_rows = [], []
+        for post_id in post_ids:
+            comments[post_id] = int(rng.paretovariate(1.3)) - 1
+            for _ in range(min(comments[post_id], 200)):
+                comment_rows.append({"post_id": post_id, "user_id": rng.choice(authors), "created_at": now,
+                                     "content": " ".join(rng.choices(WORDS, k=12))})
+            likers = rng.sample(authors, min(len(authors), int(rng.paretovariate(1.1)) - 1))
+            likes[post_id] = len(likers)
+            like_rows += [{"post_id": post_id, "user_id": user, "created_at": now} for user in likers]
+        insert(main.Comment, comment_rows)
+        insert(main.Like, like_rows)
+        created = dict(conn.execute(main.select(main.CommunityPost.id, main.CommunityPost.created_at)).all())
+        conn.execute(main.update(main.CommunityPost.__table__).where(main.CommunityPost.id == main.bindparam("post")).values(
+            like_count=main.bindparam("likes"), comment_count=main.bindparam("comments"), hot_score=main.bindparam("score"),
+        ), [{
+            "post": post_id, "likes": likes[post_id], "comments": min(comments[post_id], 200),
+            "score": feed_ranking.hot_score(likes[post_id], min(comments[post_id], 200), created[post_id]),
+        } for post_id in post_ids])
+
+        insert(main.Vet, [{
+            "name": f"Vet {i}", "address": f"{i} Clinic Road", "phone": "555-0100",
+            "latitude": CENTER[0] + rng.uniform(-0.5, 0.5), "longitude": CENTER[1] + rng.uniform(-0.5, 0.5),
+            "rating": round(rng.uniform(3, 5), 1), "is_open": rng.random() < 0.6, "is_emergency": rng.random() < 0.2,
+            "hours": "Mon-Sun 09:00-21:00", "created_at": now, "updated_at": now,
+        } for i in range(vets_n)])
+        insert(main.Walker, [{
+            "name": f"Walker {i}", "rate_per_hour": round(rng.uniform(10, 40), 2), "rating": round(rng.uniform(3, 5), 1),
+            "categories": rng.choice(("Dogs", "Dogs,Cats", "Cats,Rabbits")), "created_at": now, "updated_at": now,
+        } for i in range(walkers_n)])
+        insert(main.CrutchVolunteer, [{
+            "name": f"Volunteer {i}", "rate_per_day": round(rng.uniform(10, 60), 2), "rating": round(rng.uniform(3, 5), 1),
+            "categories": rng.choice(("Dogs", "Dogs,Cats", "Cats,Rabbits")), "max_concurrent_pets": rng.randint(1, 3),
+            "created_at": now, "updated_at": now,
+        } for i in range(volunteers_n)])
+    main.forum_search.ensure_index(main.engine)
+
+    tokens = {user_ids[email]: main.create_access_token({"sub": email}) for email in emails}
+    return SimpleNamespace(users=[(user, tokens[user], pets.get(user, [])) for user in authors],
+                           post_ids=post_ids, login_email=emails[0], counts=counts)
+
+
+# ---- request mix ---------------------------------------------------------------------------
+
+def scenarios(data):
+    """(label, weight, build(rng, user) -> (method, path, kwargs)); user is (id, token, pet_ids)."""
+    post = lambda rng: rng.choice(data.post_ids)  # noqa: E731
+    pet = lambda rng, user: rng.choice(user[2])  # noqa: E731
+    near = lambda rng: f"latitude={CENTER[0] + rng.uniform(-0.3, 0.3):.4f}&longitude={CENTER[1] + rng.uniform(-0.3, 0.3):.4f}"  # noqa: E731
+    return [
+        ("GET /api/community/posts?sort=hot", 10, lambda rng, user: ("GET", "/api/community/posts?sort=hot&limit=20", {})),
+        ("GET /api/community/posts", 5, lambda rng, user: ("GET", "/api/community/posts?limit=20", {})),
+        ("GET /api/community/posts/{id}/comments", 5, lambda rng, user: ("GET", f"/api/community/posts/{post(rng)}/comments", {})),
+        ("GET /api/community/search", 3, lambda rng, user: ("GET", f"/api/community/search?q={rng.choice(WORDS)}", {})),
+        ("PUT /api/community/posts/{id}/like", 3, lambda rng, user: ("PUT", f"/api/community/posts/{post(rng)}/like", {})),
+        ("POST /api/community/posts/{id}/comments", 2, lambda rng, user: (
+            "POST", f"/api/community/posts/{post(rng)}/comments", {"json": {"content": "Same here, thanks!"}})),
+        ("POST /api/community/posts", 1, lambda rng, user: (
+            "POST", "/api/community/posts", {"json": {"title": "Load test", "content": " ".join(rng.choices(WORDS, k=30))}})),
+        ("GET /api/pets", 5, lambda rng, user: ("GET", "/api/pets", {})),
+        ("GET /api/dashboard", 5, lambda rng, user: ("GET", "/api/dashboard", {})),
+        ("GET /api/upcoming-alerts", 3, lambda rng, user: ("GET", "/api/upcoming-alerts", {})),
+        ("GET /api/vaccinations", 3, lambda rng, user: ("GET", "/api/vaccinations", {})),
+        ("GET /api/checkup-reminders", 2, lambda rng, user: ("GET", "/api/checkup-reminders", {})),
+        ("GET /api/weight-logs", 3, lambda rng, user: ("GET", f"/api/weight-logs?pet_id={pet(rng, user)}", {})),
+        ("POST /api/weight-logs", 2, lambda rng, user: ("POST", "/api/weight-logs", {"json": {
+            "pet_id": pet(rng, user), "weight_kg": round(rng.uniform(2, 40), 1), "date": datetime.utcnow().isoformat()}})),
+        ("GET /api/pets/{id}/vaccination-plan", 1, lambda rng, user: ("GET", f"/api/pets/{pet(rng, user)}/vaccination-plan", {})),
+        ("GET /api/pets/overdue-vaccinations", 1, lambda rng, user: ("GET", "/api/pets/overdue-vaccinations", {})),
+        ("GET /api/vets/search", 4, lambda rng, user: ("GET", f"/api/vets/search?{near(rng)}&discover=false", {})),
+        ("GET /api/vets/emergency", 2, lambda rng, user: ("GET", f"/api/vets/emergency?{near(rng)}", {})),
+        ("GET /api/walkers/search", 3, lambda rng, user: ("GET", "/api/walkers/search?species=Dogs&sort=rating", {})),
+        ("GET /api/crutch-volunteers/search", 2, lambda rng, user: ("GET", "/api/crutch-volunteers/search?species=Cats", {})),
+        ("GET /api/species", 1, lambda rng, user: ("GET", "/api/species", {})),
+        ("GET /api/breeds", 1, lambda rng, user: ("GET", "/api/breeds", {})),
+        ("GET /users/me", 2, lambda rng, user: ("GET", "/users/me", {})),
+        ("POST /api/ai/gemini", 0.5, lambda rng, user: ("POST", "/api/ai/gemini", {"json": {"prompt": "My dog is limping"}})),
+        ("POST /auth/google", 0.5, lambda rng, user: (
+            "POST", "/auth/google", {"json": {"credential": f"google{rng.randint(0, 50)}@furrstaid-load.com"}})),
+        ("POST /login", 0.5, lambda rng, user: ("POST", "/login", {"json": {"email": data.login_email, "password": PASSWORD}})),
+    ]
+
+
+async def drive(client, data, concurrency: int, duration_s: float, warmup_s: float, seed_value: int = 17):
+    mix = scenarios(data)
+    labels, weights = [m[0] for m in mix], [m[1] for m in mix]
+    samples = {label: [] for label in labels}
+    errors = {label: 0 for label in labels}
+    statuses = {label: {} for label in labels}
+    start = time.perf_counter()
+    measure_from, stop_at = start + warmup_s, start + warmup_s + duration_s
+
+    async def worker(index):
+        rng = random.Random(seed_value * 1000 + index)
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                return
+            label, _, build = rng.choices(mix, weights)[0]
+            user = rng.choice(data.users)
+            method, path, kwargs = build(rng, user)
+            begin = time.perf_counter()
+            try:
+                response = await client.request(method, path, headers={"Authorization": f"Bearer {user[1]}"}, **kwargs)
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            elapsed = time.perf_counter() - begin
+            if begin >= measure_from:
+                samples[label].append(elapsed * 1000)
+                statuses[label][status] = statuses[label].get(status, 0) + 1
+                if status == 0 or status >= 500:
+                    errors[label] += 1
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return _summarize(samples, errors, statuses, duration_s)
+
+
+def _summarize(samples, errors, statuses, duration_s):
+    endpoints = {}
+    for label, values in samples.items():
+        if not values:
+            continue
+        p = _percentiles(values)
+        endpoints[label] = {
+            "requests": len(values), "errors": errors[label], "rps": round(len(values) / duration_s, 2),
+            "p50_ms": round(p[50], 3), "p95_ms": round(p[95], 3), "p99_ms": round(p[99], 3), "max_ms": round(max(values), 3),
+            "status": {str(code): count for code, count in sorted(statuses[label].items())},
+        }
+    everything = [value for values in samples.values() for value in values]
+    p = _percentiles(everything) if everything else {50: 0, 95: 0, 99: 0}
+    total = {
+        "requests": len(everything), "errors": sum(errors.values()), "rps": round(len(everything) / duration_s, 2),
+        "p50_ms": round(p[50], 3), "p95_ms": round(p[95], 3), "p99_ms": round(p[99], 3),
+    }
+    return {"total": total, "endpoints": endpoints}
+
+
+async def run_inprocess(data, args):
+    install_fakes(args.fake_llm_ms / 1000)
+    transport = httpx.ASGITransport(app=main.app)
+    # The app prints debug lines on some paths; keep stdout clean for the JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        async with main.app.router.lifespan_context(main.app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as client:
+                return await drive(client, data, args.concurrency, args.duration, args.warmup)
+
+
+def run_http(data, args):
+    port = _free_port()
+    server = subprocess.Popen([
+        sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port), "--fake-llm-ms", str(args.fake_llm_ms),
+    ], env=os.environ.copy(), stdout=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                if httpx.get(f"{base_url}/stats/user-count").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline or server.poll() is not None:
+                raise RuntimeError("server did not start")
+            time.sleep(0.2)
+
+        async def go():
+            limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+                return await drive(client, data, args.concurrency, args.duration, args.warmup)
+
+        return asyncio.run(go())
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def serve(args):
+    import uvicorn
+
+    install_fakes(args.fake_llm_ms / 1000)
+    # Keep-alive above the client's worst queueing delay, so pooled connections are not cut mid-run
+    uvicorn.run(main.app, host="127.0.0.1", port=args.port, log_level="warning", timeout_keep_alive=120)
+
+
+def _print_table(mode, result):
+    print(f"\n{mode}: {result['total']['requests']} requests, {result['total']['rps']} req/s, "
+          f"{result['total']['errors']} errors", file=sys.stderr)
+    print(f"{'endpoint':<44}{'req':>7}{'err':>5}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}", file=sys.stderr)
+    for label, row in sorted(result["endpoints"].items(), key=lambda item: -item[1]["p95_ms"]):
+        print(f"{label:<44}{row['requests']:>7}{row['errors']:>5}{row['rps']:>9.1f}"
+              f"{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}", file=sys.stderr)
+
+
+def run(args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        data = seed(args.scale)
+    seconds = time.perf_counter() - start
+    print(f"seeded {data.counts} in {seconds:.1f} s", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(), "platform": platform.platform(),
+            "scale": args.scale, "concurrency": args.concurrency, "duration_s": args.duration,
+            "warmup_s": args.warmup, "fake_llm_ms": args.fake_llm_ms, "dataset": data.counts,
+        },
+        "results": {},
+    }
+    modes = ("inprocess", "http") if args.mode == "both" else (args.mode,)
+    for mode in modes:
+        result = asyncio.run(run_inprocess(data, args)) if mode == "inprocess" else run_http(data, args)
+        report["results"][mode] = result
+        _print_table(mode, result)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+        print(f"\nwrote {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=("inprocess", "http", "both"), default="both")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per mode")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--fake-llm-ms", type=float, default=0.0)
+    parser.add_argument("--output")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args)
+    else:
+        run(args)
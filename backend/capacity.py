@@ -0,0 +1,67 @@
+"""
+Occupancy calculations for crutch (boarding) volunteers.
+
+Stays are half-open [pickup, dropoff) intervals. Stays are capped at
+MAX_STAY_DAYS, so every stay overlapping a window starts after
+window_start - MAX_STAY_DAYS, which bounds the range scan on the
+(volunteer_id, pickup_date) index.
+"""
+from datetime import date, datetime, time, timedelta
+
+MAX_STAY_DAYS = 60
+MAX_CALENDAR_DAYS = 366
+
+
+def stay_lower_bound(start: datetime) -> datetime:
+    """Earliest pickup a stay overlapping `start` can have."""
+    return start - timedelta(days=MAX_STAY_DAYS)
+
+
+def peak_occupancy(stays, start: datetime, end: datetime) -> int:
+    """
+    Maximum number of stays present at the same instant within [start, end).
+    Sweep line over +1/-1 events; departures (-1) sort before arrivals (+1)
+    at equal times so back-to-back stays do not count as overlapping.
+    """
+    events = []
+    for pickup, dropoff in stays:
+        lo, hi = max(pickup, start), min(dropoff, end)
+        if lo < hi:
+            events.append((lo, 1))
+            events.append((hi, -1))
+    events.sort()
+    current = peak = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def daily_occupancy(stays, start_date: date, end_date: date):
+    """
+    Peak number of concurrent stays for each day in [start_date, end_date],
+    from a single sweep over the sorted +1/-1 events (O(n log n + days)).
+    """
+    window_start = datetime.combine(start_date, time.min)
+    events = []
+    for pickup, dropoff in stays:
+        events.append((pickup, 1))
+        events.append((dropoff, -1))
+    events.sort()
+
+    occupancy, current, i = [], 0, 0
+    day = start_date
+    while day <= end_date:
+        next_day = datetime.combine(day + timedelta(days=1), time.min)
+        # Stays already present when the day starts
+        while i < len(events) and events[i][0] <= window_start:
+            current += events[i][1]
+            i += 1
+        peak = current
+        while i < len(events) and events[i][0] < next_day:
+            current += events[i][1]
+            peak = max(peak, current)
+            i += 1
+        occupancy.append((day, peak))
+        window_start, day = next_day, day + timedelta(days=1)
+    return occupancy
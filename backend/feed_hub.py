@@ -0,0 +1,135 @@
+"""
+In-process pub/sub fan-out for live community updates.
+
+Writers publish small encoded deltas after their transaction commits. Each one is
+handed as the same bytes object to every subscriber's bounded queue. A subscriber
+whose queue is full is evicted instead of buffering without limit or holding up
+the publisher; its client reconnects and refetches the feed once.
+
+Events travel between processes through a Broker, and every process fans out
+what its broker delivers to its own subscribers. LocalBroker is the in-process
+stand-in for a single worker; a Redis pub/sub or Postgres LISTEN/NOTIFY broker
+implements the same three methods for several workers.
+"""
+import abc
+import asyncio
+import os
+
+QUEUE_SIZE = int(os.getenv("FEED_QUEUE_SIZE", "64"))
+HEARTBEAT_S = 15.0
+
+
+class Broker(abc.ABC):
+    """Carries encoded events to every process's hub."""
+
+    @abc.abstractmethod
+    async def start(self, deliver):
+        """Begin delivering received events by calling `deliver(data)` on the event loop."""
+
+    @abc.abstractmethod
+    async def publish(self, data: bytes):
+        """Send `data` to every process's hub, this one included."""
+
+    async def close(self):
+        pass
+
+
+class LocalBroker(Broker):
+    """Single-process broker: publishing delivers straight to this process's hub."""
+
+    async def start(self, deliver):
+        self._deliver = deliver
+
+    async def publish(self, data: bytes):
+        self._deliver(data)
+
+
+class Subscription:
+    def __init__(self, queue_size: int):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.evicted = False
+
+    async def events(self, heartbeat_s: float = HEARTBEAT_S):
+        """
+        Yield encoded events as they arrive, or None after `heartbeat_s` of quiet
+        so the transport can send a keep-alive. Ends when the subscriber is evicted.
+        """
+        while not self.evicted:
+            try:
+                data = await asyncio.wait_for(self.queue.get(), heartbeat_s)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if data is None:  # eviction wake-up
+                return
+            yield data
+
+
+class FeedHub:
+    def __init__(self, broker: Broker = None, queue_size: int = QUEUE_SIZE):
+        self.broker = broker or LocalBroker()
+        self.queue_size = queue_size
+        self.evictions = 0
+        self._subscribers = set()
+        self._loop = None
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        await self.broker.start(self._fan_out)
+
+    async def close(self):
+        await self.broker.close()
+        self.disconnect_all()
+        self._loop = None
+
+    def disconnect_all(self):
+        """End every open stream now (shutdown); clients reconnect, to another worker if need be."""
+        for subscription in list(self._subscribers):
+            self._evict(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    def publish(self, data: bytes):
+        """
+        Send an encoded event to all subscribers. Safe to call from the event loop
+        or a worker thread; a no-op before start() (scripts, tests).
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            loop.create_task(self.broker.publish(data))
+        else:
+            asyncio.run_coroutine_threadsafe(self.broker.publish(data), loop)
+
+    def _fan_out(self, data: bytes):
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait(data)
+            except asyncio.QueueFull:
+                self.evictions += 1
+                self._evict(subscription)
+
+    def _evict(self, subscription: Subscription):
+        """Drop a subscriber: discard its backlog and wake its reader to end the stream."""
+        self._subscribers.discard(subscription)
+        if subscription.evicted:
+            return
+        subscription.evicted = True
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
@@ -0,0 +1,212 @@
+"""
+Full-text search over community posts and comments.
+
+On SQLite the text lives in one FTS5 table, forum_fts, kept current by triggers
+on community_posts and comments (so ORM writes, Core writes and cascaded deletes
+are all covered). Posts use rowid 2*id and comments 2*id + 1, so a hit's kind and
+source row come straight from its rowid. Hits are ranked by BM25 with the title
+weighted above the body.
+
+On Postgres the same queries run against GIN expression indexes on
+to_tsvector(...) of the source tables, ranked with ts_rank_cd; the indexes are
+maintained by Postgres itself.
+
+If the SQLite index could not be built (a build without FTS5, or a startup that
+failed before reaching it), search falls back to a LIKE scan of the source
+tables: every term must appear, title hits rank above body hits, and snippets
+are cut around the first match in Python. It is slow on a large forum but keeps
+search answering until the index exists.
+
+Pages use a keyset cursor on (rank, rowid) rather than OFFSET, so deep pages
+cost the same as the first. Ranks depend on corpus statistics, so a page fetched
+after heavy writes may repeat or skip a borderline hit; that is acceptable for
+forum search.
+"""
+import html
+import re
+
+from sqlalchemy import text
+
+import pagination
+
+TABLE = "forum_fts"
+TITLE_WEIGHT = 4.0
+BODY_WEIGHT = 1.0
+SNIPPET_TOKENS = 16
+MAX_QUERY_TERMS = 8
+# Control characters mark matches inside snippets; the text around them is
+# escaped before the markers become <mark> tags, so user content stays inert
+_OPEN, _CLOSE = "\x02", "\x03"
+
+_SQLITE_SCHEMA = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5("
+    "post_id UNINDEXED, title, body, tokenize='porter unicode61')",
+    f"CREATE TRIGGER IF NOT EXISTS {TABLE}_post_ai AFTER INSERT ON community_posts BEGIN "
+    f"INSERT INTO {TABLE}(rowid, post_id, title, body) VALUES (new.id * 2, new.id, new.title, new.content); END",
+    f"CREATE TRIGGER IF NOT EXISTS {TABLE}_post_ad AFTER DELETE ON community_posts BEGIN "
+    f"DELETE FROM {TABLE} WHERE rowid = old.id * 2; END",
+    f"CREATE TRIGGER IF NOT EXISTS {TABLE}_post_au AFTER UPDATE OF title, content ON community_posts BEGIN "
+    f"UPDATE {TABLE} SET title = new.title, body = new.content WHERE rowid = old.id * 2; END",
+    f"CREATE TRIGGER IF NOT EXISTS {TABLE}_comment_ai AFTER INSERT ON comments BEGIN "
+    f"INSERT INTO {TABLE}(rowid, post_id, title, body) VALUES (new.id * 2 + 1, new.post_id, '', new.content); END",
+    f"CREATE TRIGGER IF NOT EXISTS {TABLE}_comment_ad AFTER DELETE ON comments BEGIN "
+    f"DELETE FROM {TABLE} WHERE rowid = old.id * 2 + 1; END",
+    f"CREATE TRIGGER IF NOT EXISTS {TABLE}_comment_au AFTER UPDATE OF content ON comments BEGIN "
+    f"UPDATE {TABLE} SET body = new.content WHERE rowid = old.id * 2 + 1; END",
+)
+
+_PG_POST_DOC = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))"
+_PG_COMMENT_DOC = "to_tsvector('english', coalesce(content, ''))"
+_PG_SCHEMA = (
+    f"CREATE INDEX IF NOT EXISTS ix_community_posts_fts ON community_posts USING GIN ({_PG_POST_DOC})",
+    f"CREATE INDEX IF NOT EXISTS ix_comments_fts ON comments USING GIN ({_PG_COMMENT_DOC})",
+)
+
+
+def ensure_index(engine):
+    """Create the search index (and fill it from existing rows the first time)."""
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            for statement in _PG_SCHEMA:
+                conn.execute(text(statement))
+            return
+        if conn.dialect.name != "sqlite":
+            return
+        existed = has_index(conn)
+        for statement in _SQLITE_SCHEMA:
+            conn.execute(text(statement))
+        if not existed:
+            conn.execute(text(f"INSERT INTO {TABLE}({TABLE}, rank) VALUES ('rank', 'bm25(0, {TITLE_WEIGHT}, {BODY_WEIGHT})')"))
+            rebuild(conn)
+
+
+def rebuild(conn):
+    """Re-index every post and comment (SQLite only)."""
+    conn.execute(text(f"DELETE FROM {TABLE}"))
+    conn.execute(text(f"INSERT INTO {TABLE}(rowid, post_id, title, body) SELECT id * 2, id, title, content FROM community_posts"))
+    conn.execute(text(f"INSERT INTO {TABLE}(rowid, post_id, title, body) SELECT id * 2 + 1, post_id, '', content FROM comments"))
+
+
+def has_index(conn) -> bool:
+    """Whether the SQLite FTS table exists."""
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": TABLE}
+    ).first() is not None
+
+
+def query_terms(q: str):
+    """Words of a free-text query; search syntax is never passed through."""
+    return re.findall(r"\w+", (q or "").lower())[:MAX_QUERY_TERMS]
+
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet or "").replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+def search(conn, q: str, limit: int = 20, cursor: str = None):
+    """
+    One page of hits, best first, as (hits, next_cursor). Each hit is a dict with
+    kind ("post" or "comment"), post_id, comment_id, rank (lower is better) and an
+    HTML-safe snippet with matches wrapped in <mark>.
+    """
+    terms = query_terms(q)
+    if not terms:
+        return [], None
+    after = pagination.decode_cursor(cursor, float, int) if cursor else None
+    if conn.dialect.name == "postgresql":
+        rows = _search_postgres(conn, terms, limit + 1, after)
+    elif has_index(conn):
+        rows = _search_sqlite(conn, terms, limit + 1, after)
+    else:
+        rows = _search_like(conn, terms, limit + 1, after)
+
+    hits = []
+    for rowid, post_id, rank, snippet in rows[:limit]:
+        is_post = rowid % 2 == 0
+        hits.append({
+            "kind": "post" if is_post else "comment",
+            "post_id": post_id,
+            "comment_id": None if is_post else rowid // 2,
+            "rank": rank,
+            "snippet": _highlight(snippet),
+        })
+    next_cursor = pagination.encode_cursor(rows[limit - 1][2], rows[limit - 1][0]) if len(rows) > limit else None
+    return hits, next_cursor
+
+
+def _search_sqlite(conn, terms, limit, after):
+    match = " ".join(f'"{term}"' for term in terms)
+    keyset = "AND (rank > :after_rank OR (rank = :after_rank AND rowid > :after_id))" if after else ""
+    sql = f"SELECT rowid, post_id, rank FROM {TABLE} WHERE {TABLE} MATCH :match {keyset} ORDER BY rank, rowid LIMIT :limit"
+    params = {"match": match, "limit": limit}
+    if after:
+        params.update(after_rank=after[0], after_id=after[1])
+    page = conn.execute(text(sql), params).all()
+    if not page:
+        return []
+    # Snippets only for the page; in the ranking query SQLite would build one per match before sorting
+    rowids = ", ".join(str(int(rowid)) for rowid, _, _ in page)
+    snippets = dict(conn.execute(text(
+        f"SELECT rowid, snippet({TABLE}, -1, :open, :close, '…', {SNIPPET_TOKENS}) "
+        f"FROM {TABLE} WHERE {TABLE} MATCH :match AND rowid IN ({rowids})"
+    ), {"match": match, "open": _OPEN, "close": _CLOSE}).all())
+    return [(rowid, post_id, rank, snippets.get(rowid)) for rowid, post_id, rank in page]
+
+
+def _search_postgres(conn, terms, limit, after):
+    keyset = "WHERE (rank > :after_rank OR (rank = :after_rank AND doc > :after_id))" if after else ""
+    sql = f"""
+        WITH q AS (SELECT plainto_tsquery('english', :terms) AS query),
+        hits AS (
+            SELECT id * 2 AS doc, id AS post_id, -ts_rank_cd({_PG_POST_DOC}, q.query) AS rank,
+                   coalesce(title, '') || ' ' || coalesce(content, '') AS body
+            FROM community_posts, q WHERE {_PG_POST_DOC} @@ q.query
+            UNION ALL
+            SELECT id * 2 + 1, post_id, -ts_rank_cd({_PG_COMMENT_DOC}, q.query), coalesce(content, '')
+            FROM comments, q WHERE {_PG_COMMENT_DOC} @@ q.query
+        ),
+        page AS (SELECT * FROM hits {keyset} ORDER BY rank, doc LIMIT :limit)
+        SELECT doc, post_id, rank, ts_headline('english', body, q.query,
+               'StartSel=' || :open || ', StopSel=' || :close || ', MaxWords={SNIPPET_TOKENS}, MinWords=5')
+        FROM page, q ORDER BY rank, doc
+    """
+    params = {"terms": " ".join(terms), "limit": limit, "open": _OPEN, "close": _CLOSE}
+    if after:
+        params.update(after_rank=after[0], after_id=after[1])
+    return conn.execute(text(sql), params).all()
+
+
+def _search_like(conn, terms, limit, after):
+    # Terms are \w+ words, so "_" is the only LIKE wildcard that needs escaping
+    params = {f"t{i}": "%" + term.replace("_", "\\_") + "%" for i, term in enumerate(terms)}
+
+    def all_terms(column):
+        return " AND ".join(f"{column} LIKE :t{i} ESCAPE '\\'" for i in range(len(terms)))
+
+    post_doc = "coalesce(title, '') || ' ' || coalesce(content, '')"
+    keyset = "WHERE (rank > :after_rank OR (rank = :after_rank AND doc > :after_id))" if after else ""
+    sql = f"""
+        SELECT doc, post_id, rank, body FROM (
+            SELECT id * 2 AS doc, id AS post_id,
+                   CASE WHEN {all_terms("coalesce(title, '')")} THEN 0.0 ELSE 1.0 END AS rank, {post_doc} AS body
+            FROM community_posts WHERE {all_terms(post_doc)}
+            UNION ALL
+            SELECT id * 2 + 1, post_id, 1.0, coalesce(content, '')
+            FROM comments WHERE {all_terms("coalesce(content, '')")}
+        ) {keyset} ORDER BY rank, doc LIMIT :limit
+    """
+    params["limit"] = limit
+    if after:
+        params.update(after_rank=after[0], after_id=after[1])
+    return [(doc, post_id, rank, _snippet(body, terms)) for doc, post_id, rank, body in conn.execute(text(sql), params).all()]
+
+
+def _snippet(body: str, terms) -> str:
+    """About SNIPPET_TOKENS words of `body` around the first match, with matches marked like FTS snippets."""
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    words = (body or "").split()
+    first = next((i for i, word in enumerate(words) if pattern.search(word)), 0)
+    start = max(0, first - SNIPPET_TOKENS // 4)
+    window = " ".join(words[start:start + SNIPPET_TOKENS])
+    marked = pattern.sub(lambda m: f"{_OPEN}{m.group(0)}{_CLOSE}", window)
+    return ("…" if start > 0 else "") + marked + ("…" if start + SNIPPET_TOKENS < len(words) else "")
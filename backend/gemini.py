@@ -0,0 +1,40 @@
+"""
+Gemini text generation behind /api/ai/gemini.
+
+google.generativeai drags in grpc, protobuf and every generated API type and
+takes about a second to import, so it is loaded on the first request that
+needs it instead of on every worker boot. The configured model is kept for
+the life of the process.
+
+The API key comes only from GEMINI_API_KEY, read on that first call so a key
+loaded from .env after this module is imported is still seen.
+"""
+import os
+
+MODEL_NAME = os.getenv("GEMINI_MODEL", "gemini-2.5-flash-lite")
+FALLBACK_TEXT = "No advice generated."
+
+_model = None
+
+
+class NotConfigured(RuntimeError):
+    """GEMINI_API_KEY is not set."""
+
+
+def model():
+    global _model
+    if _model is None:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise NotConfigured("GEMINI_API_KEY is not set; the AI assistant needs a Gemini API key")
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        _model = genai.GenerativeModel(MODEL_NAME)
+    return _model
+
+
+def generate(prompt: str) -> str:
+    """Blocking call to the model; returns its text, or FALLBACK_TEXT when it has none."""
+    response = model().generate_content(prompt)
+    return getattr(response, "text", None) or FALLBACK_TEXT
@@ -0,0 +1,14 @@
+"""
+Google Sign-In ID token verification.
+
+google.oauth2.id_token needs google.auth's transport on top of the requests
+library; both are imported on the first sign-in rather than at startup.
+"""
+
+
+def verify(token: str, client_id: str) -> dict:
+    """Claims of a valid Google ID token issued for `client_id`; raises ValueError otherwise."""
+    from google.auth.transport import requests
+    from google.oauth2 import id_token
+
+    return id_token.verify_oauth2_token(token, requests.Request(), client_id)
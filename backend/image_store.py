@@ -0,0 +1,289 @@
+"""
+Content-addressed image storage for community posts.
+
+Uploads are parsed from the request stream as they arrive and written to a
+temporary file while being hashed, so memory use is one network chunk however
+large the image is. Parsing, hashing and writing run in the threadpool, one
+chunk at a time, so a 10 MB upload does not hold up the event loop. The finished file is renamed to its SHA-256 digest:
+
+    <root>/originals/ab/ab12...ef.jpg
+    <root>/thumbs/ab/ab12...ef-320.webp
+
+An identical upload therefore costs one hash and an existence check, and every
+URL names immutable content, so it can be cached for a year.
+
+Decoding and resizing are CPU-bound and hold the GIL, so WebP thumbnails are
+built in a small process pool instead of on the event loop or its threadpool.
+A file that Pillow cannot decode is removed again and the upload rejected.
+
+Pool workers are started with forkserver (spawn where that is missing), and
+multiprocessing re-imports the launching script in them as __mp_main__. Run the
+server through serve.py or `uvicorn main:app`, whose scripts are small; under
+`python main.py` every image worker (or the forkserver) imports the whole app.
+"""
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from starlette.concurrency import run_in_threadpool
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+ROOT = os.getenv("IMAGE_STORE_DIR", "uploads")
+MAX_UPLOAD_BYTES = int(os.getenv("IMAGE_MAX_BYTES", str(10 * 1024 * 1024)))
+THUMB_WIDTHS = (320, 960)
+WEBP_QUALITY = 80
+MAX_PIXELS = 40_000_000  # rejects decompression bombs before they are decoded
+WORKERS = int(os.getenv("IMAGE_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+DIGEST = re.compile(r"^[0-9a-f]{64}$")
+EXTENSIONS = ("jpg", "png", "gif", "webp")
+
+
+class UploadRejected(ValueError):
+    """An upload the client has to fix; status_code is the HTTP status to answer with."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def sniff_extension(head: bytes):
+    """File extension for the image format in the first bytes, or None."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def make_thumbnails(source: str, targets):
+    """
+    Process-pool entry point: write one WebP per (width, path) in `targets`, never
+    upscaling. Returns the original (width, height); raises if the image is invalid.
+    """
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = MAX_PIXELS
+    with Image.open(source) as image:
+        size = image.size
+        if size[0] * size[1] > MAX_PIXELS:
+            raise ValueError("image too large")
+        widest = max(width for width, _ in targets)
+        # JPEG can decode at 1/2, 1/4 or 1/8 scale directly, far cheaper than a full decode
+        image.draft("RGB", (widest, widest * size[1] // max(1, size[0])))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        for width, path in sorted(targets, reverse=True):
+            if image.width > width:
+                image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            image.save(tmp, "WEBP", quality=WEBP_QUALITY, method=4)
+            os.replace(tmp, path)
+    return size
+
+
+class StoredImage:
+    __slots__ = ("digest", "extension", "size", "created")
+
+    def __init__(self, digest: str, extension: str, size: int, created: bool):
+        self.digest = digest
+        self.extension = extension
+        self.size = size
+        self.created = created
+
+
+class _UploadSink:
+    """Parser callbacks: hash and write the first file part, skip every other part."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hasher = hashlib.sha256()
+        self.head = b""
+        self.size = 0
+        self.file = None
+        self.done = False
+        self._header_field = b""
+        self._header_value = b""
+        self._is_file = False
+        self._writing = False
+
+    def callbacks(self):
+        return {
+            "on_part_begin": self._part_begin,
+            "on_header_field": lambda data, start, end: self._header(data[start:end], True),
+            "on_header_value": lambda data, start, end: self._header(data[start:end], False),
+            "on_header_end": self._header_end,
+            "on_headers_finished": self._headers_finished,
+            "on_part_data": self._part_data,
+            "on_part_end": self._part_end,
+        }
+
+    def _part_begin(self):
+        self._header_field = self._header_value = b""
+        self._is_file = False
+
+    def _header(self, data: bytes, is_field: bool):
+        if is_field:
+            self._header_field += data
+        else:
+            self._header_value += data
+
+    def _header_end(self):
+        if self._header_field.lower() == b"content-disposition":
+            _, options = parse_options_header(self._header_value)
+            self._is_file = b"filename" in options
+        self._header_field = self._header_value = b""
+
+    def _headers_finished(self):
+        self._writing = self._is_file and not self.done
+        if self._writing:
+            self.file = tempfile.NamedTemporaryFile(dir=self.directory, prefix="upload-", delete=False)
+
+    def _part_data(self, data: bytes, start: int, end: int):
+        if not self._writing:
+            return
+        chunk = data[start:end]
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadRejected(413, f"Image exceeds {self.max_bytes // (1024 * 1024)} MB")
+        if len(self.head) < 16:
+            self.head += chunk[:16 - len(self.head)]
+        self.hasher.update(chunk)
+        self.file.write(chunk)
+
+    def _part_end(self):
+        if self._writing:
+            self._writing = False
+            self.done = True
+
+    def discard(self):
+        if self.file is not None:
+            self.file.close()
+            try:
+                os.unlink(self.file.name)
+            except FileNotFoundError:
+                pass
+            self.file = None
+
+
+class ImageStore:
+    def __init__(self, root: str = ROOT, max_bytes: int = MAX_UPLOAD_BYTES, widths=THUMB_WIDTHS, workers: int = WORKERS):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.widths = tuple(widths)
+        self.workers = workers
+        self._pool = None
+
+    def original_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.root, "originals", digest[:2], f"{digest}.{extension}")
+
+    def thumbnail_path(self, digest: str, width: int) -> str:
+        return os.path.join(self.root, "thumbs", digest[:2], f"{digest}-{width}.webp")
+
+    def find_original(self, digest: str):
+        """(path, extension) of a stored original, or None."""
+        if not DIGEST.match(digest):
+            return None
+        for extension in EXTENSIONS:
+            path = self.original_path(digest, extension)
+            if os.path.exists(path):
+                return path, extension
+        return None
+
+    async def save_multipart(self, content_type: str, chunks) -> StoredImage:
+        """
+        Store the first file part of a multipart/form-data body read from the async
+        iterable `chunks`. Raises UploadRejected for malformed, oversized or
+        non-image uploads.
+        """
+        mime, options = parse_options_header(content_type or "")
+        boundary = options.get(b"boundary")
+        if mime != b"multipart/form-data" or not boundary:
+            raise UploadRejected(400, "Expected a multipart/form-data upload")
+        os.makedirs(self.root, exist_ok=True)
+        sink = _UploadSink(self.root, self.max_bytes)
+        parser = MultipartParser(boundary, sink.callbacks())
+        try:
+            async for chunk in chunks:
+                # The parser calls the sink, which hashes and writes the chunk
+                await run_in_threadpool(parser.write, chunk)
+            await run_in_threadpool(parser.finalize)
+        except UploadRejected:
+            sink.discard()
+            raise
+        except Exception as exc:
+            sink.discard()
+            raise UploadRejected(400, "Malformed multipart body") from exc
+        if not sink.done:
+            sink.discard()
+            raise UploadRejected(400, "No file in upload")
+        extension = sniff_extension(sink.head)
+        if extension is None:
+            sink.discard()
+            raise UploadRejected(415, "Only JPEG, PNG, GIF and WebP images are accepted")
+        return await run_in_threadpool(self._keep, sink, extension)
+
+    def _keep(self, sink: _UploadSink, extension: str) -> StoredImage:
+        """Move a complete upload to its content address, or drop it if that is already stored."""
+        sink.file.close()
+        digest = sink.hasher.hexdigest()
+        path = self.original_path(digest, extension)
+        created = not os.path.exists(path)
+        if created:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(sink.file.name, path)
+        else:
+            os.unlink(sink.file.name)
+        return StoredImage(digest, extension, sink.size, created)
+
+    async def ensure_thumbnails(self, stored: StoredImage):
+        """
+        Build any missing thumbnails in the process pool. An image Pillow cannot
+        decode is deleted (if this upload created it) and rejected.
+        """
+        targets = [(width, self.thumbnail_path(stored.digest, width)) for width in self.widths]
+        missing = [(width, path) for width, path in targets if not os.path.exists(path)]
+        if not missing:
+            return
+        os.makedirs(os.path.dirname(missing[0][1]), exist_ok=True)
+        source = self.original_path(stored.digest, stored.extension)
+        try:
+            await self._run(make_thumbnails, source, missing)
+        except Exception as exc:
+            if stored.created:
+                os.unlink(source)
+            raise UploadRejected(415, "Image could not be decoded") from exc
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        if self._pool is None:
+            # forkserver: workers do not inherit the server's threads, sockets or DB connections
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context(method))
+        try:
+            return await loop.run_in_executor(self._pool, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (out of memory on a hostile image); start a fresh pool next time
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            raise
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,128 @@
+"""
+Process lifecycle helpers for running several workers against one database.
+
+startup_lock serializes one-time startup work (creating tables, migrations,
+seeding) across processes. On Postgres it is a session-level advisory lock,
+which also covers workers on other hosts; otherwise it is an flock on a file
+next to the SQLite database, the only place an SQLite file can be shared.
+
+BufferedCounters keeps hot-path counter increments in memory so a request does
+not pay for a read-modify-write transaction on a single contended row; the
+owner flushes them in one batch periodically and at shutdown.
+
+on_exit_signal runs a callback as soon as the server is told to stop, before
+it starts waiting for in-flight requests, so streams that never finish on
+their own can be ended instead of holding up the drain.
+"""
+import asyncio
+import contextlib
+import os
+import signal
+import tempfile
+import threading
+import zlib
+from collections import Counter
+
+from sqlalchemy import text
+
+try:
+    import fcntl
+except ImportError:  # Windows: development runs a single process
+    fcntl = None
+
+STARTUP_LOCK_FILE = os.getenv("STARTUP_LOCK_FILE")
+
+
+def _lock_path(engine, name: str) -> str:
+    if STARTUP_LOCK_FILE:
+        return STARTUP_LOCK_FILE
+    database = engine.url.database
+    if engine.dialect.name == "sqlite" and database and database != ":memory:":
+        return f"{database}.{name}.lock"
+    return os.path.join(tempfile.gettempdir(), f"furrstaid-{name}.lock")
+
+
+@contextlib.contextmanager
+def startup_lock(engine, name: str = "startup"):
+    """Hold an exclusive cross-process lock named `name` for the duration of the block."""
+    if engine.dialect.name == "postgresql":
+        key = zlib.crc32(f"furrstaid-{name}".encode())
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        return
+    if fcntl is None:
+        yield
+        return
+    with open(_lock_path(engine, name), "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class BufferedCounters:
+    """Named counter increments held in memory until flushed; safe from any thread."""
+
+    def __init__(self):
+        self._pending = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, key: str, amount: int = 1):
+        with self._lock:
+            self._pending[key] += amount
+
+    def pending(self, key: str) -> int:
+        with self._lock:
+            return self._pending[key]
+
+    def flush(self, write) -> int:
+        """
+        Pass the pending {key: delta} to `write` and clear them. If `write` raises,
+        the deltas are put back for the next flush. Returns the number of increments written.
+        """
+        with self._lock:
+            deltas, self._pending = self._pending, Counter()
+        if not deltas:
+            return 0
+        try:
+            write(dict(deltas))
+        except Exception:
+            with self._lock:
+                self._pending.update(deltas)
+            raise
+        return sum(deltas.values())
+
+
+def on_exit_signal(callback):
+    """
+    Call `callback()` on the running event loop when SIGINT or SIGTERM arrives,
+    then let the handler that was installed before (uvicorn's) run as usual.
+    Returns a function that puts the previous handlers back. Does nothing off the
+    main thread, where signal handlers cannot be set.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return lambda: None
+    loop = asyncio.get_running_loop()
+    previous = {}
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        handler = signal.getsignal(sig)
+        if not callable(handler):  # default/ignored, or installed through the loop by an older uvicorn
+            continue
+
+        def chained(signum, frame, handler=handler):
+            loop.call_soon_threadsafe(callback)
+            handler(signum, frame)
+
+        previous[sig] = handler
+        signal.signal(sig, chained)
+
+    def restore():
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+    return restore
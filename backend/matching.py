@@ -0,0 +1,63 @@
+"""
+Species category bitmasks for walkers and crutch volunteers.
+
+`categories` stays the human-readable comma-separated list ("Dogs,Cats"); the
+derived `category_mask` integer lets search filter with `mask & wanted = wanted`
+in SQL instead of parsing strings client-side.
+"""
+CATEGORY_BITS = {
+    "dogs": 1 << 0,
+    "cats": 1 << 1,
+    "birds": 1 << 2,
+    "rabbits": 1 << 3,
+    "hamsters": 1 << 4,
+    "fish": 1 << 5,
+    "turtles": 1 << 6,
+    "other": 1 << 7,
+}
+
+# Species table names are singular ("Dog"); categories are plural ("Dogs")
+_ALIASES = {
+    "dog": "dogs",
+    "cat": "cats",
+    "bird": "birds",
+    "rabbit": "rabbits",
+    "hamster": "hamsters",
+    "turtle": "turtles",
+}
+
+MAX_PAGE_SIZE = 100
+
+
+def _bit(name: str) -> int:
+    key = name.strip().lower()
+    return CATEGORY_BITS.get(_ALIASES.get(key, key), 0)
+
+
+def category_mask(categories) -> int:
+    """Bitmask for a comma-separated category string; unknown names are ignored."""
+    if not categories:
+        return 0
+    mask = 0
+    for name in categories.split(","):
+        mask |= _bit(name)
+    return mask
+
+
+def species_mask(species) -> int:
+    """
+    Bitmask for a list of requested species names.
+    Raises ValueError for a name that matches no category.
+    """
+    mask = 0
+    for name in species or []:
+        bit = _bit(name)
+        if not bit:
+            raise ValueError(f"Unknown species: {name}")
+        mask |= bit
+    return mask
+
+
+def mask_default(context) -> int:
+    """Column default deriving category_mask from the inserted categories."""
+    return category_mask(context.get_current_parameters().get("categories"))
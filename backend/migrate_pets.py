@@ -2,18 +2,11 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import create_engine, Column, Integer, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
-import sqlite3
 
-# Import the database URL from main.py
-from main import SQLALCHEMY_DATABASE_URL
+# Reuse the application's engine and session factory rather than building another
+from main import SessionLocal
 
-# Create SQLAlchemy engine and session
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 db = SessionLocal()
 
 def migrate_pets():
@@ -0,0 +1,139 @@
+"""
+Parse free-text vet opening hours into weekly intervals.
+
+Handles the formats stored in vets.hours: the seeded "Mon-Sat: 9 AM - 6 PM" and
+"Open 24 hours", Google weekday text ("Monday: 9:00 AM – 6:00 PM; Tuesday: ...")
+and OSM opening_hours ("Mo-Fr 09:00-13:00,15:00-19:00; Sa 10:00-14:00; Su off").
+
+Intervals are [start, end) minutes of the week with Monday 00:00 = 0, stored as
+JSON in vets.weekly_hours so the open-now check is a bisect, not a parse.
+"""
+import bisect
+import json
+import os
+import re
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# Clinics are local; hours are interpreted in this zone
+VET_TIMEZONE = ZoneInfo(os.getenv("VET_TIMEZONE", "Asia/Kolkata"))
+
+_DAYS = {
+    "mo": 0, "mon": 0, "monday": 0,
+    "tu": 1, "tue": 1, "tues": 1, "tuesday": 1,
+    "we": 2, "wed": 2, "wednesday": 2,
+    "th": 3, "thu": 3, "thur": 3, "thurs": 3, "thursday": 3,
+    "fr": 4, "fri": 4, "friday": 4,
+    "sa": 5, "sat": 5, "saturday": 5,
+    "su": 6, "sun": 6, "sunday": 6,
+}
+_DAY_WORD = r"(?:" + "|".join(sorted(_DAYS, key=len, reverse=True)) + r")"
+_DAY_SPEC = re.compile(rf"^\s*({_DAY_WORD}(?:\s*-\s*{_DAY_WORD})?(?:\s*,\s*{_DAY_WORD}(?:\s*-\s*{_DAY_WORD})?)*)\b\s*:?\s*(.*)$")
+_RULE_SPLIT = re.compile(rf"\s*;\s*|\s*,\s*(?={_DAY_WORD}\b)|\n")
+_TIME = r"(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm)?"
+_RANGE = re.compile(rf"{_TIME}\s*(?:-|to)\s*{_TIME}")
+_ALWAYS_OPEN = ("24 hours", "24/7", "24x7", "24 x 7", "open 24")
+_CLOSED = re.compile(r"\b(?:closed|off)\b")
+
+
+def _minutes(hour: str, minute: str, meridiem: str) -> int:
+    h, m = int(hour), int(minute or 0)
+    if meridiem == "pm" and h != 12:
+        h += 12
+    elif meridiem == "am" and h == 12:
+        h = 0
+    if h > 24 or m > 59:
+        raise ValueError("invalid time")
+    return h * 60 + m
+
+
+def _days(spec: str):
+    days = []
+    for part in spec.split(","):
+        bounds = [_DAYS[token.strip()] for token in part.split("-")]
+        if len(bounds) == 1:
+            days.append(bounds[0])
+        else:
+            start, end = bounds
+            days.extend((start + offset) % 7 for offset in range((end - start) % 7 + 1))
+    return days
+
+
+def _merge(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def parse_hours(text):
+    """
+    Weekly [start, end) minute intervals for a free-text hours string,
+    or None when the text cannot be understood.
+    """
+    if not text:
+        return None
+    normalized = text.lower().replace("–", "-").replace("—", "-").replace(" ", " ").strip()
+
+    intervals, understood = [], False
+    for rule in filter(None, _RULE_SPLIT.split(normalized)):
+        match = _DAY_SPEC.match(rule)
+        days, times = (_days(match.group(1)), match.group(2)) if match else (list(range(7)), rule)
+        # Markers apply to this rule's days only: "Monday: Open 24 hours; Sunday: Closed"
+        if any(marker in times for marker in _ALWAYS_OPEN):
+            understood = True
+            intervals.extend((day * MINUTES_PER_DAY, (day + 1) * MINUTES_PER_DAY) for day in days)
+            continue
+        if _CLOSED.search(times):
+            understood = True
+            continue
+        for hour1, minute1, meridiem1, hour2, minute2, meridiem2 in _RANGE.findall(times):
+            try:
+                opens = _minutes(hour1, minute1, meridiem1)
+                closes = _minutes(hour2, minute2, meridiem2)
+            except ValueError:
+                continue
+            understood = True
+            for day in days:
+                start = day * MINUTES_PER_DAY + opens
+                end = day * MINUTES_PER_DAY + closes
+                if closes <= opens:
+                    # Past midnight: continue into the next day (wrapping Sunday to Monday)
+                    end += MINUTES_PER_DAY
+                if end > MINUTES_PER_WEEK:
+                    intervals.append((start, MINUTES_PER_WEEK))
+                    intervals.append((0, end - MINUTES_PER_WEEK))
+                else:
+                    intervals.append((start, end))
+    if not understood:
+        return None
+    return _merge(intervals)
+
+
+def to_json(intervals):
+    return json.dumps(intervals) if intervals is not None else None
+
+
+def weekly_hours_default(context):
+    """Column default deriving weekly_hours from the inserted hours text."""
+    return to_json(parse_hours(context.get_current_parameters().get("hours")))
+
+
+def local_minute_of_week(now: datetime = None) -> int:
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    local = now.astimezone(VET_TIMEZONE)
+    return local.weekday() * MINUTES_PER_DAY + local.hour * 60 + local.minute
+
+
+def is_open_at(intervals, minute_of_week: int) -> bool:
+    """Bisect the sorted, non-overlapping intervals for the given minute."""
+    index = bisect.bisect_right(intervals, [minute_of_week, MINUTES_PER_WEEK + 1]) - 1
+    return index >= 0 and intervals[index][0] <= minute_of_week < intervals[index][1]
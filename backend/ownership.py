@@ -0,0 +1,64 @@
+"""
+Request-scoped ownership loader for pet-child endpoints.
+
+OwnedPets resolves the current user's active pet ids with one query the first
+time a request needs them and keeps them for the rest of the request, so
+ownership checks are set lookups and list endpoints filter with one IN (...)
+instead of re-querying Pet per row or per check. Pet rows themselves are loaded
+in batches on demand (DataLoader-style) and memoized the same way.
+"""
+from fastapi import HTTPException
+
+
+class OwnedPets:
+    def __init__(self, db, pet_model, user_id: int):
+        self.db = db
+        self.Pet = pet_model
+        self.user_id = user_id
+        self._ids = None
+        self._pets = {}
+
+    @property
+    def ids(self) -> frozenset:
+        if self._ids is None:
+            Pet = self.Pet
+            rows = self.db.query(Pet.id).filter(Pet.user_id == self.user_id, Pet.is_active == True).all()
+            self._ids = frozenset(pet_id for (pet_id,) in rows)
+        return self._ids
+
+    def owns(self, pet_id: int) -> bool:
+        return pet_id in self.ids
+
+    def require(self, pet_id: int) -> int:
+        if pet_id not in self.ids:
+            raise HTTPException(status_code=404, detail="Pet not found")
+        return pet_id
+
+    def scope(self, query, pet_column, pet_id=None):
+        """Restrict a query on a pet-child table to the user's pets (or one of them)."""
+        if pet_id is not None:
+            return query.filter(pet_column == self.require(pet_id))
+        return query.filter(pet_column.in_(self.ids))
+
+    def load_many(self, pet_ids) -> dict:
+        """Owned Pet rows by id, fetching any not yet loaded in one query."""
+        wanted = {pet_id for pet_id in pet_ids if pet_id in self.ids}
+        missing = wanted - self._pets.keys()
+        if missing:
+            for pet in self.db.query(self.Pet).filter(self.Pet.id.in_(missing)).all():
+                self._pets[pet.id] = pet
+        return {pet_id: self._pets[pet_id] for pet_id in wanted if pet_id in self._pets}
+
+    def load_all(self) -> list:
+        """All owned Pet rows in id order, with one query that also fills the id set."""
+        Pet = self.Pet
+        pets = self.db.query(Pet).filter(Pet.user_id == self.user_id, Pet.is_active == True).order_by(Pet.id).all()
+        self._pets.update((pet.id, pet) for pet in pets)
+        self._ids = frozenset(pet.id for pet in pets)
+        return pets
+
+    def load(self, pet_id: int):
+        pet = self.load_many([self.require(pet_id)]).get(pet_id)
+        if pet is None:
+            raise HTTPException(status_code=404, detail="Pet not found")
+        return pet
@@ -0,0 +1,267 @@
+"""
+Per-route request metrics, SQL accounting and an opt-in sampling profiler.
+
+RequestMetrics is a plain ASGI middleware: for every HTTP request it records
+latency into a fixed-bucket histogram keyed by (method, route template), the
+status class, and the number and total time of SQL statements the request
+ran. Statements are counted through SQLAlchemy's cursor events
+(instrument_engine); the current request is found through a context variable,
+which run_in_threadpool copies, so statements from sync dependencies and
+endpoints are attributed too.
+
+A request that runs the same statement N_PLUS_ONE_THRESHOLD times or more is
+counted as an N+1 suspect, and the statement is logged once per route.
+
+    GET /metrics  ->  Prometheus text exposition of all of the above
+                      (main serves it only with METRICS_TOKEN set, as a Bearer token)
+
+Profiling is off unless PROFILE_SLOW_MS is set. A daemon thread then samples
+every thread's stack each PROFILE_INTERVAL_MS while requests are in flight, and
+requests slower than the threshold get their samples written to PROFILE_DIR in
+collapsed-stack format ("frame;frame;frame count"), which flamegraph.pl,
+speedscope and inferno read directly. All requests share one event loop, so a
+profile also holds whatever else the process ran while that request was open.
+
+Metrics are per process; with several workers, scrape each one or aggregate.
+"""
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROFILE_SLOW_MS = float(os.getenv("PROFILE_SLOW_MS", "0"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+
+logger = logging.getLogger("furrstaid.metrics")
+_current = ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    """What one request did; filled in by the SQL hooks while it runs."""
+
+    __slots__ = ("statements", "sql_seconds", "samples")
+
+    def __init__(self):
+        self.statements = Counter()
+        self.sql_seconds = 0.0
+        self.samples = None  # Counter of collapsed stacks while profiling
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+
+class Registry:
+    """Metric values, updated on the event loop at the end of each request."""
+
+    def __init__(self):
+        self.latency = defaultdict(Histogram)  # (method, route) -> seconds
+        self.responses = Counter()  # (method, route, status class)
+        self.statements = Counter()  # (method, route) -> SQL statements
+        self.sql_seconds = Counter()  # (method, route) -> seconds in SQL
+        self.n_plus_one = Counter()  # (method, route) -> suspect requests
+        self.in_flight = 0
+        self.gauges = {}  # name -> (help, callable)
+        self._reported = set()
+
+    def add_gauge(self, name: str, help_text: str, read):
+        self.gauges[name] = (help_text, read)
+
+    def record(self, key, status: int, seconds: float, stats: RequestStats):
+        self.latency[key].observe(seconds)
+        self.responses[key + (f"{status // 100}xx",)] += 1
+        self.statements[key] += sum(stats.statements.values())
+        self.sql_seconds[key] += stats.sql_seconds
+        if stats.statements:
+            statement, repeats = stats.statements.most_common(1)[0]
+            if repeats >= N_PLUS_ONE_THRESHOLD:
+                self.n_plus_one[key] += 1
+                if (key, statement) not in self._reported:
+                    self._reported.add((key, statement))
+                    logger.warning("Possible N+1 in %s %s: statement ran %d times: %s",
+                                   key[0], key[1], repeats, " ".join(statement.split())[:300])
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4."""
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family("http_request_duration_seconds", "histogram", "Request latency by route template")
+        for (method, route), histogram in sorted(self.latency.items()):
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.total:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+        family("http_responses_total", "counter", "Responses by route template and status class")
+        for (method, route, status), count in sorted(self.responses.items()):
+            lines.append(f'http_responses_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}')
+
+        for name, kind, help_text, values, fmt in (
+            ("db_statements_total", "counter", "SQL statements executed while serving the route", self.statements, "{}"),
+            ("db_statement_seconds_total", "counter", "Time spent in SQL while serving the route", self.sql_seconds, "{:.6f}"),
+            ("db_n_plus_one_requests_total", "counter",
+             f"Requests that repeated one statement {N_PLUS_ONE_THRESHOLD}+ times", self.n_plus_one, "{}"),
+        ):
+            family(name, kind, help_text)
+            for (method, route), value in sorted(values.items()):
+                lines.append(f'{name}{{method="{method}",route="{_escape(route)}"}} {fmt.format(value)}')
+
+        family("http_requests_in_flight", "gauge", "Requests currently being served")
+        lines.append(f"http_requests_in_flight {self.in_flight}")
+        for name, (help_text, read) in sorted(self.gauges.items()):
+            family(name, "gauge", help_text)
+            lines.append(f"{name} {read()}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def instrument_engine(engine):
+    """Count every statement run on `engine` against the current request, if any."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        if stats is None:
+            return
+        starts = conn.info.get("query_start")
+        if starts:
+            stats.sql_seconds += time.perf_counter() - starts.pop()
+        stats.statements[statement] += 1
+
+
+class _Sampler(threading.Thread):
+    """Samples all thread stacks while any request is being profiled."""
+
+    # Leaf frames of idle threads (pool workers waiting for work), which add only noise
+    _IDLE = re.compile(r"(threading|queue)\.py:(wait|get)$")
+
+    def __init__(self, interval_s: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.interval_s = interval_s
+        self.active = set()
+        self.lock = threading.Lock()
+
+    def run(self):
+        own = threading.get_ident()
+        while True:
+            time.sleep(self.interval_s)
+            with self.lock:
+                if not self.active:
+                    continue
+                targets = list(self.active)
+            stacks = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                if names and not self._IDLE.search(names[0]):
+                    stacks.append(";".join(reversed(names)))
+            for stats in targets:
+                stats.samples.update(stacks)
+
+
+class RequestMetrics:
+    """ASGI middleware recording each HTTP request into `registry`."""
+
+    def __init__(self, app, registry: Registry, slow_ms: float = PROFILE_SLOW_MS,
+                 interval_ms: float = PROFILE_INTERVAL_MS, profile_dir: str = PROFILE_DIR):
+        self.app = app
+        self.registry = registry
+        self.slow_s = slow_ms / 1000
+        self.profile_dir = profile_dir
+        self.sampler = None
+        if slow_ms > 0:
+            self.sampler = _Sampler(interval_ms / 1000)
+            self.sampler.start()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = _current.set(stats)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # Event streams stay open indefinitely; sampling them would never stop
+                if stats.samples is not None and dict(message.get("headers", ())).get(b"content-type", b"").startswith(b"text/event-stream"):
+                    with self.sampler.lock:
+                        self.sampler.active.discard(stats)
+                    stats.samples = None
+            await send(message)
+
+        if self.sampler is not None:
+            stats.samples = Counter()
+            with self.sampler.lock:
+                self.sampler.active.add(stats)
+        self.registry.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.registry.in_flight -= 1
+            _current.reset(token)
+            route = scope.get("route")
+            key = (scope["method"], getattr(route, "path", None) or "unmatched")
+            self.registry.record(key, status, elapsed, stats)
+            if self.sampler is not None:
+                with self.sampler.lock:
+                    self.sampler.active.discard(stats)
+                if stats.samples and elapsed >= self.slow_s:
+                    self._dump(key, elapsed, stats)
+
+    def _dump(self, key, elapsed: float, stats: RequestStats):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", f"{key[0]} {key[1]}").strip("_")
+        path = os.path.join(self.profile_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}-{int(elapsed * 1000)}ms.folded")
+        with open(path, "w") as f:
+            for stack, count in stats.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        logger.warning("Slow request %s %s took %.0f ms; profile written to %s", key[0], key[1], elapsed * 1000, path)
@@ -0,0 +1,306 @@
+"""
+Local road-graph distance engine for route-aware vet ranking.
+
+The graph is loaded from an OSM XML extract on disk (ROAD_GRAPH_PATH, no network)
+and preprocessed once with ALT landmarks: shortest distances from and to a few
+far-apart landmark nodes give triangle-inequality lower bounds that steer a
+bidirectional A* search. The preprocessed graph is pickled next to the extract so
+later worker boots skip parsing. Distances for recent source nodes are kept in an
+LRU, so repeated searches from the same place only pay for new targets.
+"""
+import heapq
+import math
+import os
+import pickle
+import threading
+import xml.etree.ElementTree as ET
+from array import array
+from collections import OrderedDict
+
+ROAD_GRAPH_PATH = os.getenv("ROAD_GRAPH_PATH")
+LANDMARK_COUNT = 8
+ACTIVE_LANDMARKS = 3  # per query, picked by how tightly they bound d(s, t)
+SOURCE_LRU_SIZE = 256
+SNAP_CELL_DEG = 0.005  # ~550 m grid cells for nearest-node lookup
+MAX_SNAP_RINGS = 4
+RERANK_CANDIDATES = 20  # haversine-nearest vets re-ranked by road distance
+CACHE_VERSION = 1
+INF = float("inf")
+
+# Roads a car or auto-rickshaw can use to reach a clinic
+DRIVABLE = {
+    "motorway", "trunk", "primary", "secondary", "tertiary", "unclassified", "residential",
+    "motorway_link", "trunk_link", "primary_link", "secondary_link", "tertiary_link",
+    "living_street", "service", "road",
+}
+
+
+def _haversine_m(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 6371000 * 2 * math.asin(math.sqrt(a))
+
+
+class RoadGraph:
+    """Directed road graph with ALT landmark tables and a bidirectional A* query."""
+
+    def __init__(self, lats, lons, forward, backward):
+        self.lats = lats
+        self.lons = lons
+        self.forward = forward    # forward[u] = [(v, metres), ...]
+        self.backward = backward  # backward[v] = [(u, metres), ...]
+        self.landmark_from = []   # d(L, v) per landmark
+        self.landmark_to = []     # d(v, L) per landmark
+        self._grid = {}
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._index_nodes()
+
+    @property
+    def node_count(self) -> int:
+        return len(self.lats)
+
+    # Loading and preprocessing
+
+    @classmethod
+    def from_osm(cls, path: str):
+        """Parse drivable ways from an OSM XML extract, keeping only nodes they use."""
+        coords, ways = {}, []
+        for _, element in ET.iterparse(path, events=("end",)):
+            if element.tag == "node":
+                coords[element.get("id")] = (float(element.get("lat")), float(element.get("lon")))
+                element.clear()
+            elif element.tag == "way":
+                tags = {tag.get("k"): tag.get("v") for tag in element.iter("tag")}
+                if tags.get("highway") in DRIVABLE:
+                    refs = [nd.get("ref") for nd in element.iter("nd")]
+                    oneway = tags.get("oneway", "no")
+                    if tags.get("junction") == "roundabout" and oneway == "no":
+                        oneway = "yes"
+                    ways.append((refs, oneway))
+                element.clear()
+
+        index, lats, lons = {}, array("d"), array("d")
+        forward, backward = [], []
+
+        def node(ref):
+            if ref not in index:
+                index[ref] = len(lats)
+                lat, lon = coords[ref]
+                lats.append(lat)
+                lons.append(lon)
+                forward.append([])
+                backward.append([])
+            return index[ref]
+
+        for refs, oneway in ways:
+            refs = [ref for ref in refs if ref in coords]
+            for a, b in zip(refs, refs[1:]):
+                u, v = node(a), node(b)
+                metres = _haversine_m(lats[u], lons[u], lats[v], lons[v])
+                if oneway != "-1":
+                    forward[u].append((v, metres))
+                    backward[v].append((u, metres))
+                if oneway in ("no", "false", "0", "-1"):
+                    forward[v].append((u, metres))
+                    backward[u].append((v, metres))
+        graph = cls(lats, lons, forward, backward)
+        graph.build_landmarks()
+        return graph
+
+    @classmethod
+    def load(cls, path: str):
+        """Load a preprocessed pickle if it is newer than the extract, else parse and cache."""
+        cache_path = path + ".alt.pickle"
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "rb") as f:
+                version, state = pickle.load(f)
+            if version == CACHE_VERSION:
+                graph = cls(state["lats"], state["lons"], state["forward"], state["backward"])
+                graph.landmark_from, graph.landmark_to = state["landmark_from"], state["landmark_to"]
+                return graph
+        graph = cls.from_osm(path)
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((CACHE_VERSION, {
+                    "lats": graph.lats, "lons": graph.lons,
+                    "forward": graph.forward, "backward": graph.backward,
+                    "landmark_from": graph.landmark_from, "landmark_to": graph.landmark_to,
+                }), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+        return graph
+
+    def _dijkstra_all(self, source: int, adjacency):
+        dist = array("d", [INF]) * self.node_count
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for v, w in adjacency[u]:
+                nd = d + w
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return dist
+
+    def build_landmarks(self, count: int = LANDMARK_COUNT):
+        """Farthest-first landmark selection, keeping d(L, .) and d(., L) tables."""
+        if not self.node_count:
+            return
+        self.landmark_from, self.landmark_to = [], []
+        closest = array("d", [INF]) * self.node_count
+        candidate = 0
+        for _ in range(min(count, self.node_count)):
+            from_l = self._dijkstra_all(candidate, self.forward)
+            self.landmark_from.append(from_l)
+            self.landmark_to.append(self._dijkstra_all(candidate, self.backward))
+            best, candidate = -1.0, None
+            for v in range(self.node_count):
+                if from_l[v] < closest[v]:
+                    closest[v] = from_l[v]
+                if closest[v] != INF and closest[v] > best:
+                    best, candidate = closest[v], v
+            if candidate is None or best <= 0:
+                break
+
+    # Queries
+
+    def _index_nodes(self):
+        for v in range(self.node_count):
+            if self.forward[v] or self.backward[v]:
+                cell = (int(self.lats[v] // SNAP_CELL_DEG), int(self.lons[v] // SNAP_CELL_DEG))
+                self._grid.setdefault(cell, []).append(v)
+
+    def nearest_node(self, lat: float, lon: float):
+        """Closest graph node to a point, searching grid rings outwards; None if off-graph."""
+        row, col = int(lat // SNAP_CELL_DEG), int(lon // SNAP_CELL_DEG)
+        best, best_d, first_hit = None, INF, None
+        for ring in range(MAX_SNAP_RINGS + 1):
+            for r in range(row - ring, row + ring + 1):
+                for c in range(col - ring, col + ring + 1):
+                    if max(abs(r - row), abs(c - col)) != ring:
+                        continue
+                    for v in self._grid.get((r, c), ()):
+                        d = _haversine_m(lat, lon, self.lats[v], self.lons[v])
+                        if d < best_d:
+                            best, best_d = v, d
+            if best is not None and first_hit is None:
+                first_hit = ring
+            # A node in the first non-empty ring can only be beaten by one in the next ring
+            if first_hit is not None and ring > first_hit:
+                break
+        return best
+
+    @staticmethod
+    def _lower_bound(v: int, t: int, landmarks) -> float:
+        """Admissible estimate of d(v, t) from the landmark triangle inequalities."""
+        bound = 0.0
+        for from_l, to_l in landmarks:
+            if from_l[t] != INF and from_l[v] != INF:
+                bound = max(bound, from_l[t] - from_l[v])
+            if to_l[v] != INF and to_l[t] != INF:
+                bound = max(bound, to_l[v] - to_l[t])
+        return bound
+
+    def _active_landmarks(self, s: int, t: int):
+        """The few landmarks giving the tightest bound for this pair; fewer lookups per node."""
+        landmarks = list(zip(self.landmark_from, self.landmark_to))
+        landmarks.sort(key=lambda lm: self._lower_bound(s, t, [lm]), reverse=True)
+        return landmarks[:ACTIVE_LANDMARKS]
+
+    def shortest_distance(self, s: int, t: int) -> float:
+        """Bidirectional A* with average landmark potentials; metres or inf."""
+        if s == t:
+            return 0.0
+
+        landmarks = self._active_landmarks(s, t)
+        lower_bound = self._lower_bound
+
+        def potential(v):
+            # p(v) = (lb(v, t) - lb(s, v)) / 2 keeps both searches consistent
+            return (lower_bound(v, t, landmarks) - lower_bound(s, v, landmarks)) / 2
+
+        p_s, p_t = potential(s), potential(t)
+        dist = ({s: 0.0}, {t: 0.0})
+        settled = (set(), set())
+        heaps = ([(0.0, s)], [(0.0, t)])
+        adjacency = (self.forward, self.backward)
+        potentials = {s: p_s, t: p_t}
+        best = INF
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best + p_t - p_s:
+                break
+            side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            _, u = heapq.heappop(heaps[side])
+            if u in settled[side]:
+                continue
+            settled[side].add(u)
+            g = dist[side][u]
+            for v, w in adjacency[side][u]:
+                nd = g + w
+                if nd < dist[side].get(v, INF):
+                    dist[side][v] = nd
+                    if v not in potentials:
+                        potentials[v] = potential(v)
+                    # Forward key: g + p(v) - p(s); reverse key: g + p(t) - p(v)
+                    key = nd + potentials[v] - p_s if side == 0 else nd + p_t - potentials[v]
+                    heapq.heappush(heaps[side], (key, v))
+                    other = dist[1 - side].get(v)
+                    if other is not None and nd + other < best:
+                        best = nd + other
+        return best
+
+    def distances_from(self, source: int, targets) -> dict:
+        """Road distances source -> targets (metres), memoized per source node in an LRU."""
+        with self._lock:
+            known = self._lru.get(source)
+            if known is None:
+                known = self._lru[source] = {}
+                if len(self._lru) > SOURCE_LRU_SIZE:
+                    self._lru.popitem(last=False)
+            else:
+                self._lru.move_to_end(source)
+            missing = [t for t in targets if t not in known]
+        computed = {t: self.shortest_distance(source, t) for t in missing}
+        with self._lock:
+            known.update(computed)
+            return {t: known[t] for t in targets}
+
+    def road_distance_km(self, from_lat, from_lon, to_points):
+        """
+        Road distance in km from a point to each (lat, lon); None where a point
+        cannot be snapped to or reached on the graph.
+        """
+        source = self.nearest_node(from_lat, from_lon)
+        if source is None:
+            return [None] * len(to_points)
+        targets = [self.nearest_node(lat, lon) for lat, lon in to_points]
+        distances = self.distances_from(source, [t for t in targets if t is not None])
+        result = []
+        for t in targets:
+            d = distances.get(t, INF) if t is not None else INF
+            result.append(d / 1000 if d != INF else None)
+        return result
+
+
+_default_graph = None
+_default_lock = threading.Lock()
+
+
+def load_default():
+    """Load the graph at ROAD_GRAPH_PATH once per process; None when not configured."""
+    global _default_graph
+    if not ROAD_GRAPH_PATH or not os.path.exists(ROAD_GRAPH_PATH):
+        return None
+    with _default_lock:
+        if _default_graph is None:
+            _default_graph = RoadGraph.load(ROAD_GRAPH_PATH)
+    return _default_graph
+
+
+def default_graph():
+    """The loaded graph, or None while it is still loading or not configured."""
+    return _default_graph
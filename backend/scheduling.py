@@ -0,0 +1,90 @@
+"""
+Walk booking time normalization and free-slot computation.
+
+Bookings are stored as half-open [start_at, end_at) intervals in the wall-clock
+time they were booked for: scheduled_date's calendar date at scheduled_time, with
+any UTC offset on the request ignored. Every time compared against them goes
+through to_wall_clock the same way.
+
+New walks are capped at MAX_WALK_MINUTES, so any booking overlapping
+[start, end) starts inside (start - longest walk, end), which keeps overlap
+checks a bounded range scan on the (walker_id, start_at) index however many
+bookings a walker has. Rows from before the cap can be longer, so the owner
+reports the longest stored walk (set_longest_walk) and the bound reaches back
+past it.
+"""
+from datetime import datetime, date, time, timedelta, timezone
+
+MAX_WALK_MINUTES = 8 * 60
+MAX_AVAILABILITY_DAYS = 62
+
+_longest_walk_minutes = MAX_WALK_MINUTES
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Drop tzinfo after converting to UTC; the database stores naive datetimes."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def to_wall_clock(value: datetime) -> datetime:
+    """The local date and time as written, without its UTC offset (bookings are wall-clock times)."""
+    return value.replace(tzinfo=None)
+
+
+def parse_time_of_day(value: str) -> time:
+    """Parse "HH:MM", "HH:MM:SS" or "h:MM AM" into a time."""
+    value = value.strip()
+    for fmt in ("%H:%M", "%H:%M:%S", "%I:%M %p", "%I:%M%p", "%I %p"):
+        try:
+            return datetime.strptime(value.upper(), fmt).time()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid time of day: {value!r}")
+
+
+def booking_window(scheduled_date: datetime, scheduled_time: str, duration_minutes: int):
+    """Return the (start_at, end_at) interval for a walk booking."""
+    start = datetime.combine(to_wall_clock(scheduled_date).date(), parse_time_of_day(scheduled_time))
+    return start, start + timedelta(minutes=duration_minutes)
+
+
+def set_longest_walk(minutes):
+    """Widen the overlap bound to cover the longest stored walk (never below MAX_WALK_MINUTES)."""
+    global _longest_walk_minutes
+    _longest_walk_minutes = max(MAX_WALK_MINUTES, int(minutes or 0))
+
+
+def overlap_lower_bound(start: datetime) -> datetime:
+    """Earliest start_at a booking overlapping `start` can have."""
+    return start - timedelta(minutes=_longest_walk_minutes)
+
+
+def free_slots(busy, start_date: date, end_date: date, day_start: time, day_end: time, min_minutes: int = 30):
+    """
+    Sweep the busy intervals (sorted by start) and return the free gaps inside
+    the daily [day_start, day_end) window for every day in [start_date, end_date].
+    """
+    slots = []
+    busy = iter(busy)
+    current = next(busy, None)
+    min_gap = timedelta(minutes=min_minutes)
+    day = start_date
+    while day <= end_date:
+        cursor = datetime.combine(day, day_start)
+        window_end = datetime.combine(day, day_end)
+        # Skip bookings that finished before this day's window
+        while current is not None and current[1] <= cursor:
+            current = next(busy, None)
+        while current is not None and current[0] < window_end:
+            if current[0] - cursor >= min_gap:
+                slots.append((cursor, current[0]))
+            cursor = max(cursor, current[1])
+            if current[1] > window_end:
+                break
+            current = next(busy, None)
+        if window_end - cursor >= min_gap:
+            slots.append((cursor, window_end))
+        day += timedelta(days=1)
+    return slots
@@ -0,0 +1,236 @@
+"""
+Default reference data (species, breeds, mock walkers, crutch volunteers and vets).
+
+The data is applied with bulk INSERT ... ON CONFLICT DO NOTHING statements and a
+content hash of everything below is stored in the seed_state table, so a boot
+with unchanged seed data costs a single primary-key lookup.
+"""
+import hashlib
+import json
+from datetime import datetime
+
+from sqlalchemy import Table, MetaData, Column, String, DateTime, select, delete
+from sqlalchemy.dialects import postgresql, sqlite
+
+SEED_NAME = "default_data"
+
+SPECIES = [
+    {"name": "Dog", "icon": "🐕"},
+    {"name": "Cat", "icon": "🐱"},
+    {"name": "Bird", "icon": "🐦"},
+    {"name": "Rabbit", "icon": "🐰"},
+    {"name": "Hamster", "icon": "🐹"},
+    {"name": "Fish", "icon": "🐠"},
+    {"name": "Turtle", "icon": "🐢"},
+    {"name": "Other", "icon": "🐾"},
+]
+
+# Breeds keyed by species name; ids are resolved after the species upsert
+BREEDS = {
+    "Dog": [
+        "Golden Retriever", "Labrador Retriever", "German Shepherd", "French Bulldog",
+        "Bulldog", "Poodle", "Beagle", "Rottweiler", "Siberian Husky", "Pitbull",
+        "Border Collie", "Chihuahua", "Dachshund", "Yorkshire Terrier", "Mixed Breed",
+    ],
+    "Cat": [
+        "Persian", "Maine Coon", "British Shorthair", "Ragdoll", "Siamese",
+        "American Shorthair", "Scottish Fold", "Sphynx", "Bengal", "Russian Blue",
+        "Abyssinian", "Mixed Breed",
+    ],
+    "Bird": [
+        "Budgerigar", "Cockatiel", "Canary", "Lovebird", "Conure", "Cockatoo",
+        "African Grey", "Macaw", "Finch", "Parakeet", "Mixed Breed",
+    ],
+    "Rabbit": [
+        "Holland Lop", "Netherland Dwarf", "Lionhead", "Flemish Giant", "Rex",
+        "Mini Rex", "English Lop", "French Lop", "Himalayan", "Dutch", "Mixed Breed",
+    ],
+    "Hamster": [
+        "Syrian Hamster", "Dwarf Hamster", "Roborovski", "Chinese Hamster",
+        "European Hamster", "Mixed Breed",
+    ],
+    "Fish": [
+        "Goldfish", "Betta", "Guppy", "Angelfish", "Tetra", "Cichlid", "Discus",
+        "Koi", "Mixed Breed",
+    ],
+    "Turtle": [
+        "Red-Eared Slider", "Box Turtle", "Russian Tortoise", "Hermann's Tortoise",
+        "Greek Tortoise", "Sulcata Tortoise", "Painted Turtle", "Yellow-Bellied Slider",
+        "Mixed Breed",
+    ],
+    "Other": [
+        "Guinea Pig", "Chinchilla", "Ferret", "Hedgehog", "Sugar Glider", "Mixed Breed",
+    ],
+}
+
+# Older English mock walkers replaced by the Indian mock walkers below
+RETIRED_WALKERS = ["Alex Johnson", "Priya Desai", "Marco Rossi", "Sofia Nguyen"]
+
+WALKERS = [
+    {"name": "Rahul Sharma", "bio": "Fitness enthusiast, great with energetic breeds.", "rate_per_hour": 300.0, "rating": 4.8, "categories": "Dogs", "is_active": True},
+    {"name": "Aisha Khan", "bio": "Gentle with small and senior pets.", "rate_per_hour": 350.0, "rating": 4.9, "categories": "Dogs,Cats", "is_active": True},
+    {"name": "Vikram Iyer", "bio": "Loves long park walks and trail routes.", "rate_per_hour": 400.0, "rating": 4.7, "categories": "Dogs", "is_active": True},
+    {"name": "Neha Patel", "bio": "Weekend walks and evening slots available.", "rate_per_hour": 320.0, "rating": 4.6, "categories": "Dogs,Birds", "is_active": True},
+]
+
+CRUTCH_VOLUNTEERS = [
+    {"name": "Ananya Gupta", "bio": "Loving home boarding with daily updates.", "rate_per_day": 800.0, "rating": 4.9, "categories": "Dogs,Cats", "is_active": True},
+    {"name": "Rohit Verma", "bio": "Pick & drop to daycare or vet.", "rate_per_day": 700.0, "rating": 4.7, "categories": "Dogs", "is_active": True},
+    {"name": "Meera Nair", "bio": "Quiet space for senior pets.", "rate_per_day": 750.0, "rating": 4.8, "categories": "Dogs,Cats,Birds", "is_active": True},
+]
+
+VETS = [
+    {
+        "name": "Delhi Veterinary Hospital",
+        "address": "Near Red Fort, Old Delhi, Delhi 110006",
+        "phone": "+91-11-2396-1234",
+        "latitude": 28.6562,
+        "longitude": 77.2410,
+        "rating": 4.2,
+        "reviews_count": 89,
+        "is_open": True,
+        "is_emergency": False,
+        "specialties": json.dumps(["General Care", "Surgery"]),
+        "hours": "Mon-Sat: 9 AM - 6 PM",
+    },
+    {
+        "name": "Pet Care Clinic",
+        "address": "Karol Bagh, New Delhi, Delhi 110005",
+        "phone": "+91-11-2875-4321",
+        "latitude": 28.6517,
+        "longitude": 77.1909,
+        "rating": 4.5,
+        "reviews_count": 156,
+        "is_open": True,
+        "is_emergency": True,
+        "specialties": json.dumps(["Emergency", "24/7", "Critical Care"]),
+        "hours": "Open 24 hours",
+    },
+    {
+        "name": "Animal Health Center",
+        "address": "Connaught Place, New Delhi, Delhi 110001",
+        "phone": "+91-11-2331-5678",
+        "latitude": 28.6304,
+        "longitude": 77.2177,
+        "rating": 4.3,
+        "reviews_count": 203,
+        "is_open": False,
+        "is_emergency": False,
+        "specialties": json.dumps(["Dental", "Grooming", "Vaccination"]),
+        "hours": "Mon-Fri: 10 AM - 7 PM",
+    },
+    {
+        "name": "Emergency Pet Hospital",
+        "address": "Lajpat Nagar, New Delhi, Delhi 110024",
+        "phone": "+91-11-2987-6543",
+        "latitude": 28.5679,
+        "longitude": 77.2431,
+        "rating": 4.7,
+        "reviews_count": 312,
+        "is_open": True,
+        "is_emergency": True,
+        "specialties": json.dumps(["Emergency", "Surgery", "ICU"]),
+        "hours": "Open 24 hours",
+    },
+    {
+        "name": "Veterinary Care Services",
+        "address": "Saket, New Delhi, Delhi 110017",
+        "phone": "+91-11-2651-9876",
+        "latitude": 28.5245,
+        "longitude": 77.2065,
+        "rating": 4.4,
+        "reviews_count": 178,
+        "is_open": True,
+        "is_emergency": False,
+        "specialties": json.dumps(["General Care", "Pet Boarding", "Training"]),
+        "hours": "Mon-Sat: 8 AM - 8 PM",
+    },
+]
+
+# Unique indexes the ON CONFLICT clauses rely on. They are declared on the models
+# for fresh databases and created here for databases that predate them.
+UNIQUE_INDEXES = [
+    ("uq_breeds_species_name", "breeds", "species_id, name"),
+    ("uq_walkers_name", "walkers", "name"),
+    ("uq_crutch_volunteers_name", "crutch_volunteers", "name"),
+    ("uq_vets_name_address", "vets", "name, address"),
+]
+
+seed_state = Table(
+    "seed_state",
+    MetaData(),
+    Column("name", String(50), primary_key=True),
+    Column("digest", String(64), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def seed_digest() -> str:
+    """Content hash of the seed data; any edit above changes it."""
+    payload = {
+        "species": SPECIES,
+        "breeds": BREEDS,
+        "retired_walkers": RETIRED_WALKERS,
+        "walkers": WALKERS,
+        "crutch_volunteers": CRUTCH_VOLUNTEERS,
+        "vets": VETS,
+        "unique_indexes": UNIQUE_INDEXES,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _insert(conn, table):
+    """Dialect-specific INSERT supporting ON CONFLICT (SQLite and Postgres)."""
+    dialect = postgresql if conn.dialect.name == "postgresql" else sqlite
+    return dialect.insert(table)
+
+
+def _insert_ignore(conn, table, rows):
+    """Bulk INSERT ... ON CONFLICT DO NOTHING as a single executemany."""
+    if rows:
+        conn.execute(_insert(conn, table).on_conflict_do_nothing(), rows)
+
+
+def apply_seed(engine, metadata, force: bool = False) -> bool:
+    """
+    Apply the default data if its digest differs from the stored one.
+    Returns True when rows were written, False when the seed was already current.
+    """
+    digest = seed_digest()
+    with engine.begin() as conn:
+        seed_state.create(conn, checkfirst=True)
+        stored = conn.execute(
+            select(seed_state.c.digest).where(seed_state.c.name == SEED_NAME)
+        ).scalar()
+        if stored == digest and not force:
+            return False
+
+        tables = metadata.tables
+        for index_name, table_name, columns in UNIQUE_INDEXES:
+            conn.exec_driver_sql(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})"
+            )
+
+        species, breeds = tables["species"], tables["breeds"]
+        _insert_ignore(conn, species, SPECIES)
+        species_ids = dict(conn.execute(select(species.c.name, species.c.id)).all())
+        _insert_ignore(conn, breeds, [
+            {"name": breed, "species_id": species_ids[species_name]}
+            for species_name, names in BREEDS.items()
+            for breed in names
+        ])
+
+        walkers = tables["walkers"]
+        conn.execute(delete(walkers).where(walkers.c.name.in_(RETIRED_WALKERS)))
+        _insert_ignore(conn, walkers, WALKERS)
+        _insert_ignore(conn, tables["crutch_volunteers"], CRUTCH_VOLUNTEERS)
+        _insert_ignore(conn, tables["vets"], VETS)
+
+        now = datetime.utcnow()
+        upsert = _insert(conn, seed_state).values(name=SEED_NAME, digest=digest, applied_at=now)
+        conn.execute(upsert.on_conflict_do_update(
+            index_elements=[seed_state.c.name],
+            set_={"digest": digest, "applied_at": now},
+        ))
+    return True
@@ -0,0 +1,72 @@
+"""
+Production entry point: uvicorn workers on uvloop and httptools.
+
+    python serve.py [--workers N] [--host 0.0.0.0] [--port 8000]
+
+WEB_CONCURRENCY, HOST and PORT set the defaults; one worker unless asked for more. The database is created,
+migrated and seeded once here, before any worker starts, and the workers are
+told to skip that step (main.DB_PREPARED_ENV). Each worker is a fresh spawned
+process that imports the app once and builds its own engine, caches and pools;
+main.lifespan starts and stops them.
+
+On SIGTERM or SIGINT each worker stops accepting connections, ends its live
+feed streams (clients reconnect elsewhere), waits up to
+GRACEFUL_SHUTDOWN_SECONDS for in-flight requests, then flushes buffered
+counters and closes its pools.
+
+The live feed hub is per process (feed_hub.LocalBroker): with several workers a
+delta reaches only the clients connected to the worker that published it, so
+most live updates would be lost. That is why the default is a single worker;
+raise it only together with a shared broker, or where live updates do not matter
+(clients still see everything on refetch).
+"""
+import argparse
+import importlib.util
+import os
+
+import uvicorn
+
+GRACEFUL_SHUTDOWN_SECONDS = int(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30"))
+KEEP_ALIVE_SECONDS = int(os.getenv("KEEP_ALIVE_SECONDS", "15"))
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def prepare_database():
+    """Run the one-time database setup in this process, then release its connections before forking workers."""
+    import main
+
+    main.prepare_database()
+    main.engine.dispose()
+    os.environ[main.DB_PREPARED_ENV] = "1"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the FurrstAid API")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "1")))
+    parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "info"))
+    args = parser.parse_args(argv)
+
+    prepare_database()
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        # Both ship with uvicorn[standard]; fall back to the pure-Python ones where they do not build (Windows)
+        loop="uvloop" if _installed("uvloop") else "asyncio",
+        http="httptools" if _installed("httptools") else "h11",
+        proxy_headers=True,
+        forwarded_allow_ips=os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+        timeout_keep_alive=KEEP_ALIVE_SECONDS,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS,
+        log_level=args.log_level,
+    )
+
+
+if __name__ == "__main__":
+    main()
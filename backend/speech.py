@@ -0,0 +1,66 @@
+"""
+Offline text-to-speech for AI answers.
+
+pyttsx3 picks and loads a platform driver (espeak, SAPI5, NSSpeechSynthesizer)
+when it is first initialised; it is imported on first use so processes that
+never speak do not pay for it or fail on hosts without a speech engine.
+
+pyttsx3.init() hands out one shared engine per process, and a second
+runAndWait() while one is running fails with "run loop already started". So
+every call runs on a single dedicated thread: concurrent requests queue instead
+of failing, and the engine always lives on the thread that created it (SAPI5
+initialises COM for the thread that loads it). espeak, the Linux driver, works
+on any thread; macOS's NSSpeechSynthesizer driver expects the main thread's run
+loop and may return nothing off it, which callers already treat as no audio.
+"""
+import base64
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+_executor = None
+_executor_lock = threading.Lock()
+_engine = None  # only touched on the executor's thread
+
+
+def synthesize_base64(text: str) -> Optional[str]:
+    """
+    WAV rendering of `text` as base64, or None when no speech engine is available.
+    Blocks until the speech thread gets to it; call it from a worker thread.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speech")
+    return _executor.submit(_synthesize, text).result()
+
+
+def _synthesize(text: str) -> Optional[str]:
+    global _engine
+    tmp_path = None
+    try:
+        if _engine is None:
+            import pyttsx3
+
+            _engine = pyttsx3.init()
+            try:
+                rate = _engine.getProperty("rate")
+                _engine.setProperty("rate", max(125, int(rate * 0.9)))
+            except Exception:
+                pass
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
+            tmp_path = tmp.name
+        _engine.save_to_file(text, tmp_path)
+        _engine.runAndWait()
+        with open(tmp_path, "rb") as f:
+            return base64.b64encode(f.read()).decode("utf-8")
+    except Exception:
+        return None
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,175 @@
+"""
+In-memory static layer for the React bundle.
+
+Every file under the static directory is read once, hashed for an ETag and,
+when compressible, stored alongside gzip and brotli variants, so a request is a
+dict lookup plus header negotiation. Variants are built at startup, or picked up
+from .gz/.br siblings written at build time with
+
+    python static_assets.py static
+
+Vite fingerprints everything under assets/ (index-R1UrLizv.js), so those are
+served as immutable for a year; index.html and other unhashed files revalidate.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import sys
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # gzip-only without the optional brotli wheel
+    brotli = None
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+SHORT_LIVED = "public, max-age=3600"
+MIN_COMPRESS_BYTES = 1024
+_HASHED_NAME = re.compile(r"[-.][A-Za-z0-9_-]{8,}\.[a-z0-9]+$")
+_COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/xml")
+# Preferred order when the client accepts several encodings
+_ENCODINGS = ("br", "gzip")
+_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def _compressible(content_type: str) -> bool:
+    return content_type.startswith(_COMPRESSIBLE)
+
+
+def _compress(encoding: str, data: bytes) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def _accepted_encodings(header: str):
+    """Encodings with a non-zero q value from an Accept-Encoding header."""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+class StaticAsset:
+    __slots__ = ("content_type", "cache_control", "etag", "variants")
+
+    def __init__(self, content_type: str, cache_control: str, etag: str, variants: dict):
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.etag = etag
+        self.variants = variants  # encoding ("identity", "gzip", "br") -> bytes
+
+
+class StaticBundle:
+    """Static files held in memory with precomputed encodings and ETags."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.assets = {}
+        self.loaded = False
+
+    def load(self):
+        assets = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith((".gz", ".br")):
+                    continue
+                path = os.path.join(root, name)
+                relative = os.path.relpath(path, self.directory).replace(os.sep, "/")
+                assets[relative] = self._read(path, relative)
+        self.assets = assets
+        self.loaded = True
+        return self
+
+    def _read(self, path: str, relative: str) -> StaticAsset:
+        with open(path, "rb") as f:
+            data = f.read()
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+        variants = {"identity": data}
+        if _compressible(content_type) and len(data) >= MIN_COMPRESS_BYTES:
+            for encoding in _ENCODINGS:
+                prebuilt = path + _SUFFIXES[encoding]
+                if os.path.exists(prebuilt) and os.path.getmtime(prebuilt) >= os.path.getmtime(path):
+                    with open(prebuilt, "rb") as f:
+                        compressed = f.read()
+                elif encoding == "br" and brotli is None:
+                    continue
+                else:
+                    compressed = _compress(encoding, data)
+                if len(compressed) < len(data):
+                    variants[encoding] = compressed
+        if relative.startswith("assets/") and _HASHED_NAME.search(relative):
+            cache_control = IMMUTABLE
+        elif relative == "index.html":
+            cache_control = REVALIDATE
+        else:
+            cache_control = SHORT_LIVED
+        return StaticAsset(content_type, cache_control, hashlib.sha1(data).hexdigest()[:20], variants)
+
+    def get(self, relative: str):
+        if not self.loaded:
+            self.load()
+        return self.assets.get(relative)
+
+    def response(self, request: Request, asset: StaticAsset) -> Response:
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        encoding = next((e for e in _ENCODINGS if e in asset.variants and e in accepted), "identity")
+        # Each encoding is a different representation, so it gets its own strong validator
+        etag = f'"{asset.etag}"' if encoding == "identity" else f'"{asset.etag}-{encoding}"'
+        headers = {"Cache-Control": asset.cache_control, "ETag": etag}
+        if len(asset.variants) > 1:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if "*" in tags or etag in tags:
+                return Response(status_code=304, headers=headers)
+        return Response(asset.variants[encoding], media_type=asset.content_type, headers=headers)
+
+
+def precompress(directory: str):
+    """Build-time step: write .gz (and .br when available) next to compressible files."""
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.endswith((".gz", ".br")):
+                continue
+            path = os.path.join(root, name)
+            content_type = mimetypes.guess_type(path)[0] or ""
+            with open(path, "rb") as f:
+                data = f.read()
+            if not _compressible(content_type) or len(data) < MIN_COMPRESS_BYTES:
+                continue
+            for encoding in _ENCODINGS:
+                if encoding == "br" and brotli is None:
+                    continue
+                compressed = _compress(encoding, data)
+                if len(compressed) < len(data):
+                    with open(path + _SUFFIXES[encoding], "wb") as f:
+                        f.write(compressed)
+                    written += 1
+    return written
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "static"
+    print(f"Wrote {precompress(target)} precompressed files under {target}")
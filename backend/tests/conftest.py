@@ -0,0 +1,71 @@
+"""
+Shared setup: the app runs against a throwaway SQLite database with external
+vet discovery off, and main is imported only after that is configured.
+
+    cd backend && python -m pytest -q
+"""
+import itertools
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="furrstaid-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'test.db')}"
+os.environ["IMAGE_STORE_DIR"] = os.path.join(_tmp, "uploads")
+os.environ["VET_DISCOVERY_PROVIDERS"] = ""
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    import main
+
+    main.prepare_database()
+    return main
+
+
+@pytest.fixture
+def db(app_module):
+    session = app_module.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+_user_numbers = itertools.count(1)
+
+
+@pytest.fixture
+def client(app_module):
+    from fastapi.testclient import TestClient
+
+    return TestClient(app_module.app)
+
+
+@pytest.fixture
+def make_user(app_module, db):
+    """make_user() -> (user, auth headers) for a new account."""
+    def make(name="Owner"):
+        user = app_module.User(name=name, email=f"user{next(_user_numbers)}@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        token = app_module.create_access_token({"sub": user.email})
+        return user, {"Authorization": f"Bearer {token}"}
+    return make
+
+
+@pytest.fixture
+def make_pet(app_module, db):
+    """make_pet(user) -> a new active pet owned by `user`."""
+    def make(user, name="Biscuit"):
+        pet = app_module.Pet(name=name, species="Dog", breed="Beagle", age_years=3, weight_kg=11.5,
+                             gender="Male", user_id=user.id)
+        db.add(pet)
+        db.commit()
+        return pet
+    return make
@@ -0,0 +1,40 @@
+"""/api/ai/gemini with the model and speech engine replaced by fakes."""
+import pytest
+from fastapi.testclient import TestClient
+
+import gemini
+
+
+class FakeModel:
+    def generate_content(self, prompt):
+        return type("Response", (), {"text": f"Advice for: {prompt}"})()
+
+
+@pytest.fixture
+def client(app_module, monkeypatch):
+    monkeypatch.setattr(gemini, "_model", None)
+    monkeypatch.setattr(app_module.ai_admission.store, "_buckets", {})
+    return TestClient(app_module.app)
+
+
+def test_missing_api_key_is_a_clear_503(client, monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    response = client.post("/api/ai/gemini", json={"prompt": "my dog ate chocolate"})
+    assert response.status_code == 503
+    assert "GEMINI_API_KEY" in response.json()["detail"]
+
+
+def test_answer_comes_from_the_model(app_module, client, monkeypatch):
+    monkeypatch.setattr(gemini, "_model", FakeModel())
+    monkeypatch.setattr(app_module.speech, "synthesize_base64", lambda text: "UklGRg==")
+    response = client.post("/api/ai/gemini", json={"prompt": "limping cat"})
+    assert response.status_code == 200
+    assert response.json() == {"text": "Advice for: limping cat", "audio_base64": "UklGRg=="}
+
+
+def test_answer_without_audio_says_why(app_module, client, monkeypatch):
+    monkeypatch.setattr(gemini, "_model", FakeModel())
+    monkeypatch.setattr(app_module.speech, "synthesize_base64", lambda text: None)
+    response = client.post("/api/ai/gemini", json={"prompt": "limping cat"})
+    assert response.json()["audio_base64"] is None
+    assert response.headers["X-TTS-Skipped"] == "unavailable"
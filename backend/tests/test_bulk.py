@@ -0,0 +1,98 @@
+"""Bulk reminder and vaccination endpoints: per-item results and id mapping."""
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def owner(make_user, make_pet):
+    user, headers = make_user()
+    return user, headers, make_pet(user), make_pet(user, "Pepper")
+
+
+def _reminder(pet_id, title):
+    return {"pet_id": pet_id, "title": title, "checkup_type": "annual", "due_date": "2026-11-01T09:00:00", "due_time": "09:00"}
+
+
+def _vaccine(pet_id, name, **fields):
+    return {"pet_id": pet_id, "vaccine_name": name, "vaccine_type": "core", **fields}
+
+
+def test_bulk_create_maps_each_id_to_its_item(app_module, db, client, owner, make_user, make_pet):
+    user, headers, pet, other_pet = owner
+    stranger_pet = make_pet(make_user("Stranger")[0])
+    items = [
+        _reminder(pet.id, "Dental"),
+        _reminder(stranger_pet.id, "Not mine"),
+        _reminder(other_pet.id, "Booster check"),
+        _reminder(pet.id, "Weigh-in"),
+        _reminder(999999, "No such pet"),
+        _reminder(other_pet.id, "Eye exam"),
+    ]
+    body = client.post("/api/checkup-reminders/bulk", json={"items": items}, headers=headers).json()
+
+    assert (body["succeeded"], body["failed"]) == (4, 2)
+    assert [result["index"] for result in body["results"]] == list(range(len(items)))
+    for item, result in zip(items, body["results"]):
+        if item["title"] in ("Not mine", "No such pet"):
+            assert (result["status"], result["detail"], result["id"]) == ("error", "Pet not found", None)
+            continue
+        assert result["status"] == "created"
+        stored = db.get(app_module.CheckupReminder, result["id"])
+        assert (stored.title, stored.pet_id) == (item["title"], item["pet_id"])
+
+
+def test_bulk_vaccinations_validate_each_item(app_module, db, client, owner):
+    user, headers, pet, _ = owner
+    items = [
+        _vaccine(pet.id, "Rabies", date_administered="2025-03-01T10:00:00"),
+        _vaccine(pet.id, "DHPP"),
+        _vaccine(pet.id, "Leptospirosis", is_scheduled=True, scheduled_date="2026-12-01T10:00:00", scheduled_time="10:00"),
+        _vaccine(pet.id, "Bordetella", is_scheduled=True),
+    ]
+    body = client.post("/api/vaccinations/bulk", json={"items": items}, headers=headers).json()
+    assert [result["status"] for result in body["results"]] == ["created", "error", "created", "error"]
+    assert body["results"][1]["detail"] == "Recorded vaccinations need date_administered"
+    assert db.get(app_module.Vaccination, body["results"][2]["id"]).vaccine_name == "Leptospirosis"
+
+    atomic = client.post("/api/vaccinations/bulk?atomic=true", json={"items": items}, headers=headers)
+    assert atomic.status_code == 400
+    assert db.query(app_module.Vaccination).filter(app_module.Vaccination.pet_id == pet.id).count() == 2
+
+
+def test_bulk_complete_leaves_administered_vaccinations_alone(app_module, db, client, owner):
+    user, headers, pet, _ = owner
+    Vaccination = app_module.Vaccination
+    given = Vaccination(pet_id=pet.id, vaccine_name="Rabies", vaccine_type="core", is_scheduled=False,
+                        date_administered=datetime(2024, 1, 1, 9, 30))
+    due = Vaccination(pet_id=pet.id, vaccine_name="DHPP", vaccine_type="core", is_scheduled=True,
+                      scheduled_date=datetime(2026, 12, 1), scheduled_time="10:00")
+    db.add_all([given, due])
+    db.commit()
+
+    body = client.post("/api/vaccinations/bulk-complete", json={"ids": [given.id, due.id, 999999]}, headers=headers).json()
+    assert [(result["id"], result["status"], result["detail"]) for result in body["results"]] == [
+        (given.id, "error", "Already administered"),
+        (due.id, "completed", None),
+        (999999, "error", "Not found"),
+    ]
+    db.expire_all()
+    assert db.get(Vaccination, given.id).date_administered == datetime(2024, 1, 1, 9, 30)
+    assert db.get(Vaccination, due.id).is_scheduled is False
+    assert db.get(app_module.Pet, pet.id).last_vaccination >= datetime(2024, 1, 1, 9, 30)
+
+
+def test_bulk_delete_reports_other_users_ids_as_not_found(app_module, db, client, owner, make_user, make_pet):
+    user, headers, pet, _ = owner
+    stranger_pet = make_pet(make_user("Stranger")[0])
+    mine = app_module.CheckupReminder(pet_id=pet.id, title="Mine", checkup_type="annual", due_date=datetime(2026, 11, 1), due_time="09:00")
+    theirs = app_module.CheckupReminder(pet_id=stranger_pet.id, title="Theirs", checkup_type="annual", due_date=datetime(2026, 11, 1), due_time="09:00")
+    db.add_all([mine, theirs])
+    db.commit()
+    mine_id, theirs_id = mine.id, theirs.id
+
+    body = client.post("/api/checkup-reminders/bulk-delete", json={"ids": [theirs_id, mine_id]}, headers=headers).json()
+    assert [(result["id"], result["status"]) for result in body["results"]] == [(theirs_id, "error"), (mine_id, "deleted")]
+    db.expire_all()
+    assert db.get(app_module.CheckupReminder, theirs_id) is not None
+    assert db.get(app_module.CheckupReminder, mine_id) is None
@@ -0,0 +1,65 @@
+"""Crutch volunteer occupancy: the sweep lines in capacity and the booking limit built on them."""
+from datetime import date, datetime
+
+import pytest
+
+import capacity
+
+
+def d(day, hour=0):
+    return datetime(2026, 11, day, hour)
+
+
+def test_peak_occupancy_counts_only_simultaneous_stays():
+    stays = [(d(1), d(5)), (d(3), d(8)), (d(5), d(6)), (d(10), d(12))]
+    assert capacity.peak_occupancy(stays, d(1), d(20)) == 2
+    # Back-to-back: the first stay leaves at the instant the third arrives
+    assert capacity.peak_occupancy([(d(1), d(5)), (d(5), d(6))], d(1), d(20)) == 1
+    # Stays are clipped to the window; one that only touches its edge does not count
+    assert capacity.peak_occupancy(stays, d(8), d(10)) == 0
+    assert capacity.peak_occupancy(stays, d(4), d(5)) == 2
+    assert capacity.peak_occupancy([], d(1), d(2)) == 0
+
+
+def test_daily_occupancy_reports_each_days_peak():
+    stays = [(d(1, 12), d(3, 9)), (d(2, 8), d(2, 10)), (d(2, 9), d(4)), (d(5), d(6))]
+    assert capacity.daily_occupancy(stays, date(2026, 11, 1), date(2026, 11, 6)) == [
+        (date(2026, 11, 1), 1),
+        (date(2026, 11, 2), 3),  # all three overlap 09:00-10:00
+        (date(2026, 11, 3), 2),
+        (date(2026, 11, 4), 0),  # the stay ending at midnight is gone
+        (date(2026, 11, 5), 1),
+        (date(2026, 11, 6), 0),
+    ]
+
+
+@pytest.fixture
+def volunteer(app_module, db, make_user, make_pet):
+    user, headers = make_user()
+    pet = make_pet(user)
+    row = app_module.CrutchVolunteer(name=f"Volunteer {pet.id}", rate_per_day=400, max_concurrent_pets=2)
+    db.add(row)
+    db.commit()
+
+    def book(client, pickup, dropoff):
+        return client.post("/api/crutch-bookings", headers=headers, json={
+            "pet_id": pet.id, "volunteer_id": row.id, "pickup_date": pickup.isoformat(),
+            "dropoff_date": dropoff.isoformat(), "pickup_address": "A", "dropoff_address": "B",
+        })
+    book.id = row.id
+    return book
+
+
+def test_bookings_stop_at_max_concurrent_pets(client, volunteer):
+    assert volunteer(client, d(1), d(5)).status_code == 200
+    assert volunteer(client, d(3), d(8)).status_code == 200
+    assert volunteer(client, d(4), d(6)).status_code == 409
+    # Starts when the first stay ends, so only one other pet is present
+    assert volunteer(client, d(5), d(7)).status_code == 200
+    assert volunteer(client, d(1), d(1)).status_code == 400
+
+    days = client.get(f"/api/crutch-volunteers/{volunteer.id}/occupancy",
+                      params={"start_date": "2026-11-01", "end_date": "2026-11-08"}).json()["days"]
+    assert [(day["booked"], day["available"]) for day in days] == [
+        (1, 1), (1, 1), (2, 0), (2, 0), (2, 0), (2, 0), (1, 1), (0, 2),
+    ]
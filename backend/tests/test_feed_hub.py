@@ -0,0 +1,75 @@
+"""FeedHub fan-out: every subscriber gets each event; a full queue evicts only its own subscriber."""
+import asyncio
+
+import feed_hub
+
+
+async def _drain(subscription, quiet_s=0.05):
+    """Events a subscription yields until its stream ends or is quiet for `quiet_s`."""
+    received = []
+    async for data in subscription.events(heartbeat_s=quiet_s):
+        if data is None:
+            break
+        received.append(data)
+    return received
+
+
+def test_every_subscriber_gets_the_same_event():
+    async def scenario():
+        hub = feed_hub.FeedHub(queue_size=4)
+        await hub.start()
+        first, second = hub.subscribe(), hub.subscribe()
+        hub.publish(b"one")
+        hub.publish(b"two")
+        await asyncio.sleep(0)  # LocalBroker delivers from a task
+        received = await _drain(first), await _drain(second)
+        await hub.close()
+        return received
+
+    first, second = asyncio.run(scenario())
+    assert first == second == [b"one", b"two"]
+
+
+def test_slow_subscriber_is_evicted_without_holding_up_the_rest():
+    async def scenario():
+        hub = feed_hub.FeedHub(queue_size=2)
+        await hub.start()
+        slow, fast = hub.subscribe(), hub.subscribe()
+        fast_received = []
+        for i in range(3):
+            hub.publish(f"event {i}".encode())
+            await asyncio.sleep(0)
+            # The fast reader keeps up; the slow one never reads
+            fast_received.append(fast.queue.get_nowait())
+        slow_received = await _drain(slow)
+        state = (slow.evicted, fast.evicted, hub.evictions, hub.subscriber_count)
+        await hub.close()
+        return fast_received, slow_received, state
+
+    fast_received, slow_received, state = asyncio.run(scenario())
+    assert fast_received == [b"event 0", b"event 1", b"event 2"]
+    # Evicted: its backlog is dropped and its stream ends (the client refetches)
+    assert slow_received == []
+    assert state == (True, False, 1, 1)
+
+
+def test_disconnect_all_ends_every_stream():
+    async def scenario():
+        hub = feed_hub.FeedHub()
+        await hub.start()
+        subscriptions = [hub.subscribe() for _ in range(3)]
+        # Readers that would wait far longer than the test for a heartbeat
+        waiting = [asyncio.ensure_future(_drain(s, quiet_s=60)) for s in subscriptions]
+        await asyncio.sleep(0)
+        hub.disconnect_all()
+        ended = await asyncio.wait_for(asyncio.gather(*waiting), 1)
+        return ended, hub.subscriber_count
+
+    assert asyncio.run(scenario()) == ([[], [], []], 0)
+
+
+def test_publish_before_start_is_a_no_op():
+    hub = feed_hub.FeedHub()
+    subscription = hub.subscribe()
+    hub.publish(b"ignored")
+    assert subscription.queue.empty()
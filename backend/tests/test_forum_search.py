@@ -0,0 +1,66 @@
+"""Forum search with and without the SQLite FTS index."""
+import pytest
+from sqlalchemy import text
+
+import forum_search
+
+
+def _add_thread(app_module, db, word):
+    """A post with `word` in its title, one with it only in the body, and a comment using it."""
+    Post, Comment = app_module.CommunityPost, app_module.Comment
+    titled = Post(title=f"{word.title()} season tips", content="Check your dog after every walk")
+    body = Post(title="Evening walks", content=f"{word.title()}s hide in long grass near the lake")
+    db.add_all([titled, body])
+    db.flush()
+    comment = Comment(post_id=body.id, content=f"A {word} collar helped our beagle")
+    db.add(comment)
+    db.commit()
+    return titled, body, comment
+
+
+def _all_pages(db, q):
+    hits, cursor = forum_search.search(db.connection(), q, limit=1)
+    while cursor:
+        page, cursor = forum_search.search(db.connection(), q, limit=1, cursor=cursor)
+        hits += page
+    return hits
+
+
+@pytest.fixture
+def without_index(app_module):
+    """Drop forum_fts and its triggers, as a failed ensure_index leaves things, and rebuild afterwards."""
+    with app_module.engine.begin() as conn:
+        for (name,) in conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE :prefix"
+        ), {"prefix": f"{forum_search.TABLE}_%"}).all():
+            conn.execute(text(f"DROP TRIGGER {name}"))
+        conn.execute(text(f"DROP TABLE {forum_search.TABLE}"))
+    yield
+    forum_search.ensure_index(app_module.engine)
+
+
+def test_index_ranks_title_hits_first(app_module, db):
+    titled, body, comment = _add_thread(app_module, db, "tick")
+    hits = _all_pages(db, "tick")
+    assert (hits[0]["kind"], hits[0]["post_id"]) == ("post", titled.id)
+    assert "<mark>" in hits[0]["snippet"]
+
+
+def test_search_falls_back_to_a_scan_without_the_index(app_module, db, without_index):
+    titled, body, comment = _add_thread(app_module, db, "flea")
+    assert not forum_search.has_index(db.connection())
+
+    hits = _all_pages(db, "flea")
+    found = [(hit["kind"], hit["post_id"], hit["comment_id"]) for hit in hits]
+    assert found[0] == ("post", titled.id, None)
+    assert sorted(found[1:]) == [("comment", body.id, comment.id), ("post", body.id, None)]
+    assert hits[0]["snippet"].startswith("<mark>Flea</mark> season")
+    assert forum_search.search(db.connection(), "flea_%", limit=5) == ([], None)
+
+
+def test_startup_survives_a_failing_index(app_module, monkeypatch):
+    def no_fts5(engine):
+        raise RuntimeError("no such module: fts5")
+
+    monkeypatch.setattr(forum_search, "ensure_index", no_fts5)
+    app_module.init_default_data()
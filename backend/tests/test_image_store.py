@@ -0,0 +1,65 @@
+"""ImageStore: streamed multipart uploads, dedupe and pool-built thumbnails."""
+import asyncio
+import io
+import os
+
+import pytest
+from PIL import Image
+
+import image_store
+
+BOUNDARY = "furrstaid-test-boundary"
+
+
+def _png(width=1200, height=800):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 120, 40)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _multipart(payload: bytes, filename="photo.png"):
+    return (
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"caption\"\r\n\r\nhello\r\n"
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n"
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + payload + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+async def _chunks(body: bytes, size=1000):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def _save(store, body):
+    return asyncio.run(store.save_multipart(f"multipart/form-data; boundary={BOUNDARY}", _chunks(body)))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = image_store.ImageStore(root=str(tmp_path), max_bytes=1024 * 1024, workers=1)
+    yield store
+    store.close()
+
+
+def test_upload_is_stored_once_under_its_digest(store):
+    body = _multipart(_png())
+    first, second = _save(store, body), _save(store, body)
+    assert (first.digest, first.extension, first.created) == (second.digest, "png", True)
+    assert second.created is False
+    assert os.path.exists(store.original_path(first.digest, "png"))
+    assert [name for name in os.listdir(store.root) if name.startswith("upload-")] == []
+
+
+def test_thumbnails_are_built_in_the_pool(store):
+    stored = _save(store, _multipart(_png()))
+    asyncio.run(store.ensure_thumbnails(stored))
+    with Image.open(store.thumbnail_path(stored.digest, 320)) as thumb:
+        assert thumb.size == (320, 213)
+
+
+@pytest.mark.parametrize("payload, status", [(b"not an image at all", 415), (b"\x89PNG\r\n\x1a\n" + b"\0" * (2 * 1024 * 1024), 413)])
+def test_rejected_uploads_leave_no_files(store, payload, status):
+    with pytest.raises(image_store.UploadRejected) as rejected:
+        _save(store, _multipart(payload))
+    assert rejected.value.status_code == status
+    assert os.listdir(store.root) == []
@@ -0,0 +1,74 @@
+"""Likes: idempotent set/unset, the toggle, and like_count under parallel requests."""
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+
+@pytest.fixture
+def users(app_module, db):
+    User = app_module.User
+    users = [User(name=f"Liker {i}", email=f"liker{i}-{random.random()}@example.com", hashed_password="x") for i in range(20)]
+    db.add_all(users)
+    db.commit()
+    return [user.id for user in users]
+
+
+@pytest.fixture
+def post_id(app_module, db):
+    post = app_module.CommunityPost(title="Rescue update", content="Milo found a home")
+    db.add(post)
+    db.commit()
+    return post.id
+
+
+def _stored(app_module, db, post_id):
+    """(like rows, distinct likers, like_count) for the post, read fresh."""
+    likes, posts = app_module.Like.__table__, app_module.CommunityPost.__table__
+    db.expire_all()
+    rows, likers = db.execute(select(func.count(), func.count(likes.c.user_id.distinct())).where(likes.c.post_id == post_id)).one()
+    return rows, likers, db.execute(select(posts.c.like_count).where(posts.c.id == post_id)).scalar()
+
+
+def _parallel(app_module, calls, workers=16):
+    def run(call):
+        op, post_id, user_id = call
+        db = app_module.SessionLocal()
+        try:
+            if op == "toggle":
+                changed, _ = app_module._set_like(db, post_id, user_id, False)
+                if not changed:
+                    app_module._set_like(db, post_id, user_id, True)
+            else:
+                app_module._set_like(db, post_id, user_id, op == "like")
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(run, calls))
+
+
+def test_parallel_double_taps_store_one_like_each(app_module, db, users, post_id):
+    _parallel(app_module, [("like", post_id, user_id) for user_id in users for _ in range(50)])
+    assert _stored(app_module, db, post_id) == (len(users), len(users), len(users))
+
+    _parallel(app_module, [("unlike", post_id, user_id) for user_id in users for _ in range(50)])
+    assert _stored(app_module, db, post_id) == (0, 0, 0)
+
+
+def test_parallel_mixed_toggles_keep_like_count_exact(app_module, db, users, post_id):
+    rng = random.Random(42)
+    calls = [(rng.choice(("toggle", "like", "unlike")), post_id, rng.choice(users)) for _ in range(1000)]
+    _parallel(app_module, calls)
+    rows, likers, like_count = _stored(app_module, db, post_id)
+    assert rows == likers == like_count
+
+
+def test_liking_a_missing_post_is_404(app_module, db, users):
+    token = app_module.create_access_token({"sub": db.get(app_module.User, users[0]).email})
+    client = TestClient(app_module.app)
+    for method in ("put", "post", "delete"):
+        response = client.request(method, "/api/community/posts/999999/like", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 404, method
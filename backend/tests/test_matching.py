@@ -0,0 +1,59 @@
+"""Species bitmasks and the ranked walker search built on them."""
+import itertools
+
+import pytest
+
+import matching
+
+_names = itertools.count(1)
+
+
+def test_category_mask_reads_plural_and_singular_names():
+    assert matching.category_mask("Dogs, cats") == matching.CATEGORY_BITS["dogs"] | matching.CATEGORY_BITS["cats"]
+    assert matching.category_mask("Dog,Hamster") == matching.category_mask("dogs,hamsters")
+    assert matching.category_mask("Dogs,Dragons") == matching.CATEGORY_BITS["dogs"]
+    assert matching.category_mask(None) == matching.category_mask("") == 0
+
+
+def test_species_mask_rejects_unknown_species():
+    assert matching.species_mask(["Dog", "Bird"]) == matching.CATEGORY_BITS["dogs"] | matching.CATEGORY_BITS["birds"]
+    assert matching.species_mask(None) == 0
+    with pytest.raises(ValueError, match="Dragon"):
+        matching.species_mask(["Dragon"])
+
+
+@pytest.fixture
+def walkers(app_module, db):
+    """Walkers in a rate band of their own, so other tests' walkers stay out of the results."""
+    rate = 5000 + next(_names) * 100
+    rows = {
+        "dogs_cats": app_module.Walker(name=f"DC {rate}", rate_per_hour=rate + 30, rating=4.0, categories="Dogs,Cats"),
+        "dogs": app_module.Walker(name=f"D {rate}", rate_per_hour=rate + 10, rating=4.8, categories="Dogs"),
+        "cats": app_module.Walker(name=f"C {rate}", rate_per_hour=rate + 20, rating=4.5, categories="Cats"),
+        "inactive": app_module.Walker(name=f"I {rate}", rate_per_hour=rate, rating=5.0, categories="Dogs", is_active=False),
+    }
+    db.add_all(rows.values())
+    db.commit()
+    ids = {key: walker.id for key, walker in rows.items()}
+    return ids, {"min_rate": rate, "max_rate": rate + 99}
+
+
+def _search(client, band, **params):
+    body = client.get("/api/walkers/search", params={**band, **params}).json()
+    return [walker["id"] for walker in body["items"]], body["next_offset"]
+
+
+def test_search_filters_by_every_requested_species(client, walkers):
+    ids, band = walkers
+    assert _search(client, band, species=["Dog"])[0] == [ids["dogs"], ids["dogs_cats"]]
+    assert _search(client, band, species=["Dog", "Cat"])[0] == [ids["dogs_cats"]]
+    assert client.get("/api/walkers/search", params={"species": "Dragon"}).status_code == 400
+
+
+def test_search_ranks_and_pages(client, walkers):
+    ids, band = walkers
+    assert _search(client, band, sort="price")[0] == [ids["dogs"], ids["cats"], ids["dogs_cats"]]
+    first, next_offset = _search(client, band, limit=2)
+    assert (first, next_offset) == ([ids["dogs"], ids["cats"]], 2)
+    assert _search(client, band, limit=2, offset=next_offset) == ([ids["dogs_cats"]], None)
+    assert client.get("/api/walkers/search", params={"sort": "distance"}).status_code == 400
@@ -0,0 +1,17 @@
+"""/metrics is only served to scrapers holding METRICS_TOKEN."""
+from fastapi.testclient import TestClient
+
+
+def test_metrics_is_off_without_a_token(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "METRICS_TOKEN", None)
+    assert TestClient(app_module.app).get("/metrics").status_code == 404
+
+
+def test_metrics_needs_the_bearer_token(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "METRICS_TOKEN", "scrape-secret")
+    client = TestClient(app_module.app)
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "db_pool_checked_out" in response.text
@@ -0,0 +1,31 @@
+"""parse_hours across the stored formats."""
+from opening_hours import MINUTES_PER_DAY, MINUTES_PER_WEEK, is_open_at, parse_hours
+
+
+def test_always_open_applies_to_its_own_days_only():
+    intervals = parse_hours("Monday: Open 24 hours; Tuesday: 9:00 AM – 6:00 PM; Sunday: Closed")
+    assert intervals == [[0, MINUTES_PER_DAY], [MINUTES_PER_DAY + 540, MINUTES_PER_DAY + 1080]]
+    sunday_3am = 6 * MINUTES_PER_DAY + 180
+    assert not is_open_at(intervals, sunday_3am)
+
+
+def test_always_open_without_days_covers_the_week():
+    assert parse_hours("Open 24 hours") == [[0, MINUTES_PER_WEEK]]
+    assert parse_hours("24/7") == [[0, MINUTES_PER_WEEK]]
+
+
+def test_closed_is_matched_as_a_word():
+    assert parse_hours("Mo-Fr 08:00-18:00 (takeoff desk)") == [
+        [day * MINUTES_PER_DAY + 480, day * MINUTES_PER_DAY + 1080] for day in range(5)
+    ]
+    assert parse_hours("Mo-Sa 09:00-18:00; Su off")[-1] == [5 * MINUTES_PER_DAY + 540, 5 * MINUTES_PER_DAY + 1080]
+
+
+def test_osm_split_shifts_and_past_midnight():
+    assert parse_hours("Mo 09:00-13:00,15:00-19:00") == [[540, 780], [900, 1140]]
+    assert parse_hours("Su 20:00-02:00") == [[0, 120], [6 * MINUTES_PER_DAY + 1200, MINUTES_PER_WEEK]]
+
+
+def test_unparseable_text_is_none():
+    assert parse_hours("call ahead") is None
+    assert parse_hours("") is None
@@ -0,0 +1,102 @@
+"""Owner-scoped routes: one user's pets and their records are invisible to everyone else."""
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def bob(app_module, db, make_user, make_pet):
+    """Another user's pet with one of each pet-scoped record; returns their ids."""
+    user, headers = make_user("Bob")
+    pet = make_pet(user, "Rex")
+    walker = app_module.Walker(name=f"Walker for pet {pet.id}", rate_per_hour=200)
+    volunteer = app_module.CrutchVolunteer(name=f"Volunteer for pet {pet.id}", rate_per_day=400)
+    db.add_all([walker, volunteer])
+    db.flush()
+    records = {
+        "reminder": app_module.CheckupReminder(pet_id=pet.id, title="Dental", checkup_type="dental",
+                                               due_date=datetime(2026, 11, 1), due_time="09:00"),
+        "vaccination": app_module.Vaccination(pet_id=pet.id, vaccine_name="Rabies", vaccine_type="core",
+                                              is_scheduled=True, scheduled_date=datetime(2026, 12, 1), scheduled_time="10:00"),
+        "weight_log": app_module.WeightLog(pet_id=pet.id, weight_kg=21.0, date=datetime(2026, 10, 1)),
+        "walk_booking": app_module.WalkBooking(pet_id=pet.id, walker_id=walker.id, scheduled_date=datetime(2026, 11, 2),
+                                               scheduled_time="08:00", duration_minutes=30, total_cost=100),
+        "crutch_booking": app_module.CrutchBooking(pet_id=pet.id, volunteer_id=volunteer.id, pickup_date=datetime(2026, 11, 3),
+                                                   dropoff_date=datetime(2026, 11, 4), pickup_address="A", dropoff_address="B",
+                                                   total_cost=400),
+    }
+    db.add_all(records.values())
+    db.commit()
+    return {"headers": headers, "pet": pet.id, "walker": walker.id, "volunteer": volunteer.id,
+            **{name: row.id for name, row in records.items()}}
+
+
+@pytest.fixture
+def alice(make_user):
+    return make_user("Alice")[1]
+
+
+def test_other_users_pet_is_404(client, bob, alice):
+    pet = bob["pet"]
+    assert client.get(f"/api/pets/{pet}", headers=bob["headers"]).status_code == 200
+    assert client.get(f"/api/pets/{pet}", headers=alice).status_code == 404
+    assert client.put(f"/api/pets/{pet}", json={"name": "Mine now"}, headers=alice).status_code == 404
+    assert client.delete(f"/api/pets/{pet}", headers=alice).status_code == 404
+    assert client.get(f"/api/pets/{pet}/vaccination-plan", headers=alice).status_code == 404
+    assert pet not in {p["id"] for p in client.get("/api/pets", headers=alice).json()}
+    assert client.get(f"/api/pets/{pet}", headers=bob["headers"]).json()["name"] == "Rex"
+
+
+def test_other_users_checkup_reminder_is_404(client, bob, alice):
+    reminder = bob["reminder"]
+    assert client.get(f"/api/checkup-reminders/{reminder}", headers=bob["headers"]).status_code == 200
+    assert client.get(f"/api/checkup-reminders/{reminder}", headers=alice).status_code == 404
+    assert client.put(f"/api/checkup-reminders/{reminder}", json={"title": "x"}, headers=alice).status_code == 404
+    assert client.delete(f"/api/checkup-reminders/{reminder}", headers=alice).status_code == 404
+    assert client.get(f"/api/checkup-reminders/{reminder}", headers=bob["headers"]).json()["title"] == "Dental"
+    assert client.get("/api/checkup-reminders", params={"pet_id": bob["pet"]}, headers=alice).status_code == 404
+    assert client.post("/api/checkup-reminders", headers=alice, json={
+        "pet_id": bob["pet"], "title": "x", "checkup_type": "annual", "due_date": "2026-11-01T09:00:00", "due_time": "09:00",
+    }).status_code == 404
+
+
+def test_other_users_vaccination_is_404(client, bob, alice):
+    vaccination = bob["vaccination"]
+    assert client.get(f"/api/vaccinations/{vaccination}", headers=bob["headers"]).status_code == 200
+    assert client.get(f"/api/vaccinations/{vaccination}", headers=alice).status_code == 404
+    assert client.put(f"/api/vaccinations/{vaccination}", json={"notes": "x"}, headers=alice).status_code == 404
+    assert client.delete(f"/api/vaccinations/{vaccination}", headers=alice).status_code == 404
+    assert client.get(f"/api/vaccinations/{vaccination}", headers=bob["headers"]).json()["notes"] is None
+    assert client.get("/api/vaccinations", params={"pet_id": bob["pet"]}, headers=alice).status_code == 404
+    assert client.post("/api/vaccinations/record", headers=alice, json={
+        "pet_id": bob["pet"], "vaccine_name": "DHPP", "vaccine_type": "core", "date_administered": "2026-01-01T10:00:00",
+    }).status_code == 404
+    assert vaccination not in {v["id"] for v in client.get("/api/vaccinations", headers=alice).json()}
+
+
+def test_other_users_weight_logs_are_404(client, bob, alice):
+    assert client.get("/api/weight-logs", params={"pet_id": bob["pet"]}, headers=bob["headers"]).status_code == 200
+    assert client.get("/api/weight-logs", params={"pet_id": bob["pet"]}, headers=alice).status_code == 404
+    assert client.post("/api/weight-logs", headers=alice, json={
+        "pet_id": bob["pet"], "weight_kg": 1.0, "date": "2026-10-02T00:00:00",
+    }).status_code == 404
+
+
+def test_other_users_walk_bookings_are_404(client, bob, alice):
+    assert bob["walk_booking"] in {b["id"] for b in client.get("/api/walk-bookings", headers=bob["headers"]).json()}
+    assert bob["walk_booking"] not in {b["id"] for b in client.get("/api/walk-bookings", headers=alice).json()}
+    assert client.get("/api/walk-bookings", params={"pet_id": bob["pet"]}, headers=alice).status_code == 404
+    assert client.post("/api/walk-bookings", headers=alice, json={
+        "pet_id": bob["pet"], "walker_id": bob["walker"], "scheduled_date": "2026-11-05T00:00:00",
+        "scheduled_time": "08:00", "duration_minutes": 30,
+    }).status_code == 404
+
+
+def test_other_users_crutch_bookings_are_404(client, bob, alice):
+    assert bob["crutch_booking"] in {b["id"] for b in client.get("/api/crutch-bookings", headers=bob["headers"]).json()}
+    assert bob["crutch_booking"] not in {b["id"] for b in client.get("/api/crutch-bookings", headers=alice).json()}
+    assert client.get("/api/crutch-bookings", params={"pet_id": bob["pet"]}, headers=alice).status_code == 404
+    assert client.post("/api/crutch-bookings", headers=alice, json={
+        "pet_id": bob["pet"], "volunteer_id": bob["volunteer"], "pickup_date": "2026-11-06T09:00:00",
+        "dropoff_date": "2026-11-07T09:00:00", "pickup_address": "A", "dropoff_address": "B",
+    }).status_code == 404
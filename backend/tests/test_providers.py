@@ -0,0 +1,30 @@
+"""Creating vets, walkers and crutch volunteers under their unique indexes."""
+import pytest
+
+
+@pytest.mark.parametrize("path, payload, detail", [
+    ("/api/vets", {"name": "Jayanagar Pet Care", "address": "11th Main", "latitude": 12.93, "longitude": 77.58},
+     "Vet already exists"),
+    ("/api/walkers", {"name": "Asha the walker", "rate_per_hour": 300}, "Walker with this name already exists"),
+    ("/api/crutch-volunteers", {"name": "Ravi the volunteer", "rate_per_day": 500},
+     "Volunteer with this name already exists"),
+])
+def test_second_create_is_a_400_not_a_500(client, path, payload, detail):
+    assert client.post(path, json=payload).status_code == 200
+    response = client.post(path, json=payload)
+    assert (response.status_code, response.json()["detail"]) == (400, detail)
+
+
+def test_insert_racing_past_the_name_check_is_a_400(app_module, db, client, monkeypatch):
+    """The pre-query missed a walker another request is inserting; the unique index catches it."""
+    db.add(app_module.Walker(name="Meera the walker", rate_per_hour=250))
+    db.commit()
+    real_query = app_module.Session.query
+
+    def query_without_name_check(self, *entities, **kwargs):
+        query = real_query(self, *entities, **kwargs)
+        return query.filter(False) if entities == (app_module.Walker.id,) else query
+
+    monkeypatch.setattr(app_module.Session, "query", query_without_name_check)
+    response = client.post("/api/walkers", json={"name": "Meera the walker", "rate_per_hour": 250})
+    assert response.status_code == 400
@@ -0,0 +1,58 @@
+"""speech.synthesize_base64 against a fake pyttsx3 that, like the real one, shares one engine per process."""
+import base64
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import speech
+
+
+class FakeEngine:
+    def __init__(self):
+        self.in_loop = False
+        self.threads = set()
+        self._path = None
+
+    def getProperty(self, name):
+        return 200
+
+    def setProperty(self, name, value):
+        pass
+
+    def save_to_file(self, text, path):
+        self._path, self._text = path, text
+
+    def runAndWait(self):
+        if self.in_loop:
+            raise RuntimeError("run loop already started")
+        self.in_loop = True
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        with open(self._path, "wb") as f:
+            f.write(self._text.encode())
+        self.in_loop = False
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = FakeEngine()
+    monkeypatch.setitem(sys.modules, "pyttsx3", types.SimpleNamespace(init=lambda: engine))
+    monkeypatch.setattr(speech, "_engine", None)
+    return engine
+
+
+def test_concurrent_calls_share_one_engine_on_one_thread(engine):
+    texts = [f"answer {i}" for i in range(8)]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(speech.synthesize_base64, texts))
+    assert [base64.b64decode(result).decode() for result in results] == texts
+    assert len(engine.threads) == 1 and threading.get_ident() not in engine.threads
+
+
+def test_engine_failure_is_no_audio(engine, monkeypatch):
+    monkeypatch.setattr(engine, "runAndWait", lambda: (_ for _ in ()).throw(OSError("no audio device")))
+    assert speech.synthesize_base64("hello") is None
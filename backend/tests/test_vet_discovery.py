@@ -0,0 +1,143 @@
+"""VetDiscovery against local stub Google Places / Overpass servers."""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import vet_discovery
+
+
+class StubProviders:
+    """One HTTP server answering GET as Google Places nearbysearch and POST as Overpass."""
+
+    def __init__(self, places, elements):
+        self.places = places
+        self.elements = elements
+        self.calls = {"google": 0, "overpass": 0}
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                stub.calls["google"] += 1
+                self._reply({"status": "OK", "results": stub.places})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub.calls["overpass"] += 1
+                self._reply({"elements": stub.elements})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _place(place_id, name, lat, lon, vicinity):
+    return {"place_id": place_id, "name": name, "vicinity": vicinity,
+            "geometry": {"location": {"lat": lat, "lng": lon}}, "opening_hours": {"open_now": True}}
+
+
+def _node(node_id, name, lat, lon):
+    return {"type": "node", "id": node_id, "lat": lat, "lon": lon, "tags": {"amenity": "veterinary", "name": name}}
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    providers = StubProviders([], [])
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "test-key")
+    monkeypatch.setattr(vet_discovery, "GOOGLE_PLACES_URL", providers.url)
+    monkeypatch.setattr(vet_discovery, "OVERPASS_URL", providers.url)
+    yield providers
+    providers.close()
+
+
+def _discovery(app_module):
+    return vet_discovery.VetDiscovery(app_module.Vet, app_module.VetDiscoveryTile, providers=dict(vet_discovery.PROVIDERS))
+
+
+async def _ensure(discovery, db, lat, lon):
+    try:
+        return await discovery.ensure_tile(db, lat, lon)
+    finally:
+        await discovery.aclose()
+
+
+def test_first_search_fans_out_then_tile_is_cached(app_module, db, stub):
+    lat, lon = 12.9716, 77.5946
+    stub.places = [_place(f"gp-a{i}", f"Indiranagar Pet Clinic {i}", lat + i * 0.002, lon, f"{i} CMH Road") for i in range(4)]
+    # Clinics 2 and 3 are also on OSM, a few metres off: stored once each
+    stub.elements = [_node(500 + i, f"Indiranagar Pet Clinic {i}", lat + i * 0.002 + 0.0002, lon) for i in range(2, 6)]
+    discovery = _discovery(app_module)
+
+    assert asyncio.run(_ensure(discovery, db, lat, lon)) is True
+    assert asyncio.run(_ensure(discovery, db, lat + 0.001, lon)) is False
+    assert stub.calls == {"google": 1, "overpass": 1}
+
+    Vet = app_module.Vet
+    names = [name for (name,) in db.query(Vet.name).filter(Vet.name.like("Indiranagar Pet Clinic %"))]
+    assert sorted(names) == [f"Indiranagar Pet Clinic {i}" for i in range(6)]
+
+
+def test_listing_with_a_seeded_vets_name_and_address_merges_into_it(app_module, db, stub):
+    Vet = app_module.Vet
+    # Same name and address as a listing below, but far enough away not to count as nearby
+    db.add(Vet(name="Koramangala Animal Hospital", address="80 Feet Road", latitude=13.5, longitude=77.0))
+    db.commit()
+    lat, lon = 12.9352, 77.6245
+    stub.places = [_place("gp-k1", "Koramangala Animal Hospital", lat, lon, "80 Feet Road")]
+
+    assert asyncio.run(_ensure(_discovery(app_module), db, lat, lon)) is True
+    rows = db.query(Vet).filter(Vet.name == "Koramangala Animal Hospital").all()
+    assert len(rows) == 1
+
+
+def test_listing_stored_by_another_worker_is_reused(app_module, stub):
+    """Two workers fill the same tile: each holds only its own in-process tile lock."""
+    item = {"source": "google", "external_id": "gp-race", "name": "Whitefield Vet Care", "address": "ITPL Main Road",
+            "latitude": 12.9698, "longitude": 77.7500}
+    first, second = app_module.SessionLocal(), app_module.SessionLocal()
+    try:
+        assert _discovery(app_module).merge(first, [item]) == 1
+        # The second worker looked the listing up before the first committed, so it goes straight to insert
+        stored = _discovery(app_module)._insert(second, item)
+        assert stored is not None and stored.external_id == "gp-race"
+        second.commit()
+        assert second.query(app_module.Vet).filter(app_module.Vet.external_id == "gp-race").count() == 1
+    finally:
+        first.close()
+        second.close()
+
+
+def test_anonymous_tile_sweep_is_capped_by_the_discovery_budget(app_module, client, stub, monkeypatch):
+    import admission
+
+    monkeypatch.setattr(app_module, "vet_finder", _discovery(app_module))
+    monkeypatch.setattr(app_module, "discovery_buckets", admission.MemoryBucketStore())
+    burst = app_module.DISCOVERY_ANONYMOUS_LIMIT.burst
+    skipped = []
+    for i in range(burst + 2):
+        response = client.get("/api/vets/search", params={"latitude": 20.0 + i * 0.5, "longitude": 75.0, "by_road": False})
+        assert response.status_code == 200
+        skipped.append(response.headers.get("X-Discovery-Skipped"))
+    assert stub.calls["google"] == burst
+    assert skipped == [None] * burst + ["rate", "rate"]
+
+    # Searching an area that is already cached costs nothing
+    response = client.get("/api/vets/search", params={"latitude": 20.0, "longitude": 75.0, "by_road": False})
+    assert "X-Discovery-Skipped" not in response.headers
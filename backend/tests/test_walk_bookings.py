@@ -0,0 +1,94 @@
+"""Walk bookings: overlap checks, the duration cap and wall-clock times."""
+from datetime import datetime
+
+import pytest
+
+import scheduling
+
+
+@pytest.fixture
+def booking(app_module, db, make_user, make_pet):
+    """book(start "HH:MM", minutes) -> response, against a fresh walker for one user's pet."""
+    user, headers = make_user()
+    pet = make_pet(user)
+    walker = app_module.Walker(name=f"Walker {pet.id}", rate_per_hour=1000 + pet.id)
+    db.add(walker)
+    db.commit()
+
+    def book(client, time, minutes, date="2026-11-10T00:00:00"):
+        return client.post("/api/walk-bookings", headers=headers, json={
+            "pet_id": pet.id, "walker_id": walker.id, "scheduled_date": date,
+            "scheduled_time": time, "duration_minutes": minutes,
+        })
+    book.walker, book.pet = walker, pet
+    return book
+
+
+@pytest.fixture
+def restore_longest_walk(monkeypatch):
+    monkeypatch.setattr(scheduling, "_longest_walk_minutes", scheduling.MAX_WALK_MINUTES)
+
+
+def test_overlapping_booking_is_409(client, booking):
+    assert booking(client, "09:00", 60).status_code == 200
+    assert booking(client, "09:30", 60).status_code == 409
+    assert booking(client, "10:00", 30).status_code == 200
+
+
+def test_walks_over_the_cap_are_rejected(client, booking):
+    assert booking(client, "06:00", scheduling.MAX_WALK_MINUTES + 1).status_code == 400
+
+
+def test_legacy_walk_longer_than_the_cap_still_blocks_overlaps(app_module, db, client, booking, restore_longest_walk):
+    # Stored before the cap existed: 06:00 to 18:00
+    db.add(app_module.WalkBooking(pet_id=booking.pet.id, walker_id=booking.walker.id, scheduled_date=datetime(2026, 11, 10),
+                                  scheduled_time="06:00", duration_minutes=12 * 60, total_cost=0,
+                                  start_at=datetime(2026, 11, 10, 6), end_at=datetime(2026, 11, 10, 18)))
+    db.commit()
+    app_module.load_longest_walk()
+    assert booking(client, "15:00", 30).status_code == 409
+    assert booking(client, "18:00", 30).status_code == 200
+
+
+def test_search_compares_available_at_as_wall_clock_time(client, booking):
+    assert booking(client, "10:00", 60, date="2026-11-12T00:00:00+05:30").status_code == 200
+    walker_id = booking.walker.id
+
+    def free_at(available_at):
+        rate = booking.walker.rate_per_hour  # unique to this walker
+        params = {"available_at": available_at, "min_rate": rate, "max_rate": rate}
+        items = client.get("/api/walkers/search", params=params).json()["items"]
+        return walker_id in {walker["id"] for walker in items}
+
+    # 10:30 local, whatever offset the client attaches, is inside the 10:00-11:00 walk
+    assert not free_at("2026-11-12T10:30:00+05:30")
+    assert not free_at("2026-11-12T10:30:00")
+    assert free_at("2026-11-12T11:00:00+05:30")
+
+
+def test_free_slots_sweeps_busy_intervals_across_days():
+    from datetime import date, time
+
+    busy = [
+        (datetime(2026, 11, 9, 20), datetime(2026, 11, 10, 7)),  # overnight, spills into the next window
+        (datetime(2026, 11, 10, 9), datetime(2026, 11, 10, 10)),
+        (datetime(2026, 11, 10, 9, 30), datetime(2026, 11, 10, 11)),  # overlaps the one before
+        (datetime(2026, 11, 10, 11, 15), datetime(2026, 11, 10, 12)),  # leaves a 15-minute gap
+    ]
+    slots = scheduling.free_slots(busy, date(2026, 11, 10), date(2026, 11, 11), time(6), time(18), min_minutes=30)
+    assert slots == [
+        (datetime(2026, 11, 10, 7), datetime(2026, 11, 10, 9)),
+        (datetime(2026, 11, 10, 12), datetime(2026, 11, 10, 18)),
+        (datetime(2026, 11, 11, 6), datetime(2026, 11, 11, 18)),
+    ]
+
+
+def test_availability_lists_the_gaps_between_bookings(client, booking):
+    assert booking(client, "09:00", 60).status_code == 200
+    response = client.get(f"/api/walkers/{booking.walker.id}/availability", params={
+        "start_date": "2026-11-10", "end_date": "2026-11-10", "day_start": "08:00", "day_end": "12:00",
+    })
+    assert response.json()["slots"] == [
+        {"start": "2026-11-10T08:00:00", "end": "2026-11-10T09:00:00"},
+        {"start": "2026-11-10T10:00:00", "end": "2026-11-10T12:00:00"},
+    ]
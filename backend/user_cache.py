@@ -0,0 +1,99 @@
+"""
+Short-lived per-user cache for aggregate responses such as the dashboard.
+
+Entries expire after a TTL and are dropped as soon as a transaction that touched
+the user's rows commits. A session listener collects the owners of written
+instances (users, pets and anything with a pet_id) during flush and invalidates
+them after commit, so ORM writes never need an explicit call. Core bulk writes
+bypass the listener and call invalidate_pets()/invalidate_user() themselves.
+
+The cache is per process; with several workers the TTL bounds how long another
+worker can serve a dashboard that predates a write.
+"""
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+DASHBOARD_TTL_S = float(os.getenv("DASHBOARD_CACHE_TTL", "30"))
+
+
+class UserCache:
+    def __init__(self, ttl_s: float = DASHBOARD_TTL_S):
+        self.ttl_s = ttl_s
+        self._entries = {}    # user_id -> (expires_at, value, pet_ids)
+        self._pet_owner = {}  # pet_id -> user_id, for pets in cached entries
+        self._generation = 0  # bumped on every invalidation
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        """Read before loading; put() discards values loaded across an invalidation."""
+        return self._generation
+
+    def get(self, user_id: int):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._drop(user_id)
+                return None
+            return entry[1]
+
+    def put(self, user_id: int, value, pet_ids=(), generation=None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._drop(user_id)
+            self._entries[user_id] = (time.monotonic() + self.ttl_s, value, tuple(pet_ids))
+            for pet_id in pet_ids:
+                self._pet_owner[pet_id] = user_id
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            self._generation += 1
+            self._drop(user_id)
+
+    def invalidate_pets(self, pet_ids):
+        with self._lock:
+            self._generation += 1
+            for user_id in {self._pet_owner.get(pet_id) for pet_id in pet_ids} - {None}:
+                self._drop(user_id)
+
+    def _drop(self, user_id: int):
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            for pet_id in entry[2]:
+                if self._pet_owner.get(pet_id) == user_id:
+                    del self._pet_owner[pet_id]
+
+    def watch(self, user_model, pet_model, child_models):
+        """Invalidate on commit of any ORM write to the given models."""
+        child_models = tuple(child_models)
+
+        @event.listens_for(Session, "after_flush")
+        def _collect(session, flush_context):
+            users, pets = session.info.setdefault("user_cache_users", set()), session.info.setdefault("user_cache_pets", set())
+            for instance in (*session.new, *session.dirty, *session.deleted):
+                if isinstance(instance, user_model):
+                    users.add(instance.id)
+                elif isinstance(instance, pet_model):
+                    users.add(instance.user_id)
+                    pets.add(instance.id)
+                elif isinstance(instance, child_models):
+                    pets.add(instance.pet_id)
+
+        @event.listens_for(Session, "after_commit")
+        def _invalidate(session):
+            users, pets = session.info.pop("user_cache_users", ()), session.info.pop("user_cache_pets", ())
+            for user_id in users:
+                self.invalidate_user(user_id)
+            if pets:
+                self.invalidate_pets(pets)
+
+        @event.listens_for(Session, "after_rollback")
+        def _discard(session):
+            session.info.pop("user_cache_users", None)
+            session.info.pop("user_cache_pets", None)
@@ -0,0 +1,157 @@
+"""
+Vaccination schedule generation from per-species protocol templates.
+
+Each template lists a vaccine's primary series (ages in weeks), the minimum gap
+between doses, how many doses an unvaccinated adult needs and the booster
+intervals. A pet's base plan depends only on its species and age, so it is
+computed once per (species, age bucket) and cached; applying the pet's own
+vaccination history and converting offsets to dates is a short loop per pet.
+
+Templates follow common WSAVA-style guidance and are a starting point for the
+clinic, not a substitute for its judgement.
+"""
+import re
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+
+DAYS_PER_WEEK = 7
+DAYS_PER_MONTH = 30.44
+DEFAULT_HORIZON_MONTHS = 24
+DEFAULT_TIME = "10:00"
+
+Vaccine = namedtuple("Vaccine", "code name kind series_weeks min_interval_days adult_doses first_booster_months booster_months aliases")
+
+PROTOCOLS = {
+    "dog": (
+        Vaccine("dhpp", "DHPP", "core", (6, 9, 12, 16), 21, 1, 12, 36, ("dhpp", "da2pp", "dapp", "distemper", "parvo")),
+        Vaccine("rabies", "Rabies", "core", (12,), 0, 1, 12, 12, ("rabies", "anti rabies", "arv")),
+        Vaccine("leptospirosis", "Leptospirosis", "non-core", (12, 16), 21, 2, 12, 12, ("leptospirosis", "lepto")),
+        Vaccine("bordetella", "Bordetella", "non-core", (8,), 0, 1, 12, 12, ("bordetella", "kennel cough")),
+    ),
+    "cat": (
+        Vaccine("fvrcp", "FVRCP", "core", (6, 9, 12, 16), 21, 2, 12, 36, ("fvrcp", "tricat", "feline distemper", "panleukopenia")),
+        Vaccine("rabies", "Rabies", "core", (12,), 0, 1, 12, 12, ("rabies", "anti rabies", "arv")),
+        Vaccine("felv", "FeLV", "non-core", (8, 12), 21, 2, 12, 12, ("felv", "feline leukemia", "feline leukaemia")),
+    ),
+    "rabbit": (
+        Vaccine("rhdv", "Myxo-RHD", "core", (5,), 0, 1, 12, 12, ("rhd", "rhdv", "rhdv2", "myxo", "myxomatosis")),
+    ),
+}
+
+Dose = namedtuple("Dose", "code name kind label offset_days")
+
+
+def species_key(species: str):
+    """Protocol key for a species name ("Dog", "dogs", "Canine" -> "dog"), or None."""
+    key = (species or "").strip().lower()
+    key = {"canine": "dog", "puppy": "dog", "feline": "cat", "kitten": "cat", "bunny": "rabbit"}.get(key, key)
+    if key.endswith("s") and key[:-1] in PROTOCOLS:
+        key = key[:-1]
+    return key if key in PROTOCOLS else None
+
+
+def _adult_weeks(key: str) -> int:
+    return max(vaccine.series_weeks[-1] for vaccine in PROTOCOLS[key])
+
+
+def age_bucket(key: str, age_weeks: int) -> int:
+    """Plans are identical once a pet is past every primary series, so cap the bucket there."""
+    return max(0, min(age_weeks, _adult_weeks(key)))
+
+
+@lru_cache(maxsize=None)
+def base_plan(key: str, bucket: int):
+    """
+    Primary doses for an unvaccinated pet of `bucket` weeks, as day offsets from
+    today: remaining puppy/kitten series doses, or the adult catch-up course.
+    """
+    plan = {}
+    for vaccine in PROTOCOLS[key]:
+        if bucket < vaccine.series_weeks[-1]:
+            weeks = [w for w in vaccine.series_weeks if w >= bucket] or [vaccine.series_weeks[-1]]
+            offsets, previous = [], None
+            for week in weeks:
+                offset = (week - bucket) * DAYS_PER_WEEK
+                if previous is not None:
+                    offset = max(offset, previous + vaccine.min_interval_days)
+                offsets.append(offset)
+                previous = offset
+        else:
+            gap = max(vaccine.min_interval_days, 21)
+            offsets = [i * gap for i in range(vaccine.adult_doses)]
+        plan[vaccine.code] = tuple(offsets)
+    return plan
+
+
+def _matches(vaccine: Vaccine, record_type: str, record_name: str) -> bool:
+    if (record_type or "").lower() == vaccine.code:
+        return True
+    name = re.sub(r"[^a-z0-9 ]", " ", (record_name or "").lower())
+    return any(alias in name for alias in vaccine.aliases)
+
+
+def pet_age_weeks(age_years: int, age_months: int, recorded_at: datetime, now: datetime) -> int:
+    """Age today, from the age entered when the pet was added plus time since then."""
+    days = (age_years or 0) * 365.25 + (age_months or 0) * DAYS_PER_MONTH
+    if recorded_at is not None:
+        days += max(0, (now - recorded_at).days)
+    return int(days // DAYS_PER_WEEK)
+
+
+def plan_for_pet(species: str, age_weeks: int, history, now: datetime, horizon_months: int = DEFAULT_HORIZON_MONTHS):
+    """
+    Future doses for one pet as Dose tuples (offset_days from `now`'s date).
+    `history` is an iterable of (vaccine_type, vaccine_name, date) for administered
+    and already scheduled vaccinations; doses they cover are not planned again.
+    """
+    key = species_key(species)
+    if key is None:
+        return []
+    today = datetime.combine(now.date(), time.min)
+    horizon = int(horizon_months * DAYS_PER_MONTH)
+    primary = base_plan(key, age_bucket(key, age_weeks))
+    history = list(history)
+
+    doses = []
+    for vaccine in PROTOCOLS[key]:
+        dates = sorted(d for t, n, d in history if d is not None and _matches(vaccine, t, n))
+        series = primary[vaccine.code]
+        done = len(dates)
+        last = (dates[-1] - today).days if dates else None
+
+        planned = []
+        for index, offset in enumerate(series[done:], start=done):
+            if last is not None:
+                offset = max(offset, last + vaccine.min_interval_days, 0)
+            planned.append((f"Dose {index + 1} of {len(series)}", offset))
+            last = offset
+        if last is None:
+            continue
+        # Boosters follow the end of the primary course (given or planned)
+        boosters = done + len(planned) - len(series)
+        interval = vaccine.first_booster_months if boosters <= 0 else vaccine.booster_months
+        # An overdue booster is due today, and later ones count from then
+        offset = max(last + int(interval * DAYS_PER_MONTH), 0)
+        while offset <= horizon:
+            planned.append(("Booster", offset))
+            offset += int(vaccine.booster_months * DAYS_PER_MONTH)
+        for label, offset in planned:
+            if offset <= horizon:
+                doses.append(Dose(vaccine.code, vaccine.name, vaccine.kind, label, offset))
+    doses.sort(key=lambda dose: (dose.offset_days, dose.code))
+    return doses
+
+
+def dose_rows(pet_id: int, doses, now: datetime):
+    """Vaccination insert values for planned doses (scheduled, not yet administered)."""
+    today = datetime.combine(now.date(), time.min)
+    return [{
+        "pet_id": pet_id,
+        "vaccine_name": dose.name,
+        "vaccine_type": dose.code,
+        "is_scheduled": True,
+        "scheduled_date": today + timedelta(days=dose.offset_days),
+        "scheduled_time": DEFAULT_TIME,
+        "notes": f"{dose.label} ({dose.kind}), generated from the {dose.name} protocol",
+    } for dose in doses]
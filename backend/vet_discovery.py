@@ -0,0 +1,343 @@
+"""
+Server-side vet discovery from external providers (Google Places, Overpass/OSM).
+
+Lookups are cached per geohash tile: the first search in a tile fans out to every
+configured provider concurrently over one pooled httpx.AsyncClient, merges and
+dedupes the results into the vets table and records the tile with a TTL. Later
+searches from the same neighbourhood only hit the local vets index.
+"""
+import asyncio
+import json
+import math
+import os
+import re
+import weakref
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+
+if TYPE_CHECKING:
+    import httpx  # imported by VetDiscovery.client on the first provider fetch
+
+GOOGLE_PLACES_URL = os.getenv("GOOGLE_PLACES_URL", "https://maps.googleapis.com/maps/api/place/nearbysearch/json")
+OVERPASS_URL = os.getenv("OVERPASS_URL", "https://overpass-api.de/api/interpreter")
+
+TILE_PRECISION = 5  # ~4.9 km x 4.9 km
+FETCH_RADIUS_KM = 8.0  # covers the whole tile from its centre plus a margin
+TILE_TTL = timedelta(hours=float(os.getenv("VET_DISCOVERY_TTL_HOURS", "24")))
+FAILED_TILE_TTL = timedelta(minutes=5)
+PROVIDER_TIMEOUT_S = 6.0
+DUPLICATE_DISTANCE_KM = 0.15
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash(latitude: float, longitude: float, precision: int = TILE_PRECISION) -> str:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def geohash_center(tile: str):
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in tile:
+        value = _BASE32.index(char)
+        for shift in range(4, -1, -1):
+            rng = lon_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if value >> shift & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return (lat_range[0] + lat_range[1]) / 2, (lon_range[0] + lon_range[1]) / 2
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 6371 * 2 * math.asin(math.sqrt(a))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float):
+    """(min_lat, max_lat, min_lon, max_lon) enclosing a radius, for index range scans."""
+    dlat = radius_km / 111.32
+    dlon = radius_km / (111.32 * max(math.cos(math.radians(latitude)), 0.01))
+    return latitude - dlat, latitude + dlat, longitude - dlon, longitude + dlon
+
+
+def _normalize_name(name: str) -> str:
+    name = re.sub(r"[^a-z0-9 ]", " ", name.lower())
+    return " ".join(word for word in name.split() if word not in {"the", "and", "pvt", "ltd"})
+
+
+def _looks_emergency(name: str) -> bool:
+    lowered = name.lower()
+    return "emergency" in lowered or "24" in lowered or "urgent" in lowered
+
+
+# Providers return normalized vet dicts; errors are collected by VetDiscovery._fan_out
+
+async def fetch_google(client: "httpx.AsyncClient", latitude: float, longitude: float, radius_km: float):
+    api_key = os.getenv("GOOGLE_PLACES_API_KEY")
+    if not api_key:
+        return []
+    response = await client.get(GOOGLE_PLACES_URL, params={
+        "location": f"{latitude},{longitude}",
+        "radius": int(radius_km * 1000),
+        "type": "veterinary_care",
+        "key": api_key,
+    })
+    response.raise_for_status()
+    data = response.json()
+    if data.get("status") not in ("OK", "ZERO_RESULTS"):
+        raise ValueError(f"Google Places API error: {data.get('status')}")
+
+    vets = []
+    for place in data.get("results", []):
+        if place.get("business_status") == "CLOSED_PERMANENTLY":
+            continue
+        location = place.get("geometry", {}).get("location", {})
+        if "lat" not in location or "lng" not in location or not place.get("name"):
+            continue
+        hours = place.get("opening_hours", {})
+        vets.append({
+            "source": "google",
+            "external_id": place["place_id"],
+            "name": place["name"],
+            "address": place.get("formatted_address") or place.get("vicinity"),
+            "phone": (place.get("formatted_phone_number") or "")[:20] or None,
+            "latitude": location["lat"],
+            "longitude": location["lng"],
+            "rating": place.get("rating"),
+            "reviews_count": place.get("user_ratings_total") or 0,
+            "is_open": hours.get("open_now", True),
+            "is_emergency": _looks_emergency(place["name"]),
+            "hours": "; ".join(hours.get("weekday_text") or []) or None,
+        })
+    return vets
+
+
+async def fetch_overpass(client: "httpx.AsyncClient", latitude: float, longitude: float, radius_km: float):
+    radius_m = int(radius_km * 1000)
+    query = (
+        "[out:json][timeout:15];("
+        f'node["amenity"="veterinary"](around:{radius_m},{latitude},{longitude});'
+        f'way["amenity"="veterinary"](around:{radius_m},{latitude},{longitude});'
+        f'relation["amenity"="veterinary"](around:{radius_m},{latitude},{longitude});'
+        ");out center;"
+    )
+    response = await client.post(OVERPASS_URL, data={"data": query})
+    response.raise_for_status()
+
+    vets = []
+    for element in response.json().get("elements", []):
+        tags = element.get("tags", {})
+        lat = element.get("lat", element.get("center", {}).get("lat"))
+        lon = element.get("lon", element.get("center", {}).get("lon"))
+        if not tags.get("name") or lat is None or lon is None:
+            continue
+        address = " ".join(filter(None, (
+            tags.get("addr:housenumber"), tags.get("addr:street"), tags.get("addr:city"), tags.get("addr:postcode"),
+        )))
+        vets.append({
+            "source": "osm",
+            "external_id": f"{element.get('type', 'node')}/{element['id']}",
+            "name": tags["name"],
+            "address": address or None,
+            "phone": (tags.get("phone") or tags.get("contact:phone") or "")[:20] or None,
+            "latitude": lat,
+            "longitude": lon,
+            "is_emergency": tags.get("emergency") == "yes" or _looks_emergency(tags["name"]),
+            "hours": tags.get("opening_hours"),
+            "website": (tags.get("website") or tags.get("contact:website") or "")[:200] or None,
+        })
+    return vets
+
+
+PROVIDERS = {"google": fetch_google, "overpass": fetch_overpass}
+# Comma-separated subset of PROVIDERS; empty disables discovery (offline/dev)
+ENABLED_PROVIDERS = os.getenv("VET_DISCOVERY_PROVIDERS", "google,overpass")
+
+
+class VetDiscovery:
+    """Tile-cached aggregation of external vet listings into the local Vet table."""
+
+    def __init__(self, vet_model, tile_model, providers=None):
+        self.Vet = vet_model
+        self.Tile = tile_model
+        if providers is None:
+            enabled = {name.strip() for name in ENABLED_PROVIDERS.split(",")}
+            providers = {name: fetch for name, fetch in PROVIDERS.items() if name in enabled}
+        self.providers = providers
+        self._client = None
+        self._tile_locks = weakref.WeakValueDictionary()
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        # One pooled client per worker; created lazily inside the running loop
+        if self._client is None or self._client.is_closed:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=PROVIDER_TIMEOUT_S,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                headers={"User-Agent": "FurrstAid/1.0 vet-discovery"},
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _tile_is_fresh(self, db, tile: str) -> bool:
+        cached = db.query(self.Tile).filter(self.Tile.geohash == tile).first()
+        return cached is not None and cached.expires_at > datetime.utcnow()
+
+    async def ensure_tile(self, db, latitude: float, longitude: float, admit=None) -> bool:
+        """
+        Make sure the tile containing the point has been fetched recently.
+        Returns True if providers were called, False on a cache hit. A stale tile
+        is fetched only if `await admit()` (when given) returns True, so callers
+        can budget provider calls without charging for cache hits.
+        """
+        if not self.providers:
+            return False
+        tile = geohash(latitude, longitude)
+        if self._tile_is_fresh(db, tile):
+            return False
+
+        lock = self._tile_locks.get(tile)
+        if lock is None:
+            lock = self._tile_locks[tile] = asyncio.Lock()
+        async with lock:
+            # Another request may have filled the tile while we waited
+            db.expire_all()
+            if self._tile_is_fresh(db, tile):
+                return False
+            if admit is not None and not await admit():
+                return False
+            center_lat, center_lon = geohash_center(tile)
+            results, failures = await self._fan_out(center_lat, center_lon)
+            merged = self.merge(db, results)
+            ttl = FAILED_TILE_TTL if failures and not results else TILE_TTL
+            self._store_tile(db, tile, merged, ttl)
+            return True
+
+    async def _fan_out(self, latitude: float, longitude: float):
+        client = self.client
+        calls = [fetch(client, latitude, longitude, FETCH_RADIUS_KM) for fetch in self.providers.values()]
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        results, failures = [], 0
+        for name, outcome in zip(self.providers, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"Vet discovery provider {name} failed: {outcome}")
+                failures += 1
+            else:
+                results.extend(outcome)
+        return results, failures
+
+    def merge(self, db, results) -> int:
+        """
+        Upsert provider results into the vets table. A result matches an existing
+        vet by (source, external_id), or by a similar name within 150 m, so the
+        same clinic listed by several providers (or seeded locally) is stored once.
+        """
+        Vet = self.Vet
+        touched = 0
+        for item in results:
+            vet = db.query(Vet).filter(Vet.source == item["source"], Vet.external_id == item["external_id"]).first()
+            if vet is None:
+                vet = self._find_duplicate(db, item)
+            if vet is None:
+                vet = self._insert(db, item)
+            if vet is None:
+                continue
+            # Only fill gaps; never overwrite curated or previously merged data
+            for field in ("phone", "rating", "hours", "website"):
+                if item.get(field) is not None and getattr(vet, field) is None:
+                    setattr(vet, field, item[field])
+            if item.get("reviews_count") and not vet.reviews_count:
+                vet.reviews_count = item["reviews_count"]
+            if item.get("is_emergency"):
+                vet.is_emergency = True
+            db.flush()
+            touched += 1
+        db.commit()
+        return touched
+
+    def _insert(self, db, item):
+        """
+        Store a new listing, or return the row that beat it to one of the unique
+        keys: the same listing stored by another worker filling this tile, or a
+        seeded vet with the same name and address.
+        """
+        Vet = self.Vet
+        address = item.get("address") or f"{item['latitude']:.5f}, {item['longitude']:.5f}"
+        vet = Vet(
+            name=item["name"],
+            address=address,
+            latitude=item["latitude"],
+            longitude=item["longitude"],
+            specialties=json.dumps(["Emergency", "24/7"] if item.get("is_emergency") else ["General Care"]),
+            source=item["source"],
+            external_id=item["external_id"],
+        )
+        try:
+            with db.begin_nested():
+                db.add(vet)
+        except IntegrityError:
+            return db.query(Vet).filter(or_(
+                and_(Vet.source == item["source"], Vet.external_id == item["external_id"]),
+                and_(Vet.name == item["name"], Vet.address == address),
+            )).first()
+        return vet
+
+    def _find_duplicate(self, db, item):
+        Vet = self.Vet
+        min_lat, max_lat, min_lon, max_lon = bounding_box(item["latitude"], item["longitude"], DUPLICATE_DISTANCE_KM)
+        candidates = db.query(Vet).filter(
+            Vet.latitude.between(min_lat, max_lat),
+            Vet.longitude.between(min_lon, max_lon),
+        ).all()
+        wanted = _normalize_name(item["name"])
+        if not wanted:
+            return None
+        for vet in candidates:
+            existing = _normalize_name(vet.name)
+            if existing and (existing in wanted or wanted in existing):
+                return vet
+        return None
+
+    def _store_tile(self, db, tile: str, result_count: int, ttl: timedelta):
+        now = datetime.utcnow()
+        cached = db.query(self.Tile).filter(self.Tile.geohash == tile).first()
+        if cached is None:
+            cached = self.Tile(geohash=tile)
+            db.add(cached)
+        cached.fetched_at = now
+        cached.expires_at = now + ttl
+        cached.result_count = result_count
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker recorded the same tile first
+            db.rollback()
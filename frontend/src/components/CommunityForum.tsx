@@ -72,12 +72,19 @@ const CommunityForum = () => {
     setLoadingComments(true);
     
     try {
-      const response = await fetch(`/api/community/posts/${postId}/comments`);
-      
-      if (response.ok) {
-        const data = await response.json();
-        setComments(data);
-      }
+      // Threads are paged; follow the cursor header until the last page
+      let data: Comment[] = [];
+      let cursor: string | null = null;
+      do {
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+        const response = await fetch(`/api/community/posts/${postId}/comments${query}`);
+        if (!response.ok) {
+          return;
+        }
+        data = data.concat(await response.json());
+        cursor = response.headers.get("X-Next-Cursor");
+      } while (cursor);
+      setComments(data);
     } catch (error) {
       console.error("Error fetching comments:", error);
       // Silently log error without showing toast
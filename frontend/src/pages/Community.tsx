@@ -17,6 +17,7 @@ interface Post {
   title: string;
   content: string;
   image_url: string | null;
+  thumbnail_url: string | null;
   created_at: string;
   user_name: string;
   comment_count: number;
@@ -38,6 +39,7 @@ const Community = () => {
   const [posts, setPosts] = useState<Post[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [sort, setSort] = useState<"new" | "hot">("new");
   
   const [isCreatePostOpen, setIsCreatePostOpen] = useState(false);
   const [isViewPostOpen, setIsViewPostOpen] = useState(false);
@@ -53,15 +55,61 @@ const Community = () => {
   const [isSubmitting, setIsSubmitting] = useState(false);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
+  const selectedPostId = useRef<number | null>(null);
+  selectedPostId.current = selectedPost?.id ?? null;
+
   useEffect(() => {
     fetchPosts();
-  }, []);
+  }, [sort]);
+
+  // Live updates: apply the server's deltas instead of re-fetching the feed
+  useEffect(() => {
+    const source = new EventSource("/api/community/stream");
+    let dropped = false;
+    source.onmessage = (message) => {
+      const event = JSON.parse(message.data);
+      switch (event.type) {
+        case "post.created":
+          setPosts(current => current.some(post => post.id === event.post.id) ? current : [
+            { ...event.post, is_liked_by_user: false, is_owner: String(event.post.user_id) === String(userId) },
+            ...current,
+          ]);
+          break;
+        case "comment.created":
+          setPosts(current => current.map(post =>
+            post.id === event.post_id ? { ...post, comment_count: post.comment_count + 1 } : post
+          ));
+          if (selectedPostId.current === event.post_id) {
+            setComments(current => current.some(comment => comment.id === event.comment.id) ? current : [...current, event.comment]);
+          }
+          break;
+        case "like.updated":
+          setPosts(current => current.map(post =>
+            post.id === event.post_id ? { ...post, like_count: event.like_count } : post
+          ));
+          break;
+        case "post.deleted":
+          setPosts(current => current.filter(post => post.id !== event.post_id));
+          break;
+      }
+    };
+    // Evicted for falling behind, or reconnected after a drop: deltas were missed
+    source.addEventListener("evicted", () => { dropped = true; });
+    source.onerror = () => { dropped = true; };
+    source.onopen = () => {
+      if (dropped) {
+        dropped = false;
+        fetchPosts();
+      }
+    };
+    return () => source.close();
+  }, [userId]);
 
   const fetchPosts = async () => {
     setLoading(true);
     setError(null);
     try {
-      const response = await fetch("/api/community/posts", {
+      const response = await fetch(`/api/community/posts?sort=${sort}`, {
         headers: {
           "Authorization": `Bearer ${localStorage.getItem("token")}`
         }
@@ -98,11 +146,18 @@ const Community = () => {
   const fetchComments = async (postId: number) => {
     setLoadingComments(true);
     try {
-      const response = await fetch(`/api/community/posts/${postId}/comments`);
-      if (!response.ok) {
-        throw new Error("Failed to fetch comments");
-      }
-      const data = await response.json();
+      // Threads are paged; follow the cursor header until the last page
+      let data: Comment[] = [];
+      let cursor: string | null = null;
+      do {
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+        const response = await fetch(`/api/community/posts/${postId}/comments${query}`);
+        if (!response.ok) {
+          throw new Error("Failed to fetch comments");
+        }
+        data = data.concat(await response.json());
+        cursor = response.headers.get("X-Next-Cursor");
+      } while (cursor);
       setComments(data);
     } catch (err) {
       toast({
@@ -139,9 +194,24 @@ const Community = () => {
     setIsSubmitting(true);
     
     try {
-      // For now, we'll use a placeholder for image upload
-      // In a real app, you would upload the image to a server or cloud storage
-      const imageUrl = newPostImagePreview || null;
+      // Upload the file first; the post stores the returned content-addressed URL
+      let imageUrl: string | null = null;
+      if (newPostImage) {
+        const form = new FormData();
+        form.append("file", newPostImage);
+        const upload = await fetch("/api/community/images", {
+          method: "POST",
+          headers: {
+            "Authorization": `Bearer ${localStorage.getItem("token")}`
+          },
+          body: form
+        });
+        if (!upload.ok) {
+          const error = await upload.json();
+          throw new Error(error.detail || "Failed to upload image");
+        }
+        imageUrl = (await upload.json()).url;
+      }
       
       const response = await fetch("/api/community/posts", {
         method: "POST",
@@ -166,7 +236,11 @@ const Community = () => {
         setNewPostImage(null);
         setNewPostImagePreview("");
         setIsCreatePostOpen(false);
-        fetchPosts();
+        const created = await response.json();
+        setPosts(current => current.some(post => post.id === created.id) ? current : [
+          { ...created, is_liked_by_user: false, is_owner: true },
+          ...current,
+        ]);
       } else {
         const error = await response.json();
         throw new Error(error.detail || "Failed to create post");
@@ -214,9 +288,9 @@ const Community = () => {
       
       if (response.ok) {
         const data = await response.json();
-        setComments([...comments, data]);
+        // The comment count arrives as a comment.created delta on the live stream
+        setComments(current => current.some(comment => comment.id === data.id) ? current : [...current, data]);
         setNewComment("");
-        fetchPosts(); // Refresh post list to update comment count
       } else {
         const error = await response.json();
         throw new Error(error.detail || "Failed to add comment");
@@ -280,9 +354,11 @@ const Community = () => {
       return;
     }
     
+    const post = posts.find(p => p.id === postId);
     try {
+      // PUT/DELETE state the intended result, so a double-tap cannot undo itself
       const response = await fetch(`/api/community/posts/${postId}/like`, {
-        method: "POST",
+        method: post?.is_liked_by_user ? "DELETE" : "PUT",
         headers: {
           "Authorization": `Bearer ${localStorage.getItem("token")}`
         }
@@ -393,6 +469,14 @@ const Community = () => {
           
           {/* Posts Section */}
           <section>
+            <div className="flex gap-2 mb-4">
+              <Button variant={sort === "new" ? "default" : "outline"} size="sm" onClick={() => setSort("new")}>
+                New
+              </Button>
+              <Button variant={sort === "hot" ? "default" : "outline"} size="sm" onClick={() => setSort("hot")}>
+                Hot
+              </Button>
+            </div>
             {loading ? (
               <div className="flex justify-center p-12">
                 <div className="animate-spin rounded-full h-12 w-12 border-t-2 border-b-2 border-primary"></div>
@@ -447,8 +531,9 @@ const Community = () => {
                       {post.image_url && (
                         <div className="mb-4 -mx-6">
                           <img 
-                            src={post.image_url} 
+                            src={post.thumbnail_url || post.image_url} 
                             alt={post.title} 
+                            loading="lazy"
                             className="w-full object-cover max-h-96"
                           />
                         </div>
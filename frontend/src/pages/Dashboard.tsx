@@ -1,6 +1,5 @@
 import { Link } from "react-router-dom";
 import { Button } from "@/components/ui/button";
-import { userAPI } from "@/services/api";
 import { useEffect, useState } from "react";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
@@ -24,7 +23,7 @@ import {
   XCircle
 } from "lucide-react";
 import Header from "@/components/Header";
-import { petAPI, Pet, alertsAPI, UpcomingAlert, checkupReminderAPI, vaccinationAPI } from "@/services/api";
+import { Pet, UpcomingAlert, checkupReminderAPI, vaccinationAPI, dashboardAPI } from "@/services/api";
 
 const Dashboard = () => {
   const [pets, setPets] = useState<Pet[]>([]);
@@ -34,35 +33,15 @@ const Dashboard = () => {
   const [markingIds, setMarkingIds] = useState<Set<string>>(new Set());
   const [userName, setUserName] = useState<string | null>(null);
 
-  useEffect(() => {
-    const fetchUserName = async () => {
-      try {
-        const response = await userAPI.getUserName();
-        if (response && response.name) {
-          setUserName(response.name);
-          console.log("User name fetched successfully:", response.name);
-        } else {
-          console.error("User name not found in response:", response);
-        }
-      } catch (error) {
-        console.error("Failed to fetch user name:", error);
-      }
-    };
-
-    fetchUserName();
-  }, []);
-
-  // Load pets and alerts from backend
+  // Load user, pets and alerts from the aggregate dashboard endpoint
   useEffect(() => {
     const loadData = async () => {
       try {
         setLoading(true);
-        const [petsData, alertsData] = await Promise.all([
-          petAPI.getPets(),
-          alertsAPI.getUpcomingAlerts(7)
-        ]);
-        setPets(petsData);
-        setUpcomingAlerts(alertsData);
+        const dashboard = await dashboardAPI.getDashboard(7);
+        setUserName(dashboard.user.name);
+        setPets(dashboard.pets);
+        setUpcomingAlerts(dashboard.alerts);
       } catch (err) {
         setError("Failed to load data. Please try again.");
         console.error("Error loading data:", err);
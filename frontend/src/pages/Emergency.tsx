@@ -490,6 +490,10 @@ Situation: ${customEmergency}`;
             body: JSON.stringify({ prompt }),
           });
 
+          if (res.status === 429) {
+            setAiAdvice(`The AI assistant is busy. Please try again in ${res.headers.get("Retry-After") || "a few"} seconds.`);
+            return;
+          }
           if (!res.ok) throw new Error("Gemini request failed");
           const data = await res.json();
 
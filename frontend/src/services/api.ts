@@ -446,6 +446,27 @@ export const alertsAPI = {
   },
 };
 
+// Dashboard: user, pets, alerts, vaccinations and weight logs in one request
+export interface DashboardData {
+  user: { id: number; name: string; email: string; phone?: string };
+  pets: Pet[];
+  alerts: UpcomingAlert[];
+  vaccinations: Vaccination[];
+  weight_logs: WeightLog[];
+}
+
+export const dashboardAPI = {
+  async getDashboard(days: number = 7): Promise<DashboardData> {
+    const response = await fetch(`${API_BASE_URL}/dashboard?days=${days}`, {
+      headers: getAuthHeaders(),
+    });
+    if (!response.ok) {
+      throw new Error('Failed to fetch dashboard');
+    }
+    return response.json();
+  },
+};
+
 // Weight logs
 export interface WeightLog {
   id: number;